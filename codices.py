@@ -1,5 +1,7 @@
 import streamlit as st
-from kuzu_DAL import CategoryDAL, initialize_schema
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from kuzu_DAL import CategoryDAL, ConnectionManager
 from visualization import render_visualization, render_visualization_statistics
 import logging
 
@@ -17,11 +19,21 @@ logger = logging.getLogger(__name__)
 
 
 @st.cache_resource
-def get_dal():
-    """Initialize and cache the data access layer."""
+def get_connection_manager():
+    """Open and cache the shared database. Pending schema migrations run on open."""
+    return ConnectionManager()
+
+
+def get_dal() -> CategoryDAL:
+    """Return this browser session's data access layer, with its own connection and transaction."""
     try:
-        initialize_schema()
-        return CategoryDAL()
+        manager = get_connection_manager()
+        ctx = get_script_run_ctx()
+        session_id = ctx.session_id if ctx is not None else "default"
+        if runtime.exists():
+            # Free connections (and open transactions) of closed browser tabs
+            manager.release_inactive(runtime.get_instance().is_active_session)
+        return manager.get(session_id)
     except Exception as e:
         st.error(f"Failed to initialize database: {e}")
         st.stop()
@@ -55,12 +67,18 @@ def init_session_state():
     
     if 'transaction_history' not in st.session_state:
         st.session_state.transaction_history = []
+    
+    if 'buffer_edits' not in st.session_state:
+        st.session_state.buffer_edits = True
 
 
 def render_sidebar():
     """Render the sidebar with entity selection and actions."""
     st.sidebar.title("🔗 Codices")
     
+    # Type-ahead search across all entities
+    render_quick_search()
+    
     # Entity type selector
     st.sidebar.subheader("Entity Type")
     entity_types = ["Category", "Functor", "Natural Transformation"]
@@ -87,6 +105,52 @@ def render_sidebar():
     # Session management
     st.sidebar.subheader("Session")
     render_session_management()
+    
+    render_snapshot_action()
+
+
+SEARCH_RESULT_TYPES = {
+    "Category": "Category",
+    "Object": "Category",
+    "Morphism": "Category",
+    "Functor": "Functor",
+    "Natural_Transformation": "Natural Transformation",
+}
+
+
+def select_search_result(result):
+    """Navigate to a search result; objects and morphisms open their category."""
+    entity_type = SEARCH_RESULT_TYPES[result['type']]
+    st.session_state.pop(f"{entity_type}_selector", None)
+    st.session_state.entity_type_selector = entity_type
+    st.session_state.selected_entity_type = entity_type
+    st.session_state.selected_entity_id = result['category_id'] if result['category_id'] is not None else result['ID']
+    st.session_state.quick_search = ""
+
+
+def render_quick_search():
+    """Render the sidebar search box with type-ahead results."""
+    query = st.sidebar.text_input("🔎 Search", key="quick_search", placeholder="Name or description")
+    if not query.strip():
+        return
+    
+    dal = get_dal()
+    try:
+        results = dal.search(query, limit=10)
+    except Exception as e:
+        st.sidebar.error(f"Search failed: {e}")
+        return
+    
+    if not results:
+        st.sidebar.caption("No matches")
+    for result in results:
+        label = result['type'].replace('_', ' ')
+        st.sidebar.button(
+            f"{result['name']} · {label}",
+            key=f"search_{result['type']}_{result['ID']}",
+            on_click=select_search_result,
+            args=(result,)
+        )
 
 
 def render_entity_list(entity_type):
@@ -170,11 +234,17 @@ def render_session_management():
         index=1 if st.session_state.in_transaction else 0,
         help="Auto-save: Changes saved immediately. Manual: Use transactions for batch operations."
     )
+    st.session_state.buffer_edits = st.sidebar.checkbox(
+        "Buffer edits until commit",
+        value=st.session_state.buffer_edits,
+        disabled=st.session_state.in_transaction,
+        help="Queue manual-transaction edits in memory and write them in batches on commit"
+    )
     
     # Auto-start transaction if switched to manual mode
     if transaction_mode == "Manual Transaction" and not st.session_state.in_transaction:
         try:
-            dal.begin_transaction()
+            dal.begin_transaction(buffered=st.session_state.buffer_edits)
             st.session_state.in_transaction = True
             st.session_state.transaction_changes = []
             add_transaction_change("Switched to manual transaction mode")
@@ -186,13 +256,14 @@ def render_session_management():
     elif transaction_mode == "Auto-save" and st.session_state.in_transaction:
         try:
             dal.commit_transaction()
+            resolve_buffered_ids(dal)
             st.session_state.in_transaction = False
             st.session_state.transaction_changes = []
             st.session_state.preview_mode = False
             st.sidebar.success("Auto-committed pending changes")
             st.rerun()
         except Exception as e:
-            st.sidebar.error(f"Failed to auto-commit: {e}")
+            st.sidebar.error(f"Failed to auto-commit: {e}. {after_failed_commit(dal)}")
     
     # Transaction status with change count
     if st.session_state.in_transaction:
@@ -221,7 +292,7 @@ def render_session_management():
     with col1:
         if st.button("Begin Transaction", disabled=st.session_state.in_transaction):
             try:
-                dal.begin_transaction()
+                dal.begin_transaction(buffered=st.session_state.buffer_edits)
                 st.session_state.in_transaction = True
                 st.session_state.transaction_changes = []
                 st.sidebar.success("Transaction started")
@@ -239,6 +310,7 @@ def render_session_management():
                     return
                 
                 dal.commit_transaction()
+                resolve_buffered_ids(dal)
                 change_count = len(st.session_state.transaction_changes)
                 
                 # Add to history
@@ -255,7 +327,7 @@ def render_session_management():
                 st.sidebar.success(f"✅ {change_count} changes committed")
                 st.rerun()
             except Exception as e:
-                st.sidebar.error(f"Failed to commit: {e}")
+                st.sidebar.error(f"Failed to commit: {e}. {after_failed_commit(dal)}")
     
     if st.session_state.in_transaction:
         col3, col4 = st.sidebar.columns(2)
@@ -278,6 +350,7 @@ def render_session_management():
                 if st.button("Confirm Commit", type="primary", key="confirm_commit"):
                     try:
                         dal.commit_transaction()
+                        resolve_buffered_ids(dal)
                         change_count = len(st.session_state.transaction_changes)
                         
                         # Add to history
@@ -294,7 +367,36 @@ def render_session_management():
                         st.sidebar.success(f"✅ {change_count} changes committed")
                         st.rerun()
                     except Exception as e:
-                        st.sidebar.error(f"Failed to commit: {e}")
+                        st.sidebar.error(f"Failed to commit: {e}. {after_failed_commit(dal)}")
+
+
+def render_snapshot_action():
+    """Take a snapshot of the live database; the app holds its lock, so the CLI cannot while it runs."""
+    with st.sidebar.expander("💾 Snapshot", expanded=False):
+        path = st.text_input("Snapshot directory", value="./snapshots/latest", key="snapshot_path")
+        if st.button("Take Snapshot", key="take_snapshot"):
+            try:
+                get_connection_manager().snapshot(path)
+                st.success(f"Snapshot saved to {path}")
+            except Exception as e:
+                st.error(f"Failed to take snapshot: {e}")
+
+
+def after_failed_commit(dal: CategoryDAL) -> str:
+    """Match the transaction state to the DAL after a failed commit and say what happened to the changes."""
+    if dal.transaction_active or dal.buffer is not None:
+        return "Your changes are kept; fix the conflict and commit again, or roll back."
+    st.session_state.in_transaction = False
+    st.session_state.transaction_changes = []
+    st.session_state.preview_mode = False
+    return "The transaction was rolled back."
+
+
+def resolve_buffered_ids(dal: CategoryDAL):
+    """Replace temporary IDs of entities created in a buffered transaction with their committed IDs."""
+    for key in ('selected_entity_id', 'editing_entity'):
+        if st.session_state.get(key) is not None:
+            st.session_state[key] = dal.resolve_id(st.session_state[key])
 
 
 def add_transaction_change(description: str):
@@ -315,8 +417,9 @@ def suggest_transaction_usage():
     if st.session_state.selected_entity_type == "Category" and st.session_state.selected_entity_id is not None:
         dal = get_dal()
         try:
-            objects = dal.get_objects_in_category(st.session_state.selected_entity_id)
-            morphisms = dal.get_morphisms_in_category(st.session_state.selected_entity_id)
+            # Only enough rows to cross the thresholds are fetched
+            objects = dal.page_objects_in_category(st.session_state.selected_entity_id, limit=6)
+            morphisms = dal.page_morphisms_in_category(st.session_state.selected_entity_id, limit=11)
             
             if len(objects) > 5 or len(morphisms) > 10:
                 if not st.session_state.in_transaction:
@@ -953,8 +1056,9 @@ def render_entity_delete_confirmation():
                         st.success("Object deleted successfully")
                         add_transaction_change(f"Deleted object '{entity['name']}'")
                     elif form_mode == "delete_morphism":
-                        st.info("Morphism deletion functionality coming soon")
-                        add_transaction_change(f"Attempted to delete morphism '{entity['name']}'")
+                        dal.delete_morphisms([entity_id])
+                        st.success("Morphism deleted successfully")
+                        add_transaction_change(f"Deleted morphism '{entity['name']}'")
                     
                     st.session_state.form_mode = None
                     st.rerun()
@@ -993,6 +1097,36 @@ def render_components_tab():
         st.error(f"Error loading {entity_type.lower()} components: {e}")
 
 
+COMPONENT_PAGE_SIZE = 50
+
+
+def fetch_component_page(key, fetch):
+    """
+    Fetch the current keyset page of a component list and render Previous/Next controls.
+    `fetch(after_name, limit, after_id)` returns rows ordered by (name, ID); the cursor of each
+    page shown so far is kept in session state under `key`.
+    """
+    cursors = st.session_state.setdefault(key, [(None, None)])
+    after_name, after_id = cursors[-1]
+    rows = fetch(after_name, COMPONENT_PAGE_SIZE + 1, after_id)
+    has_next = len(rows) > COMPONENT_PAGE_SIZE
+    rows = rows[:COMPONENT_PAGE_SIZE]
+    
+    if has_next or len(cursors) > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("◀ Previous", key=f"{key}_prev", disabled=len(cursors) == 1):
+                cursors.pop()
+                st.rerun()
+        with col2:
+            st.caption(f"Page {len(cursors)}")
+        with col3:
+            if st.button("Next ▶", key=f"{key}_next", disabled=not has_next):
+                cursors.append((rows[-1]['name'], rows[-1]['ID']))
+                st.rerun()
+    return rows
+
+
 def render_category_components(dal, category_id):
     """Render category components (objects and morphisms)."""
     try:
@@ -1010,7 +1144,10 @@ def render_category_components(dal, category_id):
         
         # Objects section
         st.subheader("Objects")
-        objects = dal.get_objects_in_category(category_id)
+        objects = fetch_component_page(
+            f"objects_page_{category_id}",
+            lambda after_name, limit, after_id: dal.page_objects_in_category(category_id, after_name, limit, after_id)
+        )
         
         if objects:
             for obj in objects:
@@ -1041,7 +1178,10 @@ def render_category_components(dal, category_id):
         
         # Morphisms section
         st.subheader("Morphisms")
-        morphisms = dal.get_morphisms_in_category(category_id)
+        morphisms = fetch_component_page(
+            f"morphisms_page_{category_id}",
+            lambda after_name, limit, after_id: dal.page_morphisms_in_category(category_id, after_name, limit, after_id)
+        )
         
         if morphisms:
             for morph in morphisms:
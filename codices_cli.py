@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Command-line tools for Codices databases.
+
+    python codices_cli.py export OUT_DIR [--db ./kuzu_db] [--format parquet|csv]
+    python codices_cli.py import IN_DIR [--db ./kuzu_db]
+    python codices_cli.py snapshot SNAPSHOT_DIR [--db ./kuzu_db]
+    python codices_cli.py restore SNAPSHOT_DIR [--db ./kuzu_db]
+"""
+
+import argparse
+import logging
+import sys
+
+from kuzu_DAL import EXPORT_FORMATS, CategoryDAL, restore_snapshot
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def export_command(args: argparse.Namespace) -> None:
+    """Export every table of the database to a directory."""
+    dal = CategoryDAL(args.db)
+    manifest = dal.export_data(args.directory, args.format)
+    for table, info in {**manifest["nodes"], **manifest["rels"]}.items():
+        print(f"{table}: {info['rows']} rows -> {info['file']}")
+
+
+def import_command(args: argparse.Namespace) -> None:
+    """Import an export directory into an empty database."""
+    dal = CategoryDAL(args.db)
+    for table, rows in dal.import_data(args.directory).items():
+        print(f"{table}: {rows} rows")
+
+
+def snapshot_command(args: argparse.Namespace) -> None:
+    """Copy the (closed) database files to a snapshot directory."""
+    CategoryDAL(args.db).snapshot(args.directory)
+    print(f"Snapshot written to {args.directory}")
+
+
+def restore_command(args: argparse.Namespace) -> None:
+    """Replace the (closed) database with a snapshot."""
+    restore_snapshot(args.directory, args.db)
+    print(f"Restored {args.db} from {args.directory}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(prog="codices", description="Codices database tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subcommands.add_parser("export", help="Write all tables to Parquet or CSV files")
+    export_parser.add_argument("directory", help="Output directory")
+    export_parser.add_argument("--db", default="./kuzu_db", help="Database path (default: ./kuzu_db)")
+    export_parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="parquet",
+                               help="File format (default: parquet)")
+    export_parser.set_defaults(handler=export_command)
+
+    import_parser = subcommands.add_parser("import", help="Load an export into an empty database")
+    import_parser.add_argument("directory", help="Directory written by 'export'")
+    import_parser.add_argument("--db", default="./kuzu_db", help="Database path (default: ./kuzu_db)")
+    import_parser.set_defaults(handler=import_command)
+
+    snapshot_parser = subcommands.add_parser(
+        "snapshot", help="Copy the database files to a new directory (stop the app first, or use its Snapshot action)"
+    )
+    snapshot_parser.add_argument("directory", help="Snapshot directory (must not exist)")
+    snapshot_parser.add_argument("--db", default="./kuzu_db", help="Database path (default: ./kuzu_db)")
+    snapshot_parser.set_defaults(handler=snapshot_command)
+
+    restore_parser = subcommands.add_parser("restore", help="Replace the database with a snapshot (stop the app first)")
+    restore_parser.add_argument("directory", help="Directory written by 'snapshot'")
+    restore_parser.add_argument("--db", default="./kuzu_db", help="Database path (default: ./kuzu_db)")
+    restore_parser.set_defaults(handler=restore_command)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """Run the CLI; returns the process exit code."""
+    args = build_parser().parse_args(argv)
+    try:
+        args.handler(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
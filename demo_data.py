@@ -4,7 +4,7 @@ Demo data creation script for Codices application.
 Creates sample category theory data for testing and demonstration.
 """
 
-from kuzu_DAL import CategoryDAL, initialize_schema
+from kuzu_DAL import CategoryDAL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -16,7 +16,6 @@ def create_demo_data():
     
     # Initialize database
     print("Initializing database...")
-    initialize_schema()
     dal = CategoryDAL()
     
     # Create categories
@@ -1,6 +1,24 @@
+import asyncio
+import functools
+import json
 import kuzu
 import logging
-from typing import Dict, List, Optional, Any, Union
+import os
+import re
+import shutil
+import threading
+import time
+import numpy as np
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -14,177 +32,2110 @@ def _get_query_result(result: Any) -> Any:
     return result
 
 
+def _collect_ids(query_result: Any) -> List[int]:
+    """Helper function to read a single-column ID result into a list."""
+    ids: List[int] = []
+    while query_result.has_next():
+        ids.append(int(query_result.get_next()[0]))
+    return ids
+
+
+def _iter_pages(fetch: Callable[[Optional[str], int, Optional[int]], List[Dict[str, Any]]],
+                batch_size: int) -> Iterator[Dict[str, Any]]:
+    """Stream rows from a keyset-paginated listing, one page of `batch_size` rows per query."""
+    after_name, after_id = None, None
+    while True:
+        rows = fetch(after_name, batch_size, after_id)
+        yield from rows
+        if len(rows) < batch_size:
+            return
+        after_name, after_id = rows[-1]["name"], rows[-1]["ID"]
+
+
+# Keyset condition on (name, ID). Kuzu 0.7 cannot bind LIMIT to a parameter, so page queries
+# inline the integer limit.
+_AFTER_CURSOR = "({v}.name > $after_name OR ({v}.name = $after_name AND {v}.ID > $after_id))"
+
+
+def _cursor_parameters(after_name: Optional[str], after_id: Optional[int]) -> Dict[str, Any]:
+    """
+    Parameters for _AFTER_CURSOR. No cursor becomes ("", -1), which precedes every row;
+    a name without an ID skips every row with that name.
+    """
+    if after_name is None:
+        return {"after_name": "", "after_id": -1}
+    return {"after_name": after_name, "after_id": after_id if after_id is not None else 2**63 - 1}
+
+
+# Category membership relationship for each member table
+_MEMBER_RELS = {"Object": "category_objects", "Morphism": "category_morphisms"}
+
+# Mapping and component nodes, and their edges to the objects and morphisms they reference
+_OBJECT_REFS = "object_mapping_source|object_mapping_target|component_object"
+_OBJECT_REF_NODES = "Object_Mapping:Component"
+_MORPHISM_REFS = ("morphism_mapping_source|morphism_mapping_target|component_morphism"
+                  "|composition_first|composition_second|composition_result")
+_MORPHISM_REF_NODES = "Morphism_Mapping:Component:Composition"
+
+# Kuzu admits one write transaction per database; other connections' writes fail with this
+_WRITE_CONFLICT = "Only one write transaction at a time"
+
+# DAL methods that fan_out may run on pooled read connections
+_READ_METHOD_PREFIXES = ("get_", "list_", "page_", "validate_", "compose")
+
+
+def _check_unique_names(rows: List[Dict[str, Any]], entity: str) -> List[str]:
+    """Return the names of a batch, raising ValueError if the batch repeats one."""
+    names = [str(r["name"]) for r in rows]
+    seen = set()
+    for name in names:
+        if name in seen:
+            raise ValueError(f"{entity} '{name}' appears more than once in batch")
+        seen.add(name)
+    return names
+
+
+def _create_base_schema(conn: kuzu.Connection) -> None:
+    """Create the category-theory tables, migrating legacy mapping edges if present."""
+    # Create node tables
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Category(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Object(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Morphism(ID SERIAL PRIMARY KEY, name STRING, description STRING, is_identity BOOLEAN)")
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Functor(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Natural_Transformation(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Datatype(ID SERIAL PRIMARY KEY, literal STRING, description STRING)")
+    
+    # Create relationship tables
+    conn.execute("CREATE REL TABLE IF NOT EXISTS morphism_source(FROM Morphism TO Object)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS morphism_target(FROM Morphism TO Object)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS functor_source(FROM Functor TO Category)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS functor_target(FROM Functor TO Category)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS category_objects(FROM Category TO Object)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS category_morphisms(FROM Category TO Morphism)")
+    
+    # Legacy mapping edges are renamed out of the way before their replacements are created
+    legacy = _rename_legacy_mapping_tables(conn)
+    
+    # Functor mappings: (F)-[:functor_object_mappings]->(Object_Mapping) with source/target edges
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Object_Mapping(ID SERIAL PRIMARY KEY)")
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Morphism_Mapping(ID SERIAL PRIMARY KEY)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS functor_object_mappings(FROM Functor TO Object_Mapping)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS object_mapping_source(FROM Object_Mapping TO Object)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS object_mapping_target(FROM Object_Mapping TO Object)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS functor_morphism_mappings(FROM Functor TO Morphism_Mapping)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS morphism_mapping_source(FROM Morphism_Mapping TO Morphism)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS morphism_mapping_target(FROM Morphism_Mapping TO Morphism)")
+    
+    # Natural transformation relationships: (α)-[:nat_trans_components]->(Component) at X, using α_X
+    conn.execute("CREATE REL TABLE IF NOT EXISTS nat_trans_source(FROM Natural_Transformation TO Functor)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS nat_trans_target(FROM Natural_Transformation TO Functor)")
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Component(ID SERIAL PRIMARY KEY)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS nat_trans_components(FROM Natural_Transformation TO Component)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS component_object(FROM Component TO Object)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS component_morphism(FROM Component TO Morphism)")
+    
+    if legacy:
+        _migrate_legacy_mappings(conn, legacy)
+    
+    # Composition table: (f)-[composite_id = ID of g ∘ f]->(g); replaced by Composition nodes in version 2
+    conn.execute("CREATE REL TABLE IF NOT EXISTS morphism_composition(FROM Morphism TO Morphism, composite_id INT)")
+
+
+def _anchor_compositions(conn: kuzu.Connection) -> None:
+    """
+    Replace the morphism_composition edges, which stored the composite as an integer property,
+    with Composition nodes that have edges to f, g and g ∘ f. Entries whose composite no longer
+    exists are dropped.
+    """
+    conn.execute("CREATE NODE TABLE IF NOT EXISTS Composition(ID SERIAL PRIMARY KEY)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS composition_first(FROM Composition TO Morphism)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS composition_second(FROM Composition TO Morphism)")
+    conn.execute("CREATE REL TABLE IF NOT EXISTS composition_result(FROM Composition TO Morphism)")
+    migrated = _collect_ids(_get_query_result(conn.execute("""
+        MATCH (f:Morphism)-[r:morphism_composition]->(g:Morphism), (h:Morphism)
+        WHERE h.ID = r.composite_id
+        CREATE (cp:Composition)
+        CREATE (cp)-[:composition_first]->(f), (cp)-[:composition_second]->(g), (cp)-[:composition_result]->(h)
+        RETURN count(*)""")))
+    conn.execute("DROP TABLE morphism_composition")
+    logger.info(f"Migrated {migrated[0] if migrated else 0} composition edges to composition nodes")
+
+
+# Ordered schema migrations as (version, description, function). Each migration runs once per
+# database; append new ones with the next version number rather than editing applied ones.
+# Version 1 is idempotent so that databases created before versioning can adopt it.
+SCHEMA_MIGRATIONS: List[Tuple[int, str, Callable[[kuzu.Connection], None]]] = [
+    (1, "Base category-theory schema", _create_base_schema),
+    (2, "Composition entries as nodes", _anchor_compositions),
+]
+
+
+def get_schema_version(conn: kuzu.Connection) -> int:
+    """
+    Read the schema version of a database with a single query.
+    
+    Args:
+        conn: Connection to the database
+        
+    Returns:
+        Applied schema version, or 0 for a new or unversioned database
+    """
+    try:
+        result = conn.execute("MATCH (v:SchemaVersion) RETURN max(v.version)")
+    except RuntimeError:
+        # SchemaVersion does not exist yet
+        return 0
+    version = result.get_next()[0]
+    return int(version) if version is not None else 0
+
+
+def migrate_schema(conn: kuzu.Connection) -> int:
+    """
+    Apply pending schema migrations, recording the version after each one.
+    
+    Args:
+        conn: Connection to the database
+        
+    Returns:
+        Schema version after migrating
+    """
+    try:
+        version = get_schema_version(conn)
+        pending = [m for m in SCHEMA_MIGRATIONS if m[0] > version]
+        if not pending:
+            return version
+        
+        conn.execute("CREATE NODE TABLE IF NOT EXISTS SchemaVersion(ID INT64 PRIMARY KEY, version INT64)")
+        for target, description, migration in pending:
+            migration(conn)
+            conn.execute("MERGE (v:SchemaVersion {ID: 0}) SET v.version = $version", {"version": target})
+            version = target
+            logger.info(f"Applied schema migration {target}: {description}")
+        return version
+    except Exception as e:
+        logger.error(f"Failed to migrate schema: {e}")
+        raise
+
+
+def _migrate_database(db: kuzu.Database) -> int:
+    """Run `migrate_schema` on a connection of its own, closed afterwards, and return the schema version."""
+    conn = kuzu.Connection(db)
+    try:
+        return migrate_schema(conn)
+    finally:
+        conn.close()
+
+
 def initialize_schema(db_path: str = "./kuzu_db") -> None:
     """
     Initialize the complete database schema for category theory entities.
+    CategoryDAL migrates its database on open, so this is only needed to prepare a
+    database without opening a DAL.
+    
+    Args:
+        db_path: Path to the Kuzu database directory
+    """
+    try:
+        db = kuzu.Database(db_path)
+        _migrate_database(db)
+        db.close()
+        logger.info("Database schema initialized successfully")
+        
+    except Exception as e:
+        logger.error(f"Failed to initialize schema: {e}")
+        raise
+
+
+# Mapping edges that stored their functor or object as an integer property
+_LEGACY_MAPPING_TABLES = {
+    "functor_object_map": "via_functor_id",
+    "functor_morphism_map": "via_functor_id",
+    "nat_trans_components": "at_object_id",
+}
+
+
+def _rename_legacy_mapping_tables(conn: kuzu.Connection) -> List[str]:
+    """Rename integer-keyed mapping tables to legacy_<name> and return the renamed names."""
+    result = conn.execute("CALL show_tables() RETURN name")
+    tables = set()
+    while result.has_next():
+        tables.add(result.get_next()[0])
+    renamed = []
+    for table, key in _LEGACY_MAPPING_TABLES.items():
+        if table not in tables:
+            continue
+        info = conn.execute(f"CALL table_info('{table}') RETURN name")
+        columns = set()
+        while info.has_next():
+            columns.add(info.get_next()[0])
+        if key in columns:
+            conn.execute(f"ALTER TABLE {table} RENAME TO legacy_{table}")
+            renamed.append(table)
+    return renamed
+
+
+def _migrate_legacy_mappings(conn: kuzu.Connection, tables: List[str]) -> None:
+    """
+    Copy legacy mapping edges into mapping nodes anchored on their functor or natural
+    transformation, then drop the legacy tables. Edges whose integer reference no longer
+    resolves to a node are dropped.
+    
+    Args:
+        conn: Connection to the database being migrated
+        tables: Legacy table names returned by _rename_legacy_mapping_tables
+    """
+    statements = {
+        "functor_object_map": """
+            MATCH (s:Object)-[r:legacy_functor_object_map]->(t:Object), (f:Functor)
+            WHERE f.ID = r.via_functor_id
+            CREATE (f)-[:functor_object_mappings]->(mp:Object_Mapping)
+            CREATE (mp)-[:object_mapping_source]->(s), (mp)-[:object_mapping_target]->(t)
+            RETURN count(*)""",
+        "functor_morphism_map": """
+            MATCH (sm:Morphism)-[r:legacy_functor_morphism_map]->(tm:Morphism), (f:Functor)
+            WHERE f.ID = r.via_functor_id
+            CREATE (f)-[:functor_morphism_mappings]->(mp:Morphism_Mapping)
+            CREATE (mp)-[:morphism_mapping_source]->(sm), (mp)-[:morphism_mapping_target]->(tm)
+            RETURN count(*)""",
+        "nat_trans_components": """
+            MATCH (nt:Natural_Transformation)-[r:legacy_nat_trans_components]->(m:Morphism), (x:Object)
+            WHERE x.ID = r.at_object_id
+            CREATE (nt)-[:nat_trans_components]->(cp:Component)
+            CREATE (cp)-[:component_object]->(x), (cp)-[:component_morphism]->(m)
+            RETURN count(*)""",
+    }
+    for table in tables:
+        migrated = _collect_ids(_get_query_result(conn.execute(statements[table])))
+        conn.execute(f"DROP TABLE legacy_{table}")
+        logger.info(f"Migrated {migrated[0] if migrated else 0} {table} edges to mapping nodes")
+
+
+# Export/import file formats and the COPY options each needs. Quoted newlines in CSV
+# descriptions require Kuzu's serial CSV reader.
+EXPORT_FORMATS = {
+    "parquet": {"to": "", "from": ""},
+    "csv": {"to": " (HEADER=true)", "from": " (HEADER=true, PARALLEL=false)"},
+}
+EXPORT_MANIFEST = "manifest.json"
+
+
+def _copy_path(path: Path) -> str:
+    """A file path as a Cypher string literal for COPY."""
+    text = path.resolve().as_posix()
+    if "'" in text:
+        raise ValueError(f"Paths containing quotes are not supported: {text}")
+    return f"'{text}'"
+
+
+def _load_source(path: Path, columns: List[Tuple[str, str]], file_format: str) -> str:
+    """
+    The LOAD FROM clause for an exported file. CSV columns are declared with their catalog types,
+    since type sniffing reads some values (e.g. "False") as strings.
+    """
+    if file_format == "parquet":
+        return f"LOAD FROM {_copy_path(path)}"
+    headers = ", ".join(f"`{c}` {'INT64' if t == 'SERIAL' else t}" for c, t in columns)
+    return f"LOAD WITH HEADERS ({headers}) FROM {_copy_path(path)}{EXPORT_FORMATS['csv']['from']}"
+
+
+def _read_table_catalog(conn: Any) -> Tuple[Dict[str, List[Tuple[str, str]]], Dict[str, List[Tuple[str, str]]], Dict[str, Tuple[str, str]]]:
+    """
+    Read the data tables of a database from Kuzu's catalog.
+    
+    Returns:
+        (node table -> [(column, type)], rel table -> [(property, type)], rel table -> (from table, to table))
+    """
+    tables = _get_query_result(conn.execute("CALL show_tables() RETURN name, type")).get_as_arrow().to_pylist()
+    nodes: Dict[str, List[Tuple[str, str]]] = {}
+    rels: Dict[str, List[Tuple[str, str]]] = {}
+    ends: Dict[str, Tuple[str, str]] = {}
+    for table in sorted(tables, key=lambda t: t["name"]):
+        name = table["name"]
+        if name == "SchemaVersion":
+            continue
+        columns = [(c["name"], c["type"]) for c in _get_query_result(
+            conn.execute(f"CALL table_info('{name}') RETURN name, type")
+        ).get_as_arrow().to_pylist()]
+        if table["type"] == "NODE":
+            nodes[name] = columns
+        else:
+            rels[name] = columns
+            (pair,) = _get_query_result(conn.execute(
+                f"CALL show_connection('{name}') RETURN `source table name`, `destination table name`"
+            )).get_as_arrow().to_pylist()
+            ends[name] = (pair["source table name"], pair["destination table name"])
+    return nodes, rels, ends
+
+
+# Files of a Kuzu database directory that are not copied into snapshots
+_SNAPSHOT_SKIP = {".lock"}
+_FICLONE = 0x40049409  # Linux ioctl cloning a file's extents (btrfs, XFS, ...)
+
+
+def _clone_file(source: Path, target: Path) -> bool:
+    """
+    Copy a file, sharing its blocks copy-on-write when the filesystem supports it.
+    
+    Returns:
+        True if the file was cloned, False if its bytes were copied
+    """
+    try:
+        import fcntl
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, target)
+        return True
+    except (ImportError, OSError):
+        shutil.copy2(source, target)
+        return False
+
+
+def _clone_database_files(source: Path, target: Path) -> None:
+    """Clone the files of a database directory into a new directory `target`, atomically."""
+    if target.exists():
+        raise ValueError(f"{target} already exists")
+    partial = target.with_name(f".{target.name}.partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir(parents=True)
+    cloned = 0
+    try:
+        for path in source.iterdir():
+            if path.is_file() and path.name not in _SNAPSHOT_SKIP:
+                cloned += _clone_file(path, partial / path.name)
+        partial.rename(target)
+    except Exception:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
+    logger.info(f"Copied {source} to {target} ({cloned} files cloned copy-on-write)")
+
+
+def restore_snapshot(snapshot_path: str, db_path: str = "./kuzu_db") -> None:
+    """
+    Replace the database at `db_path` with a snapshot taken by `CategoryDAL.snapshot`.
+    The database must not be open; the old files are removed only once the copy is complete.
+    
+    Args:
+        snapshot_path: Snapshot directory
+        db_path: Path to the Kuzu database directory
+    """
+    snapshot, live = Path(snapshot_path), Path(db_path)
+    if not (snapshot / "catalog.kz").is_file():
+        raise ValueError(f"{snapshot} is not a database snapshot")
+    staged = live.with_name(f".{live.name}.restoring")
+    shutil.rmtree(staged, ignore_errors=True)
+    _clone_database_files(snapshot, staged)
+    old = live.with_name(f".{live.name}.old")
+    shutil.rmtree(old, ignore_errors=True)
+    if live.exists():
+        live.rename(old)
+    staged.rename(live)
+    shutil.rmtree(old, ignore_errors=True)
+    logger.info(f"Restored {live} from snapshot {snapshot}")
+
+
+class StatementRegistry:
+    """
+    Cache of prepared statements for a single connection, keyed by query text, with LRU eviction.
+    Tracks hits and misses so callers can confirm that parsing and planning
+    happen once per query rather than on every call. The capacity bounds the
+    cache when query texts vary, e.g. paged listings with an inlined LIMIT.
+    """
+    
+    def __init__(self, conn: kuzu.Connection, capacity: int = 256):
+        """
+        Initialize an empty registry.
+        
+        Args:
+            conn: Connection the statements are prepared on
+            capacity: Maximum number of statements kept
+        """
+        self.conn = conn
+        self.capacity = capacity
+        self._statements: "OrderedDict[str, kuzu.PreparedStatement]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def prepare(self, query: str) -> kuzu.PreparedStatement:
+        """Return the prepared form of a query, preparing it on first use and evicting the least recently used when full."""
+        statement = self._statements.get(query)
+        if statement is not None:
+            self._statements.move_to_end(query)
+            self.hits += 1
+            return statement
+        statement = self.conn.prepare(query)
+        if not statement.is_success():
+            raise RuntimeError(statement.get_error_message())
+        self._statements[query] = statement
+        while len(self._statements) > self.capacity:
+            self._statements.popitem(last=False)
+        self.misses += 1
+        return statement
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of cached statements."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._statements)}
+    
+    def clear(self) -> None:
+        """Drop all cached statements and reset the counters."""
+        self._statements.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class HomSetIndex:
+    """
+    Adjacency index over the morphisms of one category.
+    Answers hom-set, out- and in-morphism lookups by endpoint object IDs.
+    """
+    
+    def __init__(self, morphisms: List[Dict[str, Any]]):
+        """
+        Build the index from morphism dictionaries.
+        
+        Args:
+            morphisms: Rows as returned by CategoryDAL.get_morphisms_in_category
+        """
+        self.by_pair: Dict[Tuple[int, int], List[Dict[str, Any]]] = defaultdict(list)
+        self.outgoing: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        self.incoming: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for morph in morphisms:
+            src, tgt = morph["source_object_id"], morph["target_object_id"]
+            if src is not None:
+                self.outgoing[src].append(morph)
+            if tgt is not None:
+                self.incoming[tgt].append(morph)
+            if src is not None and tgt is not None:
+                self.by_pair[(src, tgt)].append(morph)
+    
+    def hom(self, source_id: int, target_id: int) -> List[Dict[str, Any]]:
+        """Return the morphisms source_id → target_id."""
+        return list(self.by_pair.get((source_id, target_id), []))
+    
+    def out_of(self, object_id: int) -> List[Dict[str, Any]]:
+        """Return the morphisms whose source is object_id."""
+        return list(self.outgoing.get(object_id, []))
+    
+    def into(self, object_id: int) -> List[Dict[str, Any]]:
+        """Return the morphisms whose target is object_id."""
+        return list(self.incoming.get(object_id, []))
+
+
+class CompositionCache:
+    """
+    Memoized composition table with LRU eviction.
+    Entries map (f, g) to the ID of g ∘ f, or None when the pair does not compose,
+    and are tagged with their category so one category can be invalidated at a time.
+    """
+    
+    def __init__(self, capacity: int = 100_000):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            capacity: Maximum number of (f, g) entries kept across all categories
+        """
+        self.capacity = capacity
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[int, Optional[int]]]" = OrderedDict()
+        self._by_category: Dict[int, set] = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Tuple[int, int]) -> Tuple[bool, Optional[int]]:
+        """Return (found, composite_id) for a pair, refreshing its recency on a hit."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+    
+    def put(self, key: Tuple[int, int], category_id: int, composite_id: Optional[int]) -> None:
+        """Store the composite of a pair, evicting the least recently used entry when full."""
+        self._entries[key] = (category_id, composite_id)
+        self._entries.move_to_end(key)
+        self._by_category[category_id].add(key)
+        while len(self._entries) > self.capacity:
+            old_key, (old_cat, _) = self._entries.popitem(last=False)
+            self._by_category[old_cat].discard(old_key)
+    
+    def invalidate(self, category_id: Optional[int] = None) -> None:
+        """Drop the entries of one category, or all entries."""
+        if category_id is None:
+            self._entries.clear()
+            self._by_category.clear()
+            return
+        for key in self._by_category.pop(category_id, set()):
+            self._entries.pop(key, None)
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of cached pairs."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class CompositionMatrix:
+    """
+    Integer-indexed composition table of one category for vectorized law checks.
+    Morphisms and objects are renumbered 0..n-1; recorded composites are kept as a
+    sorted array of keys f * n + g with the index of g ∘ f alongside, which is the
+    row-major layout of the n x n composition matrix without storing its empty cells.
+    """
+
+    def __init__(self, morphisms: "pa.Table", objects: "pa.Table", compositions: "pa.Table"):
+        """
+        Build the matrix from the columnar results of the DAL.
+
+        Args:
+            morphisms: Table with ID, name, is_identity, source_object_id, target_object_id
+            objects: Table with ID, name
+            compositions: Table with f_id, g_id, composite_id
+        """
+        self.morphism_ids = _int_column(morphisms, "ID")
+        self.morphism_names: List[str] = morphisms.column("name").to_pylist()
+        self.object_names: List[str] = objects.column("name").to_pylist()
+        self.n = len(self.morphism_ids)
+        self.is_identity = np.array([bool(v) for v in morphisms.column("is_identity").to_pylist()], dtype=bool)
+        object_ids = _int_column(objects, "ID")
+        self.source = _dense_index(object_ids, _int_column(morphisms, "source_object_id"))
+        self.target = _dense_index(object_ids, _int_column(morphisms, "target_object_id"))
+
+        f = _dense_index(self.morphism_ids, _int_column(compositions, "f_id"))
+        g = _dense_index(self.morphism_ids, _int_column(compositions, "g_id"))
+        h = _dense_index(self.morphism_ids, _int_column(compositions, "composite_id"))
+        # Entries whose composite lies outside the category are reported, not composed
+        self.foreign = (f[h < 0], g[h < 0])
+        keep = h >= 0
+        keys = f[keep] * self.n + g[keep]
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.values = h[keep][order]
+
+        # Morphisms grouped by source object, for enumerating composable pairs
+        self.n_objects = len(object_ids)
+        has_source = self.source >= 0
+        self.by_source = np.flatnonzero(has_source)[np.argsort(self.source[has_source], kind="stable")]
+        self.out_degree = np.bincount(self.source[has_source], minlength=self.n_objects)
+        self.out_start = np.cumsum(self.out_degree) - self.out_degree
+
+    def compose(self, f: "np.ndarray", g: "np.ndarray") -> "np.ndarray":
+        """Return the index of g ∘ f for each pair, or -1 where no composite is known."""
+        result = np.full(len(f), -1, dtype=np.int64)
+        if len(self.keys):
+            keys = f * self.n + g
+            pos = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+            stored = self.keys[pos] == keys
+            result[stored] = self.values[pos[stored]]
+        else:
+            stored = np.zeros(len(f), dtype=bool)
+        # Identities compose without a stored entry, as in CategoryDAL.compose
+        left = ~stored & self.is_identity[f]
+        result[left] = g[left]
+        right = ~stored & ~left & self.is_identity[g]
+        result[right] = f[right]
+        return result
+
+    def composable_after(self, f: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return (i, g) such that f[i] and g are composable, for every g out of f[i]'s target."""
+        if len(f) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        targets = self.target[f]
+        counts = np.where(targets >= 0, self.out_degree[np.maximum(targets, 0)], 0)
+        i = np.repeat(np.arange(len(f)), counts)
+        offsets = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+        g = self.by_source[self.out_start[targets[i]] + offsets]
+        return i, g
+
+    def name(self, index: int) -> str:
+        """Return the name of the morphism at a dense index."""
+        return str(self.morphism_names[index])
+
+
+def _int_column(table: "pa.Table", column: str) -> "np.ndarray":
+    """Read an integer column into a NumPy array, with -1 for nulls."""
+    return np.array([-1 if v is None else v for v in table.column(column).to_pylist()], dtype=np.int64)
+
+
+def _dense_index(ids: "np.ndarray", values: "np.ndarray") -> "np.ndarray":
+    """Map database IDs to their positions in ids, with -1 for IDs not present."""
+    if len(ids) == 0:
+        return np.full(len(values), -1, dtype=np.int64)
+    order = np.argsort(ids, kind="stable")
+    pos = np.minimum(np.searchsorted(ids[order], values), len(ids) - 1)
+    return np.where(ids[order][pos] == values, order[pos], -1)
+
+
+_WORD = re.compile(r"\w+")
+
+
+def _words(text: Optional[str]) -> Set[str]:
+    """Lower-cased words of a name or description."""
+    return set(_WORD.findall(text.lower())) if text else set()
+
+
+class SearchIndex:
+    """
+    In-memory search over entity names and descriptions, for type-ahead pickers.
+    Lower-cased names are kept in sorted arrays, per entity type and per (type, category), so a
+    name prefix is a binary search plus a scan of the matches (a flattened prefix trie). Words of
+    names and descriptions go into inverted indexes, one for all entities and one per category,
+    whose sorted vocabularies answer prefix lookups for the word being typed.
+    """
+    
+    TYPES = ("Category", "Object", "Morphism", "Functor", "Natural_Transformation")
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clear()
+    
+    def _clear(self) -> None:
+        self.built = False
+        self._entries: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._words: Dict[Tuple[str, int], Set[str]] = {}
+        self._names: Dict[Tuple[str, Optional[int]], List[Tuple[str, int]]] = defaultdict(list)
+        # Word indexes are scoped: None for all entities, else a category ID
+        self._postings: Dict[Tuple[Optional[int], str], Set[Tuple[str, int]]] = defaultdict(set)
+        self._vocabulary: Dict[Optional[int], List[str]] = defaultdict(list)
+    
+    def _name_lists(self, entry: Dict[str, Any]) -> List[Tuple[str, Optional[int]]]:
+        """Keys of the sorted name arrays an entry belongs to."""
+        return [(entry["type"], scope) for scope in self._scopes(entry)]
+    
+    def _scopes(self, entry: Dict[str, Any]) -> List[Optional[int]]:
+        """Word index scopes an entry belongs to: everything, plus its category if it has one."""
+        if entry["category_id"] is None:
+            return [None]
+        return [None, entry["category_id"]]
+    
+    def load(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Replace the contents with `entries` (dicts with type, ID, name, description, category_id)."""
+        with self._lock:
+            self._clear()
+            self.put_many(list(entries))
+            self.built = True
+    
+    def reset(self) -> None:
+        """Drop the contents; the next search rebuilds the index."""
+        with self._lock:
+            self._clear()
+    
+    def apply(self, changes: List[Callable[["SearchIndex"], None]]) -> None:
+        """Apply committed changes; they are dropped if the index has not been built yet."""
+        with self._lock:
+            if self.built:
+                for change in changes:
+                    change(self)
+    
+    def put(self, entity_type: str, entity_id: int, name: str, description: Optional[str],
+            category_id: Optional[int] = None) -> None:
+        """Add or replace an entity."""
+        self.put_many([{"type": entity_type, "ID": entity_id, "name": name,
+                        "description": description, "category_id": category_id}])
+    
+    def put_many(self, entries: List[Dict[str, Any]]) -> None:
+        """Add or replace a batch of entities (dicts as for `load`)."""
+        with self._lock:
+            new_names: Dict[Tuple[str, Optional[int]], List[Tuple[str, int]]] = defaultdict(list)
+            new_words: Dict[Optional[int], Set[str]] = defaultdict(set)
+            for entry in entries:
+                key = (entry["type"], entry["ID"])
+                self.remove(entry["type"], [entry["ID"]])
+                self._entries[key] = entry
+                for list_key in self._name_lists(entry):
+                    new_names[list_key].append(((entry["name"] or "").lower(), entry["ID"]))
+                self._words[key] = _words(entry["name"]) | _words(entry["description"])
+                for scope in self._scopes(entry):
+                    for word in self._words[key]:
+                        if (scope, word) not in self._postings:
+                            new_words[scope].add(word)
+                        self._postings[scope, word].add(key)
+            for list_key, names in new_names.items():
+                _insert_sorted(self._names[list_key], names)
+            for scope, words in new_words.items():
+                _insert_sorted(self._vocabulary[scope], list(words))
+    
+    def update(self, entity_type: str, entity_id: int, name: Optional[str] = None,
+               description: Optional[str] = None) -> None:
+        """Change the name and/or description of an indexed entity."""
+        with self._lock:
+            entry = self._entries.get((entity_type, entity_id))
+            if entry is not None:
+                self.put(entity_type, entity_id, entry["name"] if name is None else name,
+                         entry["description"] if description is None else description, entry["category_id"])
+    
+    def update_many(self, entity_type: str, changes: List[Tuple[int, Optional[str], Optional[str]]]) -> None:
+        """Apply a batch of (ID, name or None, description or None) changes to indexed entities."""
+        with self._lock:
+            entries = []
+            for entity_id, name, description in changes:
+                entry = self._entries.get((entity_type, entity_id))
+                if entry is not None:
+                    entries.append({**entry, "name": entry["name"] if name is None else name,
+                                    "description": entry["description"] if description is None else description})
+            self.put_many(entries)
+    
+    def remove(self, entity_type: str, entity_ids: Iterable[int]) -> None:
+        """Remove entities of one type."""
+        with self._lock:
+            for entity_id in entity_ids:
+                key = (entity_type, entity_id)
+                entry = self._entries.pop(key, None)
+                if entry is None:
+                    continue
+                name_key = ((entry["name"] or "").lower(), entity_id)
+                for list_key in self._name_lists(entry):
+                    names = self._names[list_key]
+                    del names[bisect_left(names, name_key)]
+                words = self._words.pop(key)
+                for scope in self._scopes(entry):
+                    vocabulary = self._vocabulary[scope]
+                    for word in words:
+                        postings = self._postings[scope, word]
+                        postings.discard(key)
+                        if not postings:
+                            del self._postings[scope, word]
+                            del vocabulary[bisect_left(vocabulary, word)]
+                    if not vocabulary:
+                        del self._vocabulary[scope]
+    
+    def search(self, query: str, types: Optional[Iterable[str]] = None, limit: int = 20,
+               category_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find entities whose name starts with `query`, then entities whose name or description
+        contains every word of `query` (the last word may be a prefix).
+        
+        Args:
+            query: Search text (case-insensitive)
+            types: Entity types to include (default: all of TYPES)
+            limit: Maximum number of results
+            category_id: Only include objects and morphisms of this category (other types are excluded)
+            
+        Returns:
+            Entity dicts with type, ID, name, description, category_id; name-prefix matches first
+        """
+        text = query.strip().lower()
+        types = list(self.TYPES if types is None else types)
+        unknown = set(types) - set(self.TYPES)
+        if unknown:
+            raise ValueError(f"Unknown entity types: {sorted(unknown)}")
+        if not text or limit <= 0:
+            return []
+        
+        with self._lock:
+            # Name prefix matches: a binary search into each sorted name array
+            by_name: List[Tuple[str, str, int]] = []
+            for entity_type in types:
+                names = self._names.get((entity_type, category_id), [])
+                start = bisect_left(names, (text, -1))
+                for name, entity_id in names[start:start + limit]:
+                    if not name.startswith(text):
+                        break
+                    by_name.append((name, entity_type, entity_id))
+            keys = [(t, i) for _, t, i in sorted(by_name)[:limit]]
+            
+            # Word matches from the inverted index of the whole index or of the category
+            words = _WORD.findall(text)
+            if len(keys) < limit and words:
+                *complete, partial = words
+                seen = set(keys)
+                
+                def has_words(key: Tuple[str, int]) -> bool:
+                    entity_words = self._words[key]
+                    return all(w in entity_words for w in complete) and any(w.startswith(partial) for w in entity_words)
+                
+                candidates: Iterable[Tuple[str, int]]
+                if complete:
+                    postings = sorted((self._postings.get((category_id, w), set()) for w in complete), key=len)
+                    candidates = (key for key in postings[0] if has_words(key))
+                else:
+                    vocabulary = self._vocabulary.get(category_id, [])
+                    start = bisect_left(vocabulary, partial)
+                    end = bisect_left(vocabulary, partial + "\U0010ffff")
+                    candidates = (key for j in range(start, end) for key in self._postings[category_id, vocabulary[j]])
+                by_word: List[Tuple[str, int]] = []
+                for key in candidates:
+                    if key not in seen and key[0] in types:
+                        seen.add(key)
+                        by_word.append(key)
+                        if len(keys) + len(by_word) == limit:
+                            break
+                keys += sorted(by_word, key=lambda key: ((self._entries[key]["name"] or "").lower(), key))
+            return [dict(self._entries[key]) for key in keys]
+    
+    def get(self, entity_type: str, entity_id: int) -> Optional[Dict[str, Any]]:
+        """A copy of an indexed entity, or None."""
+        with self._lock:
+            entry = self._entries.get((entity_type, entity_id))
+            return None if entry is None else dict(entry)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _insert_sorted(values: List[Any], new: List[Any]) -> None:
+    """Merge `new` into the sorted list `values`: one insort each for a small batch, else one sort."""
+    if len(new) * 64 < len(values):
+        for value in new:
+            insort(values, value)
+    elif new:
+        values.extend(new)
+        values.sort()
+
+
+class WriteClock:
+    """
+    Counter shared by the DALs of one database, ticked after every committed write.
+    A DAL whose last seen tick is behind the clock drops its cached hom-sets and compositions.
+    """
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def advance(self, seen: int) -> int:
+        """
+        Record a write and return the caller's new last seen tick.
+        A caller that was already current stays current; one that was behind stays behind.
+        """
+        with self._lock:
+            current = seen == self.value
+            self.value += 1
+            return self.value if current else seen
+
+
+class ReadCache:
+    """
+    Whole-table listings shared by the DALs of one database, keyed by entity type.
+    Each entry is tagged with the WriteClock value it was read at and is served only while
+    the clock still has that value, so any committed write invalidates every entry.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, version: int) -> Optional[Any]:
+        """Return the listing cached for `key` at `version`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, version: int, value: Any) -> None:
+        """Store a listing read at `version`, unless a newer one is already cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= version:
+                self._entries[key] = (version, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of cached listings."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class ReadPool:
+    """
+    Worker threads for `CategoryDAL.fan_out`, each reading through its own connection.
+    One pool can serve every DAL of a database, so N sessions share `size` threads and
+    connections instead of opening a pool each. Threads and connections open on first use.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._readers: List["CategoryDAL"] = []
+        self._lock = threading.Lock()
+
+    def submit(self, owner: "CategoryDAL", name: str, args: List[Any]) -> "Future[Any]":
+        """Queue the read method `name` for a worker, which runs it on a reader DAL configured like `owner`."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="kuzu-read")
+            return self._executor.submit(self._run, owner, name, args)
+
+    def _run(self, owner: "CategoryDAL", name: str, args: List[Any]) -> Any:
+        """Run a read method on this worker thread's connection, opening it on first use."""
+        reader = getattr(self._local, "dal", None)
+        if reader is None:
+            reader = CategoryDAL(owner.db_path, database=owner.db, write_clock=owner.write_clock,
+                                 write_timeout=owner.write_timeout, read_pool=ReadPool(0),
+                                 search_index=owner.search_index, read_cache=owner.read_cache,
+                                 schema_version=owner.schema_version)
+            self._local.dal = reader
+            with self._lock:
+                self._readers.append(reader)
+        return getattr(reader, name)(*args)
+
+    def close(self) -> None:
+        """Wait for running reads, stop the threads and close their connections; the pool reopens on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            readers, self._readers = self._readers, []
+            self._local = threading.local()
+        for reader in readers:
+            reader.close()
+
+
+def _page_rows(rows: List[Dict[str, Any]], after_name: Optional[str], limit: int,
+               after_id: Optional[int]) -> List[Dict[str, Any]]:
+    """Apply an _AFTER_CURSOR page to rows held in memory."""
+    params = _cursor_parameters(after_name, after_id)
+    cursor = (params["after_name"], params["after_id"])
+    rows = sorted(rows, key=lambda row: (row["name"], row["ID"]))
+    return [row for row in rows if (row["name"], row["ID"]) > cursor][:int(limit)]
+
+
+class MutationBuffer:
+    """
+    Creates, updates and deletes of categories, objects and morphisms queued by a buffered
+    transaction. New entities get negative temporary IDs until the buffer is flushed.
+    Updates and deletes of database entities are keyed by their real IDs.
+    """
+
+    TABLES = ("Category", "Object", "Morphism")
+
+    def __init__(self):
+        self._next_id = -1
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every queued change; temporary IDs are never reused."""
+        self.creates: Dict[str, Dict[int, Dict[str, Any]]] = {table: {} for table in self.TABLES}
+        self.updates: Dict[str, Dict[int, Dict[str, Any]]] = {table: {} for table in self.TABLES}
+        self.deletes: Dict[str, Set[int]] = {table: set() for table in self.TABLES}
+
+    def __len__(self) -> int:
+        return sum(len(self.creates[t]) + len(self.updates[t]) + len(self.deletes[t]) for t in self.TABLES)
+
+    def create(self, table: str, row: Dict[str, Any]) -> int:
+        """Queue a new entity and return its temporary ID."""
+        temp_id = self._next_id
+        self._next_id -= 1
+        self.creates[table][temp_id] = {"ID": temp_id, **row}
+        return temp_id
+
+    def update(self, table: str, entity_id: int, name: Optional[str], description: Optional[str],
+               category_id: Optional[int]) -> None:
+        """Queue a rename and/or new description; `category_id` is the scope of a database entity's name."""
+        target = self.creates[table].get(entity_id)
+        if target is None:
+            target = self.updates[table].setdefault(entity_id, {"ID": entity_id, "name": None, "description": None,
+                                                                "category_id": category_id})
+        if name is not None:
+            target["name"] = name
+        if description is not None:
+            target["description"] = description
+
+    def delete(self, table: str, entity_ids: Iterable[int]) -> None:
+        """Queue deletes, dropping queued changes to the deleted entities and to what they contain."""
+        for entity_id in entity_ids:
+            if self.creates[table].pop(entity_id, None) is None:
+                self.deletes[table].add(entity_id)
+            self.updates[table].pop(entity_id, None)
+            if table == "Category":
+                for member in ("Object", "Morphism"):
+                    for pending in (self.creates[member], self.updates[member]):
+                        for member_id in [i for i, row in pending.items() if row["category_id"] == entity_id]:
+                            del pending[member_id]
+            elif table == "Object":
+                for morphism_id in [i for i, row in self.creates["Morphism"].items()
+                                    if entity_id in (row["source_object_id"], row["target_object_id"])]:
+                    del self.creates["Morphism"][morphism_id]
+
+    def is_deleted(self, table: str, entity_id: int) -> bool:
+        return entity_id in self.deletes[table]
+
+    def pending_name(self, table: str, entity_id: int) -> Optional[str]:
+        """The name a database entity will have after the flush, or None if it is not renamed."""
+        update = self.updates[table].get(entity_id)
+        return update["name"] if update is not None else None
+
+    def name_holder(self, table: str, category_id: Optional[int], name: str) -> Optional[int]:
+        """ID of a queued entity that will be named `name` in the scope, or None."""
+        for pending in (self.creates[table], self.updates[table]):
+            for entity_id, row in pending.items():
+                if row["name"] == name and row.get("category_id") == category_id:
+                    return entity_id
+        return None
+
+    def get(self, table: str, entity_id: int) -> Optional[Dict[str, Any]]:
+        """The ID, name and description of a queued new entity, or None."""
+        row = self.creates[table].get(entity_id)
+        return None if row is None else {field: row[field] for field in ("ID", "name", "description")}
+
+    def patch(self, table: str, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """A database row with queued updates applied, or None if the entity is queued for deletion."""
+        if row["ID"] in self.deletes[table]:
+            return None
+        update = self.updates[table].get(row["ID"])
+        if update is None:
+            return row
+        return {**row, **{field: update[field] for field in ("name", "description") if update[field] is not None}}
+
+    def overlay(self, table: str, rows: List[Dict[str, Any]], category_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Merge database rows of one listing with the queued changes to it, ordered by name.
+        Morphism rows must already carry their endpoint names.
+        """
+        if category_id is not None and self.is_deleted("Category", category_id):
+            return []
+        merged = [patched for patched in (self.patch(table, row) for row in rows) if patched is not None]
+        merged += [{key: value for key, value in row.items() if key != "category_id"}
+                   for row in self.creates[table].values() if row.get("category_id") == category_id]
+        if table == "Morphism":
+            merged = [self.with_endpoint_names(row) for row in merged
+                      if not (self.is_deleted("Object", row["source_object_id"])
+                              or self.is_deleted("Object", row["target_object_id"]))]
+        return sorted(merged, key=lambda row: (row["name"], row["ID"]))
+    
+    def with_endpoint_names(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """A morphism row with the queued names of its source and target objects."""
+        for end in ("source", "target"):
+            object_id = row[f"{end}_object_id"]
+            pending = self.creates["Object"].get(object_id)
+            name = pending["name"] if pending is not None else self.pending_name("Object", object_id)
+            if name is not None:
+                row = {**row, f"{end}_object": name}
+        return row
+
+    def overlay_functors(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Functor rows with queued category renames, without the functors of deleted categories."""
+        merged = []
+        for row in rows:
+            if self.is_deleted("Category", row["source_category_id"]) or self.is_deleted("Category", row["target_category_id"]):
+                continue
+            for end in ("source", "target"):
+                renamed = self.pending_name("Category", row[f"{end}_category_id"])
+                if renamed is not None:
+                    row = {**row, f"{end}_category": renamed}
+            merged.append(row)
+        return merged
+
+    def overlay_natural_transformations(self, rows: List[Dict[str, Any]],
+                                        functors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Natural transformation rows without those whose functors go with a deleted category."""
+        kept = {row["ID"] for row in self.overlay_functors(functors)}
+        return [row for row in rows if row["source_functor_id"] in kept and row["target_functor_id"] in kept]
+
+
+class CategoryDAL:
+    """
+    Data Access Layer for Category Theory entities.
+    Provides CRUD operations and transaction management for mathematical categories.
+    """
+    
+    def __init__(self, db_path: str = "./kuzu_db", database: Optional[kuzu.Database] = None,
+                 write_clock: Optional[WriteClock] = None, write_timeout: float = 10.0,
+                 read_pool_size: Optional[int] = None, search_index: Optional[SearchIndex] = None,
+                 read_cache: Optional[ReadCache] = None, schema_version: Optional[int] = None,
+                 read_pool: Optional[ReadPool] = None):
+        """
+        Initialize the data access layer.
+        
+        Args:
+            db_path: Path to the Kuzu database directory
+            database: Open database to connect to instead of opening `db_path`
+            write_clock: Clock shared with other DALs on the same database
+            write_timeout: Seconds to wait for another connection's write transaction to finish
+            read_pool_size: Maximum read connections used by fan_out (default: CPU count, at most 8)
+            search_index: Search index shared with other DALs on the same database
+            read_cache: Listing cache shared with other DALs on the same database
+            schema_version: Schema version of an already migrated `database`, to skip the migration check
+            read_pool: fan_out pool shared with other DALs on the same database (overrides `read_pool_size`)
+        """
+        self.db_path = db_path
+        self._owns_database = database is None
+        self._connect(database if database is not None else kuzu.Database(db_path), schema_version)
+        self.transaction_active = False
+        self.write_timeout = write_timeout
+        self.write_clock = write_clock if write_clock is not None else WriteClock()
+        self._seen_clock = self.write_clock.value
+        self._unpublished_writes = False
+        self._clock_at_begin = self._seen_clock
+        self._hom_sets: Dict[int, HomSetIndex] = {}
+        self.compositions = CompositionCache()
+        self._owns_read_pool = read_pool is None
+        if read_pool is None:
+            read_pool = ReadPool(read_pool_size if read_pool_size is not None else min(8, os.cpu_count() or 1))
+        self.read_pool = read_pool
+        self.search_index = search_index if search_index is not None else SearchIndex()
+        self._pending_index: List[Callable[[SearchIndex], None]] = []
+        self.read_cache = read_cache if read_cache is not None else ReadCache()
+        self.buffer: Optional[MutationBuffer] = None
+        self._resolved_ids: Dict[int, int] = {}
+    
+    def _connect(self, database: kuzu.Database, schema_version: Optional[int] = None) -> None:
+        """Open this DAL's connection to `database` and run pending schema migrations, unless its version is given."""
+        self.db = database
+        self.conn = kuzu.Connection(self.db)
+        self.schema_version = migrate_schema(self.conn) if schema_version is None else schema_version
+        self.statements = StatementRegistry(self.conn)
+    
+    def close(self) -> None:
+        """
+        Roll back any open transaction, stop the read pool (unless it is shared) and close every
+        connection of this DAL, and its database if the DAL opened it.
+        """
+        self.rollback_transaction()
+        if self._owns_read_pool:
+            self.read_pool.close()
+        self.conn.close()
+        if self._owns_database:
+            self.db.close()
+    
+    def fan_out(self, calls: List[Tuple[Any, ...]]) -> List[Any]:
+        """
+        Run independent read methods concurrently on a bounded pool of read connections.
+        Kuzu releases the GIL while executing, so the batch takes about as long as its slowest call.
+        Inside a transaction the calls run in order on this connection, so they see its uncommitted
+        (or buffered) writes.
+        
+        Args:
+            calls: (method name, *args) tuples, e.g. ("get_objects_in_category", cat_id)
+            
+        Returns:
+            The results, in the order of `calls`
+        """
+        for name, *_ in calls:
+            if not name.startswith(_READ_METHOD_PREFIXES):
+                raise ValueError(f"fan_out only runs read methods, not '{name}'")
+        if self.transaction_active or self.buffer is not None or self.read_pool.size < 2 or len(calls) < 2:
+            return [getattr(self, name)(*args) for name, *args in calls]
+        futures = [self.read_pool.submit(self, name, args) for name, *args in calls]
+        return [future.result() for future in futures]
+    
+    def _execute(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Execute a DAL query through the prepared-statement registry.
+        Kuzu 0.7 only runs prepared statements when parameters are supplied, so
+        parameterless queries are sent as text.
+        """
+        if not parameters:
+            return self._wait_for_writer(lambda: self.conn.execute(query))
+        # Preparing a write statement also needs the write lock, so it is retried too
+        return self._wait_for_writer(lambda: self.conn.execute(self.statements.prepare(query), parameters))
+    
+    def _wait_for_writer(self, run: Callable[[], Any]) -> Any:
+        """
+        Run a statement, retrying while another connection holds the write transaction.
+        Kuzu rejects a conflicting write before it starts, so retrying is safe.
+        """
+        deadline = time.monotonic() + self.write_timeout
+        delay = 0.005
+        while True:
+            try:
+                return run()
+            except RuntimeError as e:
+                if _WRITE_CONFLICT not in str(e):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(
+                        f"Timed out after {self.write_timeout}s waiting for another session's transaction to finish"
+                    ) from e
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+    
+    def _publish_write(self) -> None:
+        """Invalidate other DALs' caches after a write; inside a transaction, wait for the commit."""
+        if self.transaction_active:
+            self._unpublished_writes = True
+        else:
+            self._seen_clock = self.write_clock.advance(self._seen_clock)
+    
+    def _index_write(self, change: Callable[[SearchIndex], None]) -> None:
+        """Apply a change to the shared search index and tick the write clock; inside a transaction, wait for the commit."""
+        self._publish_write()
+        if self.transaction_active:
+            self._pending_index.append(change)
+        else:
+            self.search_index.apply([change])
+    
+    def _cached_listing(self, key: str, read: Callable[[], "pa.Table"]) -> "pa.Table":
+        """
+        Serve a whole-table listing from the shared read cache while no write has been committed
+        since it was read. Inside a transaction the listing is read directly, so it shows uncommitted writes.
+        """
+        if self.transaction_active:
+            return read()
+        version = self.write_clock.value  # taken before the read, so a concurrent commit leaves the entry stale
+        table = self.read_cache.get(key, version)
+        if table is None:
+            table = read()
+            self.read_cache.put(key, version, table)
+        return table
+    
+    def _sync_caches(self) -> None:
+        """Drop cached hom-sets and compositions if another DAL has committed a write since they were read."""
+        if self._seen_clock != self.write_clock.value:
+            self._seen_clock = self.write_clock.value
+            self._invalidate_hom_sets()
+            self.compositions.invalidate()
+        
+    def begin_transaction(self, buffered: bool = False) -> None:
+        """
+        Start a new transaction for preview mode.
+        
+        Args:
+            buffered: Queue category, object and morphism edits in a MutationBuffer and write them
+                as batched statements on commit, instead of sending each one to the database
+        """
+        if buffered:
+            if self.buffer is None and not self.transaction_active:
+                self.buffer = MutationBuffer()
+                self._resolved_ids = {}
+                logger.info("Buffered transaction started")
+            return
+        if not self.transaction_active:
+            self._wait_for_writer(lambda: self.conn.execute("BEGIN TRANSACTION"))
+            self.transaction_active = True
+            self._clock_at_begin = self.write_clock.value
+            logger.info("Transaction started")
+    
+    def commit_transaction(self) -> None:
+        """Commit current transaction to persistent storage, flushing any buffered edits first."""
+        if self.buffer is not None:
+            if self.buffer:
+                self._flush_buffer()
+            self.buffer = None
+        if self.transaction_active:
+            self.conn.execute("COMMIT")
+            self.transaction_active = False
+            if self.write_clock.value != self._clock_at_begin:
+                # Caches read inside the transaction predate other sessions' commits
+                self._invalidate_hom_sets()
+                self.compositions.invalidate()
+                self._seen_clock = self.write_clock.value
+            if self._unpublished_writes:
+                self._unpublished_writes = False
+                self._publish_write()
+            self.search_index.apply(self._pending_index)
+            self._pending_index = []
+            logger.info("Transaction committed")
+    
+    def rollback_transaction(self) -> None:
+        """Rollback current transaction, discarding all changes."""
+        if self.buffer is not None:
+            self.buffer = None
+            self._resolved_ids = {}
+            self._invalidate_hom_sets()
+            self.compositions.invalidate()
+            logger.info("Buffered changes discarded")
+        if self.transaction_active:
+            try:
+                self.conn.execute("ROLLBACK")
+            except RuntimeError as e:
+                # Kuzu aborts the transaction itself when some statements fail
+                if "No active transaction" not in str(e):
+                    raise
+            self.transaction_active = False
+            self._unpublished_writes = False
+            self._pending_index = []
+            self._invalidate_hom_sets()
+            self.compositions.invalidate()
+            logger.info("Transaction rolled back")
+
+    # Buffered transactions. Creates, updates and deletes of categories, objects and morphisms are
+    # queued and validated against the buffer plus the database; other writes flush the buffer first.
+    def resolve_id(self, entity_id: int) -> int:
+        """Return the real ID of an entity created under a temporary ID in a buffered transaction."""
+        return self._resolved_ids.get(entity_id, entity_id)
+
+    def _write_through(self, *ids: int) -> Tuple[int, ...]:
+        """
+        Prepare a write that the buffer does not queue: flush the buffer into an open transaction
+        and return `ids` with temporary IDs replaced by real ones.
+        """
+        if self.buffer is not None:
+            self._flush_buffer()
+        return tuple(self.resolve_id(entity_id) for entity_id in ids)
+
+    def _flush_buffer(self) -> None:
+        """
+        Write the buffered changes in this DAL's transaction, opening it if need be.
+        If the flush fails in a transaction it opened, that transaction is rolled back and the
+        buffer is kept, so the conflict can be fixed and the commit retried. If earlier writes
+        had already been flushed into the transaction, those cannot be kept apart from the
+        failed ones, and the whole transaction is rolled back.
+        """
+        buffer = self.buffer
+        opened = not self.transaction_active
+        self.begin_transaction()
+        if not buffer:
+            return
+        resolved_ids = dict(self._resolved_ids)
+        self.buffer = None  # the DAL methods below write directly
+        try:
+            self._apply_buffer(buffer)
+        except Exception:
+            self.rollback_transaction()
+            if opened:
+                self.buffer = buffer
+                self._resolved_ids = resolved_ids
+                logger.info("Buffered changes kept after a failed flush")
+            raise
+        buffer.clear()
+        self.buffer = buffer
+        logger.info(f"Flushed buffered changes; {len(self._resolved_ids)} temporary IDs resolved")
+
+    def _apply_buffer(self, buffer: MutationBuffer) -> None:
+        """
+        Apply queued changes with one bulk statement per table and category: deletes first, then
+        updates, then creates, so names freed by the first two can be reused by the last.
+        """
+        if buffer.deletes["Morphism"]:
+            self.delete_morphisms(sorted(buffer.deletes["Morphism"]))
+        if buffer.deletes["Object"]:
+            self.delete_objects(sorted(buffer.deletes["Object"]))
+        for category_id in sorted(buffer.deletes["Category"]):
+            self.delete_category(category_id)
+
+        for table in MutationBuffer.TABLES:
+            updates = buffer.updates[table]
+            if updates:
+                # Deletes may have cascaded to updated entities
+                result = self._execute(f"MATCH (n:{table}) WHERE n.ID IN CAST($ids, 'INT64[]') RETURN n.ID",
+                                       {"ids": list(updates)})
+                self._update_bulk(table, [updates[entity_id] for entity_id in _collect_ids(_get_query_result(result))])
+
+        categories = list(buffer.creates["Category"].values())
+        if categories:
+            self._resolved_ids.update(zip([row["ID"] for row in categories], self.create_categories_bulk(categories)))
+        for table, create in (("Object", self.create_objects_bulk), ("Morphism", self.create_morphisms_bulk)):
+            by_category: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+            for row in buffer.creates[table].values():
+                by_category[self.resolve_id(row["category_id"])].append(row)
+            for category_id, rows in by_category.items():
+                if table == "Morphism":
+                    rows = [{**row, "source_id": self.resolve_id(row["source_object_id"]),
+                             "target_id": self.resolve_id(row["target_object_id"])} for row in rows]
+                self._resolved_ids.update(zip([row["ID"] for row in rows], create(category_id, rows)))
+
+    def _check_buffered_name(self, table: str, category_id: Optional[int], name: str,
+                             exclude_id: Optional[int] = None) -> None:
+        """Raise ValueError if `name` will be taken in its scope once the buffer is flushed."""
+        assert self.buffer is not None
+        holder = self.buffer.name_holder(table, category_id, name)
+        if holder is None:
+            if table == "Category":
+                holder = self._find_category_by_name(name)
+            elif category_id is not None and category_id >= 0:
+                holder = self._find_in_category_by_name(category_id, table, name)
+            if holder is not None and (self.buffer.is_deleted(table, holder)
+                                       or self.buffer.pending_name(table, holder) not in (None, name)):
+                holder = None
+        if holder is not None and holder != exclude_id:
+            scope = "" if category_id is None else f" in category {category_id}"
+            raise ValueError(f"{table} '{name}' already exists{scope} with ID {holder}")
+
+    def _buffer_create(self, table: str, name: str, description: str, category_id: Optional[int] = None,
+                       **fields: Any) -> int:
+        """Validate and queue a new entity, returning its temporary ID."""
+        assert self.buffer is not None
+        if category_id is not None:
+            category_id = self.resolve_id(category_id)
+            if self.get_category(category_id) is None:
+                raise ValueError(f"Category {category_id} not found")
+        self._check_buffered_name(table, category_id, name)
+        row = {"name": str(name), "description": str(description or ""), **fields}
+        if category_id is not None:
+            row["category_id"] = category_id
+        entity_id = self.buffer.create(table, row)
+        logger.info(f"Queued {table} '{name}' with temporary ID {entity_id}")
+        return entity_id
+
+    def _buffer_endpoint(self, category_id: int, object_id: int) -> Tuple[int, str]:
+        """Return the ID and name of a morphism endpoint, raising ValueError unless it is an object of the category."""
+        assert self.buffer is not None
+        category_id, object_id = self.resolve_id(category_id), self.resolve_id(object_id)
+        pending = self.buffer.creates["Object"].get(object_id)
+        if pending is not None and pending["category_id"] == category_id:
+            return object_id, pending["name"]
+        if pending is None and not self.buffer.is_deleted("Object", object_id):
+            result = self._execute(
+                "MATCH (c:Category)-[:category_objects]->(o:Object) WHERE c.ID = $cat_id AND o.ID = $id RETURN o.name",
+                {"cat_id": category_id, "id": object_id}
+            )
+            query_result = _get_query_result(result)
+            if query_result.has_next():  # type: ignore
+                return object_id, self.buffer.pending_name("Object", object_id) or str(query_result.get_next()[0])  # type: ignore
+        raise ValueError(f"Object {object_id} is not in category {category_id}")
+
+    def _object_category_deleted(self, object_id: int) -> bool:
+        """Whether the category of a database object is queued for deletion."""
+        assert self.buffer is not None
+        result = self._execute(
+            "MATCH (c:Category)-[:category_objects]->(o:Object) WHERE o.ID = $id RETURN c.ID", {"id": object_id}
+        )
+        return any(self.buffer.is_deleted("Category", c) for c in _collect_ids(_get_query_result(result)))
+
+    def _buffer_update(self, table: str, rows: List[Dict[str, Any]]) -> int:
+        """Validate and queue a batch of renames and/or new descriptions."""
+        assert self.buffer is not None
+        seen = set()
+        for row in rows:
+            entity_id = self.resolve_id(int(row["ID"]))
+            if entity_id in seen:
+                raise ValueError(f"{table} {entity_id} appears more than once in batch")
+            seen.add(entity_id)
+            pending = self.buffer.creates[table].get(entity_id)
+            if pending is not None:
+                category_id = pending.get("category_id")
+            elif self.buffer.is_deleted(table, entity_id):
+                raise ValueError(f"{table} {entity_id} not found")
+            elif table == "Category":
+                category_id = None
+                if self.get_category(entity_id) is None:
+                    raise ValueError(f"{table} {entity_id} not found")
+            else:
+                result = self._execute(
+                    f"MATCH (c:Category)-[:{_MEMBER_RELS[table]}]->(n:{table}) WHERE n.ID = $id RETURN c.ID",
+                    {"id": entity_id}
+                )
+                scopes = _collect_ids(_get_query_result(result))
+                if not scopes:
+                    raise ValueError(f"{table} {entity_id} not found")
+                category_id = scopes[0]
+            name = None if row.get("name") is None else str(row["name"])
+            description = None if row.get("description") is None else str(row["description"])
+            if name is not None:
+                self._check_buffered_name(table, category_id, name, exclude_id=entity_id)
+            self.buffer.update(table, entity_id, name, description, category_id)
+        return len(rows)
+
+    # Name lookups used for uniqueness checks
+    def _find_category_by_name(self, name: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the category named `name` (other than `exclude_id`), or None."""
+        result = self._execute(
+            "MATCH (c:Category) WHERE c.name = $name AND c.ID <> $exclude RETURN c.ID LIMIT 1",
+            {"name": name, "exclude": -1 if exclude_id is None else exclude_id}
+        )
+        ids = _collect_ids(_get_query_result(result))
+        return ids[0] if ids else None
+
+    def _find_in_category_by_name(self, category_id: int, table: str, name: str) -> Optional[int]:
+        """Return the ID of the Object or Morphism named `name` in a category, or None."""
+        rel = _MEMBER_RELS[table]
+        result = self._execute(
+            f"MATCH (c:Category)-[:{rel}]->(n:{table}) WHERE c.ID = $cat_id AND n.name = $name RETURN n.ID LIMIT 1",
+            {"cat_id": category_id, "name": name}
+        )
+        ids = _collect_ids(_get_query_result(result))
+        return ids[0] if ids else None
+
+    def _raise_create_failure(self, table: str, name: str, category_id: int, fallback: str) -> None:
+        """Explain why a guarded create of an Object/Morphism returned no row."""
+        existing_id = self._find_in_category_by_name(category_id, table, name)
+        if existing_id is not None:
+            raise ValueError(f"{table} '{name}' already exists in category {category_id} with ID {existing_id}")
+        if self.get_category(category_id) is None:
+            raise ValueError(f"Category {category_id} not found")
+        raise ValueError(fallback)
+
+    # Category operations
+    def create_category(self, name: str, description: str = "") -> int:
+        """
+        Create a new category.
+        
+        Args:
+            name: Category name (must be unique)
+            description: Optional description
+            
+        Returns:
+            ID of the created category
+        """
+        if self.buffer is not None:
+            return self._buffer_create("Category", name, description)
+        try:
+            # Duplicate check and creation in one statement; no row back means the name is taken
+            result = self._execute(
+                """OPTIONAL MATCH (d:Category) WHERE d.name = $name
+                   WITH count(d) AS dups WHERE dups = 0
+                   CREATE (c:Category {name: $name, description: $description})
+                   RETURN c.ID""",
+                {"name": name, "description": description}
+            )
+            ids = _collect_ids(_get_query_result(result))
+            if not ids:
+                existing_id = self._find_category_by_name(name)
+                raise ValueError(f"Category '{name}' already exists with ID {existing_id}")
+            category_id = ids[0]
+            self._index_write(lambda index: index.put("Category", category_id, name, description))
+            logger.info(f"Created category '{name}' with ID {category_id}")
+            return category_id
+        except Exception as e:
+            logger.error(f"Failed to create category '{name}': {e}")
+            raise
+
+    def create_categories_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many categories in a single statement.
+
+        Args:
+            rows: Dictionaries with 'name' and optional 'description'
+
+        Returns:
+            IDs of the created categories, in input order
+        """
+        try:
+            if not rows:
+                return []
+            names = _check_unique_names(rows, "Category")
+            if self.buffer is not None:
+                return [self.create_category(row["name"], row.get("description") or "") for row in rows]
+
+            # One duplicate check for the whole batch
+            result = self._execute(
+                "MATCH (c:Category) WHERE c.name IN $names RETURN c.name, c.ID LIMIT 1",
+                {"names": names}
+            )
+            query_result = _get_query_result(result)
+            if query_result.has_next():  # type: ignore
+                row = query_result.get_next()  # type: ignore
+                raise ValueError(f"Category '{row[0]}' already exists with ID {row[1]}")
+
+            batch = [
+                {"idx": i, "name": str(r["name"]), "description": str(r.get("description") or "")}
+                for i, r in enumerate(rows)
+            ]
+            result = self._execute(
+                """UNWIND $rows AS row
+                   CREATE (c:Category {name: row.name, description: row.description})
+                   RETURN c.ID ORDER BY row.idx""",
+                {"rows": batch}
+            )
+            category_ids = _collect_ids(_get_query_result(result))
+
+            entries = [{"type": "Category", "ID": category_id, "name": row["name"], "description": row["description"],
+                        "category_id": None} for category_id, row in zip(category_ids, batch)]
+            self._index_write(lambda index: index.put_many(entries))
+            logger.info(f"Created {len(category_ids)} categories")
+            return category_ids
+        except Exception as e:
+            logger.error(f"Failed to bulk create categories: {e}")
+            raise
+
+    def get_category(self, category_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get category by ID.
+        
+        Args:
+            category_id: Category ID
+            
+        Returns:
+            Category dictionary or None if not found
+        """
+        category_id = self.resolve_id(category_id)
+        if self.buffer and category_id in self.buffer.creates["Category"]:
+            return self.buffer.get("Category", category_id)
+        try:
+            result = self._execute(
+                "MATCH (c:Category) WHERE c.ID = $id RETURN c.ID, c.name, c.description",
+                {"id": category_id}
+            )
+            query_result = _get_query_result(result)
+            if query_result.has_next():  # type: ignore
+                row = query_result.get_next()  # type: ignore
+                entity = {
+                    "ID": int(row[0]),  # type: ignore
+                    "name": str(row[1]),  # type: ignore
+                    "description": str(row[2])  # type: ignore
+                }
+                return self.buffer.patch("Category", entity) if self.buffer else entity
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get category {category_id}: {e}")
+            raise
+    
+    def list_categories_arrow(self) -> "pa.Table":
+        """
+        List all categories as a columnar table.
+        
+        Returns:
+            Arrow table with columns ID, name, description
+        """
+        def read() -> "pa.Table":
+            result = self._execute(
+                "MATCH (c:Category) RETURN c.ID AS ID, c.name AS name, c.description AS description ORDER BY name"
+            )
+            return _get_query_result(result).get_as_arrow()
+        
+        try:
+            return self._cached_listing("Category", read)
+        except Exception as e:
+            logger.error(f"Failed to list categories: {e}")
+            raise
+    
+    def list_categories(self) -> List[Dict[str, Any]]:
+        """
+        List all categories.
+        
+        Returns:
+            List of category dictionaries
+        """
+        rows = self.list_categories_arrow().to_pylist()
+        return self.buffer.overlay("Category", rows) if self.buffer else rows
+    
+    def page_categories(self, after_name: Optional[str] = None, limit: int = 100,
+                        after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get one page of categories, ordered by (name, ID).
+        
+        Args:
+            after_name: Name of the last category of the previous page (None for the first page)
+            limit: Maximum number of categories to return
+            after_id: ID of the last category of the previous page, to break name ties
+            
+        Returns:
+            List of category dictionaries
+        """
+        if self.buffer:
+            return _page_rows(self.list_categories(), after_name, limit, after_id)
+        try:
+            result = self._execute(
+                f"""MATCH (c:Category) WHERE {_AFTER_CURSOR.format(v="c")}
+                    RETURN c.ID AS ID, c.name AS name, c.description AS description
+                    ORDER BY name, ID LIMIT {int(limit)}""",
+                _cursor_parameters(after_name, after_id)
+            )
+            return _get_query_result(result).get_as_arrow().to_pylist()
+        except Exception as e:
+            logger.error(f"Failed to page categories after '{after_name}': {e}")
+            raise
+    
+    def iter_categories(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream all categories in (name, ID) order, holding at most `batch_size` rows at a time."""
+        return _iter_pages(self.page_categories, batch_size)
+    
+    def update_category(self, category_id: int, name: Optional[str] = None, description: Optional[str] = None) -> bool:
+        """
+        Update category properties. Raises ValueError if the category does not exist
+        or another category already has the name.
+        
+        Args:
+            category_id: Category ID
+            name: New name (optional)
+            description: New description (optional)
+            
+        Returns:
+            True if update successful
+        """
+        self.update_categories_bulk([{"ID": category_id, "name": name, "description": description}])
+        return True
+    
+    def update_categories_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Rename and/or re-describe many categories in a single statement, after one check that
+        no two categories end up with the same name.
+        
+        Args:
+            rows: Dictionaries with 'ID' and optional 'name' and 'description'
+            
+        Returns:
+            Number of categories updated
+        """
+        try:
+            updated = self._update_bulk("Category", rows)
+            logger.info(f"Updated {updated} categories")
+            return updated
+        except Exception as e:
+            logger.error(f"Failed to bulk update categories: {e}")
+            raise
     
-    Args:
-        db_path: Path to the Kuzu database directory
-    """
-    try:
-        db = kuzu.Database(db_path)
-        conn = kuzu.Connection(db)
-        
-        # Create node tables
-        conn.execute("CREATE NODE TABLE IF NOT EXISTS Category(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
-        conn.execute("CREATE NODE TABLE IF NOT EXISTS Object(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
-        conn.execute("CREATE NODE TABLE IF NOT EXISTS Morphism(ID SERIAL PRIMARY KEY, name STRING, description STRING, is_identity BOOLEAN)")
-        conn.execute("CREATE NODE TABLE IF NOT EXISTS Functor(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
-        conn.execute("CREATE NODE TABLE IF NOT EXISTS Natural_Transformation(ID SERIAL PRIMARY KEY, name STRING, description STRING)")
-        conn.execute("CREATE NODE TABLE IF NOT EXISTS Datatype(ID SERIAL PRIMARY KEY, literal STRING, description STRING)")
-        
-        # Create relationship tables
-        conn.execute("CREATE REL TABLE IF NOT EXISTS morphism_source(FROM Morphism TO Object)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS morphism_target(FROM Morphism TO Object)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS functor_source(FROM Functor TO Category)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS functor_target(FROM Functor TO Category)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS category_objects(FROM Category TO Object)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS category_morphisms(FROM Category TO Morphism)")
-        
-        # Functor mapping relationships (explicit storage)
-        conn.execute("CREATE REL TABLE IF NOT EXISTS functor_object_map(FROM Object TO Object, via_functor_id INT)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS functor_morphism_map(FROM Morphism TO Morphism, via_functor_id INT)")
-        
-        # Natural transformation relationships
-        conn.execute("CREATE REL TABLE IF NOT EXISTS nat_trans_source(FROM Natural_Transformation TO Functor)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS nat_trans_target(FROM Natural_Transformation TO Functor)")
-        conn.execute("CREATE REL TABLE IF NOT EXISTS nat_trans_components(FROM Natural_Transformation TO Morphism, at_object_id INT)")
+    def delete_category(self, category_id: int) -> bool:
+        """
+        Delete category and all contained entities, the functors into or out of it, the natural
+        transformations between those functors, and every mapping and component that refers to them.
+        Runs one statement per table, in a single transaction.
         
-        logger.info("Database schema initialized successfully")
+        Args:
+            category_id: Category ID
+            
+        Returns:
+            True if deletion successful
+        """
+        if self.buffer is not None:
+            self.buffer.delete("Category", [self.resolve_id(category_id)])
+            return True
+        try:
+            params = {"id": category_id}
+            with self._atomic():
+                functor_ids, nt_ids = self._cascade_functors(
+                    "MATCH (c:Category)<-[:functor_source|functor_target]-(f:Functor) WHERE c.ID = $id", params
+                )
+                morphism_ids = self._cascade_morphisms(
+                    "MATCH (c:Category)-[:category_morphisms]->(m:Morphism) WHERE c.ID = $id", params
+                )
+                object_ids, _ = self._cascade_objects(
+                    "MATCH (c:Category)-[:category_objects]->(o:Object) WHERE c.ID = $id", params
+                )
+                self._execute("MATCH (c:Category) WHERE c.ID = $id DETACH DELETE c", params)
+                
+                self._invalidate_hom_sets(category_id)
+                self.compositions.invalidate(category_id)
+                
+                def unindex(index: SearchIndex) -> None:
+                    index.remove("Natural_Transformation", nt_ids)
+                    index.remove("Functor", functor_ids)
+                    index.remove("Morphism", morphism_ids)
+                    index.remove("Object", object_ids)
+                    index.remove("Category", [category_id])
+                self._index_write(unindex)
+            logger.info(f"Deleted category {category_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete category {category_id}: {e}")
+            raise
+    
+    # Cascading deletes. Each takes a MATCH clause binding the entities to delete and removes
+    # their dependents with one statement per table.
+    @contextmanager
+    def _atomic(self) -> Iterator[None]:
+        """Run a multi-statement write in a transaction, unless one is already open."""
+        if self.transaction_active:
+            yield
+            return
+        self.begin_transaction()
+        try:
+            yield
+        except Exception:
+            self.rollback_transaction()
+            raise
+        self.commit_transaction()
+    
+    def _cascade_functors(self, match: str, params: Dict[str, Any]) -> Tuple[List[int], List[int]]:
+        """
+        Delete the functors bound to `f`, their object and morphism mappings, and the natural
+        transformations between them with their components.
         
-    except Exception as e:
-        logger.error(f"Failed to initialize schema: {e}")
-        raise
-
-
-class CategoryDAL:
-    """
-    Data Access Layer for Category Theory entities.
-    Provides CRUD operations and transaction management for mathematical categories.
-    """
+        Returns:
+            (deleted functor IDs, deleted natural transformation IDs)
+        """
+        transformations = f"{match} MATCH (f)<-[:nat_trans_source|nat_trans_target]-(nt:Natural_Transformation)"
+        self._execute(f"{transformations} MATCH (nt)-[:nat_trans_components]->(x:Component) DETACH DELETE x", params)
+        nt_ids = _collect_ids(_get_query_result(self._execute(f"{transformations} DETACH DELETE nt RETURN nt.ID", params)))
+        self._execute(
+            f"{match} MATCH (f)-[:functor_object_mappings|functor_morphism_mappings]->(x:Object_Mapping:Morphism_Mapping) DETACH DELETE x",
+            params
+        )
+        functor_ids = _collect_ids(_get_query_result(self._execute(f"{match} DETACH DELETE f RETURN f.ID", params)))
+        return sorted(set(functor_ids)), sorted(set(nt_ids))
     
-    def __init__(self, db_path: str = "./kuzu_db"):
+    def _cascade_morphisms(self, match: str, params: Dict[str, Any]) -> List[int]:
         """
-        Initialize the data access layer.
+        Delete the morphisms bound to `m` with the functor mappings, NT components and composition
+        entries that refer to them.
         
-        Args:
-            db_path: Path to the Kuzu database directory
+        Returns:
+            Deleted morphism IDs
         """
-        self.db_path = db_path
-        self.db = kuzu.Database(db_path)
-        self.conn = kuzu.Connection(self.db)
-        self.transaction_active = False
+        self._execute(f"{match} MATCH (m)<-[:{_MORPHISM_REFS}]-(d:{_MORPHISM_REF_NODES}) DETACH DELETE d", params)
+        return sorted(set(_collect_ids(_get_query_result(self._execute(f"{match} DETACH DELETE m RETURN m.ID", params)))))
+    
+    def _cascade_objects(self, match: str, params: Dict[str, Any]) -> Tuple[List[int], List[int]]:
+        """
+        Delete the objects bound to `o`, the morphisms into or out of them, and the functor mappings
+        and NT components that refer to either.
         
-    def begin_transaction(self) -> None:
-        """Start a new transaction for preview mode."""
-        if not self.transaction_active:
-            self.conn.execute("BEGIN TRANSACTION")
-            self.transaction_active = True
-            logger.info("Transaction started")
+        Returns:
+            (deleted object IDs, deleted morphism IDs)
+        """
+        morphism_ids = self._cascade_morphisms(f"{match} MATCH (o)<-[:morphism_source|morphism_target]-(m:Morphism)", params)
+        self._execute(f"{match} MATCH (o)<-[:{_OBJECT_REFS}]-(d:{_OBJECT_REF_NODES}) DETACH DELETE d", params)
+        object_ids = _collect_ids(_get_query_result(self._execute(f"{match} DETACH DELETE o RETURN o.ID", params)))
+        return sorted(set(object_ids)), morphism_ids
     
-    def commit_transaction(self) -> None:
-        """Commit current transaction to persistent storage."""
-        if self.transaction_active:
-            self.conn.execute("COMMIT")
-            self.transaction_active = False
-            logger.info("Transaction committed")
+    # Batch updates
+    def _update_bulk(self, table: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Set the name and/or description of many Category, Object or Morphism nodes with one UNWIND
+        statement, in a transaction. Category names must stay unique overall, object and morphism
+        names within their category; this is checked with one query over the affected categories.
+        
+        Returns:
+            Number of entities updated
+        """
+        if not rows:
+            return 0
+        if self.buffer is not None:
+            return self._buffer_update(table, rows)
+        batch = []
+        seen = set()
+        for row in rows:
+            entity_id = int(row["ID"])
+            if entity_id in seen:
+                raise ValueError(f"{table} {entity_id} appears more than once in batch")
+            seen.add(entity_id)
+            batch.append({"id": entity_id,
+                          **{field: None if row.get(field) is None else str(row[field]) for field in ("name", "description")}})
+        renamed = {row["id"]: row["name"] for row in batch if row["name"] is not None}
+        # A field no row sets would be typed ANY in the batch, so leave it out of the rows and the SET
+        fields = [field for field in ("name", "description") if any(row[field] is not None for row in batch)]
+        params = [{"id": row["id"], **{field: row[field] for field in fields}} for row in batch]
+        assignments = [f"n.{field} = coalesce(row.{field}, n.{field})" for field in fields] or ["n.name = n.name"]
+        
+        with self._atomic():
+            if renamed:
+                self._check_renames(table, renamed)
+            result = self._execute(
+                f"UNWIND $rows AS row MATCH (n:{table} {{ID: row.id}}) SET {', '.join(assignments)} RETURN n.ID",
+                {"rows": params}
+            )
+            missing = seen - set(_collect_ids(_get_query_result(result)))
+            if missing:
+                raise ValueError(f"{table} {sorted(missing)[0]} not found")
+            
+            if table != "Category":
+                self._invalidate_hom_sets()  # cached morphisms carry object and morphism names and descriptions
+            changes = [(row["id"], row["name"], row["description"]) for row in batch]
+            self._index_write(lambda index: index.update_many(table, changes))
+        return len(batch)
     
-    def rollback_transaction(self) -> None:
-        """Rollback current transaction, discarding all changes."""
-        if self.transaction_active:
-            self.conn.execute("ROLLBACK")
-            self.transaction_active = False
-            logger.info("Transaction rolled back")
+    def _check_renames(self, table: str, renamed: Dict[int, str]) -> None:
+        """Raise ValueError if applying `renamed` (ID -> new name) would repeat a name within its scope."""
+        # Only entities being renamed, or already holding one of the new names, can collide
+        where = "n.ID IN CAST($ids, 'INT64[]') OR n.name IN CAST($names, 'STRING[]')"
+        params = {"ids": list(renamed), "names": sorted(set(renamed.values()))}
+        if table == "Category":
+            result = self._execute(f"MATCH (n:Category) WHERE {where} RETURN -1 AS scope, n.ID AS ID, n.name AS name", params)
+        else:
+            rel = _MEMBER_RELS[table]
+            result = self._execute(
+                f"""UNWIND CAST($ids, 'INT64[]') AS id
+                    MATCH (c:Category)-[:{rel}]->(:{table} {{ID: id}})
+                    WITH DISTINCT c
+                    MATCH (c)-[:{rel}]->(n:{table})
+                    WHERE {where}
+                    RETURN c.ID AS scope, n.ID AS ID, n.name AS name""",
+                params
+            )
+        owners: Dict[Tuple[int, str], int] = {}
+        for row in _get_query_result(result).get_as_arrow().to_pylist():
+            name = renamed.get(row["ID"], row["name"])
+            other = owners.setdefault((row["scope"], name), row["ID"])
+            if other != row["ID"]:
+                scope = "" if table == "Category" else f" in category {row['scope']}"
+                existing = other if row["ID"] in renamed else row["ID"]
+                raise ValueError(f"{table} '{name}' already exists{scope} with ID {existing}")
     
-    # Category operations
-    def create_category(self, name: str, description: str = "") -> int:
+    def create_object(self, name: str, category_id: int, description: str = "") -> int:
         """
-        Create a new category.
+        Create an object within a category.
         
         Args:
-            name: Category name (must be unique)
+            name: Object name
+            category_id: ID of the containing category
             description: Optional description
             
         Returns:
-            ID of the created category
+            ID of the created object
         """
+        if self.buffer is not None:
+            return self._buffer_create("Object", name, description, category_id)
         try:
-            # Check if category with this name already exists
-            existing_categories = self.list_categories()
-            for cat in existing_categories:
-                if cat['name'] == name:
-                    raise ValueError(f"Category '{name}' already exists with ID {cat['ID']}")
+            # Duplicate check, creation and category link in one statement
+            result = self._execute(
+                """MATCH (c:Category) WHERE c.ID = $cat_id
+                   OPTIONAL MATCH (c)-[:category_objects]->(d:Object) WHERE d.name = $name
+                   WITH c, count(d) AS dups WHERE dups = 0
+                   CREATE (o:Object {name: $name, description: $description})
+                   CREATE (c)-[:category_objects]->(o)
+                   RETURN o.ID""",
+                {"cat_id": category_id, "name": name, "description": description}
+            )
+            ids = _collect_ids(_get_query_result(result))
+            if not ids:
+                self._raise_create_failure("Object", name, category_id, f"Failed to create object '{name}'")
+            object_id = ids[0]
             
-            result = self.conn.execute(
-                "CREATE (c:Category {name: $name, description: $description}) RETURN c.ID",
-                {"name": name, "description": description}
+            self._index_write(lambda index: index.put("Object", object_id, name, description, category_id))
+            logger.info(f"Created object '{name}' with ID {object_id} in category {category_id}")
+            return object_id
+        except Exception as e:
+            logger.error(f"Failed to create object '{name}': {e}")
+            raise
+
+    def create_objects_bulk(self, category_id: int, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many objects within a category in a single statement.
+
+        Args:
+            category_id: ID of the containing category
+            rows: Dictionaries with 'name' and optional 'description'
+
+        Returns:
+            IDs of the created objects, in input order
+        """
+        try:
+            if not rows:
+                return []
+            names = _check_unique_names(rows, "Object")
+            if self.buffer is not None:
+                return [self.create_object(row["name"], category_id, row.get("description") or "") for row in rows]
+
+            # One duplicate check for the whole batch
+            result = self._execute(
+                """MATCH (c:Category)-[:category_objects]->(o:Object)
+                   WHERE c.ID = $cat_id AND o.name IN $names
+                   RETURN o.name, o.ID LIMIT 1""",
+                {"cat_id": category_id, "names": names}
             )
             query_result = _get_query_result(result)
-            row = query_result.get_next()  # type: ignore
-            category_id = int(row[0])  # type: ignore
-            logger.info(f"Created category '{name}' with ID {category_id}")
-            return category_id
+            if query_result.has_next():  # type: ignore
+                row = query_result.get_next()  # type: ignore
+                raise ValueError(f"Object '{row[0]}' already exists in category {category_id} with ID {row[1]}")
+
+            batch = [
+                {"idx": i, "name": str(r["name"]), "description": str(r.get("description") or "")}
+                for i, r in enumerate(rows)
+            ]
+            result = self._execute(
+                """MATCH (c:Category) WHERE c.ID = $cat_id
+                   UNWIND $rows AS row
+                   CREATE (o:Object {name: row.name, description: row.description})
+                   CREATE (c)-[:category_objects]->(o)
+                   RETURN o.ID ORDER BY row.idx""",
+                {"cat_id": category_id, "rows": batch}
+            )
+            object_ids = _collect_ids(_get_query_result(result))
+            if len(object_ids) != len(rows):
+                raise ValueError(f"Category {category_id} not found")
+
+            entries = [{"type": "Object", "ID": object_id, "name": row["name"], "description": row["description"],
+                        "category_id": category_id} for object_id, row in zip(object_ids, batch)]
+            self._index_write(lambda index: index.put_many(entries))
+            logger.info(f"Created {len(object_ids)} objects in category {category_id}")
+            return object_ids
         except Exception as e:
-            logger.error(f"Failed to create category '{name}': {e}")
+            logger.error(f"Failed to bulk create objects in category {category_id}: {e}")
             raise
-    
-    def get_category(self, category_id: int) -> Optional[Dict[str, Any]]:
+
+    def get_object(self, object_id: int) -> Optional[Dict[str, Any]]:
         """
-        Get category by ID.
+        Get object by ID.
         
         Args:
-            category_id: Category ID
+            object_id: Object ID
             
         Returns:
-            Category dictionary or None if not found
+            Object dictionary or None if not found
         """
+        object_id = self.resolve_id(object_id)
+        if self.buffer and object_id in self.buffer.creates["Object"]:
+            return self.buffer.get("Object", object_id)
         try:
-            result = self.conn.execute(
-                "MATCH (c:Category) WHERE c.ID = $id RETURN c.ID, c.name, c.description",
-                {"id": category_id}
+            result = self._execute(
+                "MATCH (o:Object) WHERE o.ID = $id RETURN o.ID, o.name, o.description",
+                {"id": object_id}
             )
             query_result = _get_query_result(result)
             if query_result.has_next():  # type: ignore
                 row = query_result.get_next()  # type: ignore
-                return {
+                entity = {
                     "ID": int(row[0]),  # type: ignore
                     "name": str(row[1]),  # type: ignore
                     "description": str(row[2])  # type: ignore
                 }
+                if not self.buffer:
+                    return entity
+                if self.buffer.deletes["Category"] and self._object_category_deleted(object_id):
+                    return None
+                return self.buffer.patch("Object", entity)
             return None
         except Exception as e:
-            logger.error(f"Failed to get category {category_id}: {e}")
+            logger.error(f"Failed to get object {object_id}: {e}")
             raise
     
-    def list_categories(self) -> List[Dict[str, Any]]:
+    def get_objects_in_category_arrow(self, category_id: int) -> "pa.Table":
         """
-        List all categories.
+        Get all objects in a category as a columnar table.
         
+        Args:
+            category_id: Category ID
+            
         Returns:
-            List of category dictionaries
+            Arrow table with columns ID, name, description
         """
         try:
-            result = self.conn.execute("MATCH (c:Category) RETURN c.ID, c.name, c.description ORDER BY c.name")
-            query_result = _get_query_result(result)
-            categories = []
-            while query_result.has_next():  # type: ignore
-                row = query_result.get_next()  # type: ignore
-                categories.append({
-                    "ID": int(row[0]),  # type: ignore
-                    "name": str(row[1]),  # type: ignore
-                    "description": str(row[2])  # type: ignore
-                })
-            return categories
+            result = self._execute(
+                """MATCH (c:Category)-[:category_objects]->(o:Object) WHERE c.ID = $id
+                   RETURN o.ID AS ID, o.name AS name, o.description AS description ORDER BY name""",
+                {"id": category_id}
+            )
+            return _get_query_result(result).get_as_arrow()
         except Exception as e:
-            logger.error(f"Failed to list categories: {e}")
+            logger.error(f"Failed to get objects in category {category_id}: {e}")
             raise
     
-    def update_category(self, category_id: int, name: Optional[str] = None, description: Optional[str] = None) -> bool:
+    def get_objects_in_category(self, category_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all objects in a category.
+        
+        Args:
+            category_id: Category ID
+            
+        Returns:
+            List of object dictionaries
+        """
+        category_id = self.resolve_id(category_id)
+        rows = self.get_objects_in_category_arrow(category_id).to_pylist()
+        return self.buffer.overlay("Object", rows, category_id) if self.buffer else rows
+    
+    def page_objects_in_category(self, category_id: int, after_name: Optional[str] = None, limit: int = 100,
+                                 after_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Update category properties.
+        Get one page of the objects in a category, ordered by (name, ID).
         
         Args:
             category_id: Category ID
+            after_name: Name of the last object of the previous page (None for the first page)
+            limit: Maximum number of objects to return
+            after_id: ID of the last object of the previous page, to break name ties
+            
+        Returns:
+            List of object dictionaries
+        """
+        category_id = self.resolve_id(category_id)
+        if self.buffer:
+            return _page_rows(self.get_objects_in_category(category_id), after_name, limit, after_id)
+        try:
+            result = self._execute(
+                f"""MATCH (c:Category)-[:category_objects]->(o:Object)
+                    WHERE c.ID = $id AND {_AFTER_CURSOR.format(v="o")}
+                    RETURN o.ID AS ID, o.name AS name, o.description AS description
+                    ORDER BY name, ID LIMIT {int(limit)}""",
+                {"id": category_id, **_cursor_parameters(after_name, after_id)}
+            )
+            return _get_query_result(result).get_as_arrow().to_pylist()
+        except Exception as e:
+            logger.error(f"Failed to page objects in category {category_id}: {e}")
+            raise
+    
+    def iter_objects_in_category(self, category_id: int, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream the objects of a category in (name, ID) order, holding at most `batch_size` rows at a time."""
+        return _iter_pages(
+            lambda after_name, limit, after_id: self.page_objects_in_category(category_id, after_name, limit, after_id),
+            batch_size
+        )
+    
+    def update_object(self, object_id: int, name: Optional[str] = None, description: Optional[str] = None) -> bool:
+        """
+        Update object properties. Raises ValueError if the object does not exist
+        or another object in its category already has the name.
+        
+        Args:
+            object_id: Object ID
             name: New name (optional)
             description: New description (optional)
             
@@ -192,307 +2143,575 @@ class CategoryDAL:
             True if update successful
         """
         try:
-            if name is not None:
-                # Check if another category with this name already exists
-                existing_categories = self.list_categories()
-                for cat in existing_categories:
-                    if cat['name'] == name and cat['ID'] != category_id:
-                        raise ValueError(f"Category '{name}' already exists with ID {cat['ID']}")
-                
-                self.conn.execute(
-                    "MATCH (c:Category) WHERE c.ID = $id SET c.name = $name",
-                    {"id": category_id, "name": str(name)}
-                )
-            if description is not None:
-                self.conn.execute(
-                    "MATCH (c:Category) WHERE c.ID = $id SET c.description = $description",
-                    {"id": category_id, "description": str(description)}
-                )
-            logger.info(f"Updated category {category_id}")
+            self._update_bulk("Object", [{"ID": object_id, "name": name, "description": description}])
+            logger.info(f"Updated object {object_id}")
             return True
         except Exception as e:
-            logger.error(f"Failed to update category {category_id}: {e}")
+            logger.error(f"Failed to update object {object_id}: {e}")
             raise
     
-    def delete_category(self, category_id: int) -> bool:
+    def update_objects_bulk(self, rows: List[Dict[str, Any]]) -> int:
         """
-        Delete category and all contained entities.
+        Rename and/or re-describe many objects in a single statement, after one check that
+        no two objects in a category end up with the same name.
         
         Args:
-            category_id: Category ID
+            rows: Dictionaries with 'ID' and optional 'name' and 'description'
             
         Returns:
-            True if deletion successful
+            Number of objects updated
         """
         try:
-            # Delete all morphisms in category first
-            self.conn.execute(
-                "MATCH (c:Category)-[:category_morphisms]->(m:Morphism) WHERE c.ID = $id DETACH DELETE m",
-                {"id": category_id}
-            )
-            
-            # Delete all objects in category
-            self.conn.execute(
-                "MATCH (c:Category)-[:category_objects]->(o:Object) WHERE c.ID = $id DETACH DELETE o",
-                {"id": category_id}
-            )
+            updated = self._update_bulk("Object", rows)
+            logger.info(f"Updated {updated} objects")
+            return updated
+        except Exception as e:
+            logger.error(f"Failed to bulk update objects: {e}")
+            raise
+    
+    def delete_object(self, object_id: int) -> bool:
+        """
+        Delete object and all related morphisms.
+        
+        Args:
+            object_id: Object ID
             
-            # Delete the category itself
-            self.conn.execute(
-                "MATCH (c:Category) WHERE c.ID = $id DETACH DELETE c",
-                {"id": category_id}
-            )
+        Returns:
+            True if deletion successful
+        """
+        self.delete_objects([object_id])
+        return True
+    
+    def delete_objects(self, object_ids: List[int]) -> int:
+        """
+        Delete a batch of objects, every morphism into or out of them, and the functor mappings
+        and NT components that refer to either. Runs one statement per table, in a single transaction.
+        
+        Args:
+            object_ids: Object IDs
             
-            logger.info(f"Deleted category {category_id}")
-            return True
+        Returns:
+            Number of objects deleted
+        """
+        if not object_ids:
+            return 0
+        if self.buffer is not None:
+            self.buffer.delete("Object", [self.resolve_id(object_id) for object_id in object_ids])
+            return len(object_ids)
+        try:
+            with self._atomic():
+                deleted, morphism_ids = self._cascade_objects(
+                    "MATCH (o:Object) WHERE o.ID IN CAST($ids, 'INT64[]')", {"ids": list(object_ids)}
+                )
+                self._invalidate_hom_sets()
+                self.compositions.invalidate()
+                
+                def unindex(index: SearchIndex) -> None:
+                    index.remove("Morphism", morphism_ids)
+                    index.remove("Object", deleted)
+                self._index_write(unindex)
+            logger.info(f"Deleted {len(deleted)} objects and {len(morphism_ids)} morphisms")
+            return len(deleted)
         except Exception as e:
-            logger.error(f"Failed to delete category {category_id}: {e}")
+            logger.error(f"Failed to delete objects {object_ids}: {e}")
             raise
     
-    # Object operations
-    def create_object(self, name: str, category_id: int, description: str = "") -> int:
+    # Morphism operations
+    def create_morphism(self, name: str, source_id: int, target_id: int, category_id: int, description: str = "") -> int:
         """
-        Create an object within a category.
+        Create a morphism between objects in a category.
         
         Args:
-            name: Object name
-            category_id: ID of the containing category
+            name: Morphism name
+            source_id: Source object ID; must be an object of the category
+            target_id: Target object ID; must be an object of the category
+            category_id: Category ID
             description: Optional description
             
         Returns:
-            ID of the created object
+            ID of the created morphism
         """
+        if self.buffer is not None:
+            (source_id, source_name), (target_id, target_name) = (self._buffer_endpoint(category_id, source_id),
+                                                                  self._buffer_endpoint(category_id, target_id))
+            return self._buffer_create("Morphism", name, description, category_id, is_identity=False,
+                                       source_object_id=source_id, source_object=source_name,
+                                       target_object_id=target_id, target_object=target_name)
         try:
-            # Check if object with this name already exists in the category
-            existing_objects = self.get_objects_in_category(category_id)
-            for obj in existing_objects:
-                if obj['name'] == name:
-                    raise ValueError(f"Object '{name}' already exists in category {category_id} with ID {obj['ID']}")
+            # Endpoint membership, duplicate check, creation, category link and source/target in one statement
+            result = self._execute(
+                """MATCH (c:Category)-[:category_objects]->(s:Object), (c)-[:category_objects]->(t:Object)
+                   WHERE c.ID = $cat_id AND s.ID = $source_id AND t.ID = $target_id
+                   OPTIONAL MATCH (c)-[:category_morphisms]->(d:Morphism) WHERE d.name = $name
+                   WITH c, s, t, count(d) AS dups WHERE dups = 0
+                   CREATE (m:Morphism {name: $name, description: $description, is_identity: false})
+                   CREATE (c)-[:category_morphisms]->(m), (m)-[:morphism_source]->(s), (m)-[:morphism_target]->(t)
+                   RETURN m.ID""",
+                {"cat_id": category_id, "source_id": source_id, "target_id": target_id,
+                 "name": name, "description": description}
+            )
+            ids = _collect_ids(_get_query_result(result))
+            if not ids:
+                self._raise_create_failure("Morphism", name, category_id,
+                                           f"Source object {source_id} or target object {target_id} "
+                                           f"not found in category {category_id}")
+            morphism_id = ids[0]
+            self._invalidate_hom_sets(category_id)
             
-            # Create the object
-            result = self.conn.execute(
-                "CREATE (o:Object {name: $name, description: $description}) RETURN o.ID",
-                {"name": name, "description": description}
+            self._index_write(lambda index: index.put("Morphism", morphism_id, name, description, category_id))
+            logger.info(f"Created morphism '{name}' with ID {morphism_id}")
+            return morphism_id
+        except Exception as e:
+            logger.error(f"Failed to create morphism '{name}': {e}")
+            raise
+
+    def create_morphisms_bulk(self, category_id: int, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many morphisms within a category in a single statement.
+
+        Args:
+            category_id: Category ID
+            rows: Dictionaries with 'name', 'source_id', 'target_id' and optional
+                'description' and 'is_identity'
+
+        Returns:
+            IDs of the created morphisms, in input order
+        """
+        try:
+            if not rows:
+                return []
+            names = _check_unique_names(rows, "Morphism")
+            if self.buffer is not None:
+                morphism_ids = []
+                for row in rows:
+                    morphism_id = self.create_morphism(row["name"], row["source_id"], row["target_id"], category_id,
+                                                       row.get("description") or "")
+                    self.buffer.creates["Morphism"][morphism_id]["is_identity"] = bool(row.get("is_identity", False))
+                    morphism_ids.append(morphism_id)
+                return morphism_ids
+
+            # One duplicate check for the whole batch
+            result = self._execute(
+                """MATCH (c:Category)-[:category_morphisms]->(m:Morphism)
+                   WHERE c.ID = $cat_id AND m.name IN $names
+                   RETURN m.name, m.ID LIMIT 1""",
+                {"cat_id": category_id, "names": names}
             )
             query_result = _get_query_result(result)
-            row = query_result.get_next()  # type: ignore
-            object_id = int(row[0])  # type: ignore
-            
-            # Link to category
-            self.conn.execute(
-                "MATCH (c:Category), (o:Object) WHERE c.ID = $cat_id AND o.ID = $obj_id CREATE (c)-[:category_objects]->(o)",
-                {"cat_id": category_id, "obj_id": object_id}
+            if query_result.has_next():  # type: ignore
+                row = query_result.get_next()  # type: ignore
+                raise ValueError(f"Morphism '{row[0]}' already exists in category {category_id} with ID {row[1]}")
+
+            # Endpoints must be objects of the category, otherwise rows would be dropped silently.
+            # Integer list parameters are cast explicitly: Kuzu 0.7 infers a narrow element type
+            # for them and IN comparisons against long lists then miss matches.
+            endpoint_ids = sorted({int(r["source_id"]) for r in rows} | {int(r["target_id"]) for r in rows})
+            result = self._execute(
+                """MATCH (c:Category)-[:category_objects]->(o:Object)
+                   WHERE c.ID = $cat_id AND o.ID IN CAST($ids, 'INT64[]')
+                   RETURN o.ID""",
+                {"cat_id": category_id, "ids": endpoint_ids}
             )
+            missing = set(endpoint_ids) - set(_collect_ids(_get_query_result(result)))
+            if missing:
+                raise ValueError(f"Objects {sorted(missing)} are not in category {category_id}")
+
+            batch = [
+                {
+                    "idx": i,
+                    "name": str(r["name"]),
+                    "description": str(r.get("description") or ""),
+                    "is_identity": bool(r.get("is_identity", False)),
+                    "source_id": int(r["source_id"]),
+                    "target_id": int(r["target_id"]),
+                }
+                for i, r in enumerate(rows)
+            ]
+            result = self._execute(
+                """UNWIND $rows AS row
+                   MATCH (c:Category)-[:category_objects]->(s:Object), (c)-[:category_objects]->(t:Object)
+                   WHERE c.ID = $cat_id AND s.ID = row.source_id AND t.ID = row.target_id
+                   CREATE (m:Morphism {name: row.name, description: row.description, is_identity: row.is_identity})
+                   CREATE (c)-[:category_morphisms]->(m), (m)-[:morphism_source]->(s), (m)-[:morphism_target]->(t)
+                   RETURN m.ID ORDER BY row.idx""",
+                {"cat_id": category_id, "rows": batch}
+            )
+            morphism_ids = _collect_ids(_get_query_result(result))
+            self._invalidate_hom_sets(category_id)
+
+            entries = [{"type": "Morphism", "ID": morphism_id, "name": row["name"], "description": row["description"],
+                        "category_id": category_id} for morphism_id, row in zip(morphism_ids, batch)]
+            self._index_write(lambda index: index.put_many(entries))
+            logger.info(f"Created {len(morphism_ids)} morphisms in category {category_id}")
+            return morphism_ids
+        except Exception as e:
+            logger.error(f"Failed to bulk create morphisms in category {category_id}: {e}")
+            raise
+
+    def update_morphisms_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Rename and/or re-describe many morphisms in a single statement, after one check that
+        no two morphisms in a category end up with the same name.
+        
+        Args:
+            rows: Dictionaries with 'ID' and optional 'name' and 'description'
             
-            logger.info(f"Created object '{name}' with ID {object_id} in category {category_id}")
-            return object_id
+        Returns:
+            Number of morphisms updated
+        """
+        try:
+            updated = self._update_bulk("Morphism", rows)
+            logger.info(f"Updated {updated} morphisms")
+            return updated
         except Exception as e:
-            logger.error(f"Failed to create object '{name}': {e}")
+            logger.error(f"Failed to bulk update morphisms: {e}")
             raise
     
-    def get_object(self, object_id: int) -> Optional[Dict[str, Any]]:
+    def delete_morphisms(self, morphism_ids: List[int]) -> int:
         """
-        Get object by ID.
+        Delete a batch of morphisms with the functor mappings and NT components that refer to them,
+        their composition entries, and the entries that record one of them as a composite.
+        Runs one statement per table, in a single transaction.
         
         Args:
-            object_id: Object ID
+            morphism_ids: Morphism IDs
             
         Returns:
-            Object dictionary or None if not found
+            Number of morphisms deleted
         """
+        if not morphism_ids:
+            return 0
+        if self.buffer is not None:
+            self.buffer.delete("Morphism", [self.resolve_id(morphism_id) for morphism_id in morphism_ids])
+            return len(morphism_ids)
         try:
-            result = self.conn.execute(
-                "MATCH (o:Object) WHERE o.ID = $id RETURN o.ID, o.name, o.description",
-                {"id": object_id}
-            )
-            query_result = _get_query_result(result)
-            if query_result.has_next():  # type: ignore
-                row = query_result.get_next()  # type: ignore
-                return {
-                    "ID": int(row[0]),  # type: ignore
-                    "name": str(row[1]),  # type: ignore
-                    "description": str(row[2])  # type: ignore
-                }
-            return None
+            match = "MATCH (m:Morphism) WHERE m.ID IN CAST($ids, 'INT64[]')"
+            params = {"ids": list(morphism_ids)}
+            with self._atomic():
+                deleted = self._cascade_morphisms(match, params)
+                self._invalidate_hom_sets()
+                self.compositions.invalidate()
+                self._index_write(lambda index: index.remove("Morphism", deleted))
+            logger.info(f"Deleted {len(deleted)} morphisms")
+            return len(deleted)
         except Exception as e:
-            logger.error(f"Failed to get object {object_id}: {e}")
+            logger.error(f"Failed to delete morphisms {morphism_ids}: {e}")
             raise
     
-    def get_objects_in_category(self, category_id: int) -> List[Dict[str, Any]]:
+    def get_morphisms_in_category_arrow(self, category_id: int) -> "pa.Table":
         """
-        Get all objects in a category.
+        Get all morphisms in a category as a columnar table.
         
         Args:
             category_id: Category ID
             
         Returns:
-            List of object dictionaries
+            Arrow table with columns ID, name, description, is_identity, source_object_id,
+            source_object, target_object_id, target_object
         """
         try:
-            result = self.conn.execute(
-                "MATCH (c:Category)-[:category_objects]->(o:Object) WHERE c.ID = $id RETURN o.ID, o.name, o.description ORDER BY o.name",
+            result = self._execute(
+                """MATCH (c:Category)-[:category_morphisms]->(m:Morphism) WHERE c.ID = $id
+                   OPTIONAL MATCH (m)-[:morphism_source]->(s:Object)
+                   OPTIONAL MATCH (m)-[:morphism_target]->(t:Object)
+                   RETURN m.ID AS ID, m.name AS name, m.description AS description, m.is_identity AS is_identity,
+                          s.ID AS source_object_id, s.name AS source_object,
+                          t.ID AS target_object_id, t.name AS target_object
+                   ORDER BY name""",
                 {"id": category_id}
             )
-            query_result = _get_query_result(result)
-            objects = []
-            while query_result.has_next():  # type: ignore
-                row = query_result.get_next()  # type: ignore
-                objects.append({
-                    "ID": int(row[0]),  # type: ignore
-                    "name": str(row[1]),  # type: ignore
-                    "description": str(row[2])  # type: ignore
-                })
-            return objects
+            return _get_query_result(result).get_as_arrow()
         except Exception as e:
-            logger.error(f"Failed to get objects in category {category_id}: {e}")
+            logger.error(f"Failed to get morphisms in category {category_id}: {e}")
             raise
     
-    def update_object(self, object_id: int, name: Optional[str] = None, description: Optional[str] = None) -> bool:
+    def get_morphisms_in_category(self, category_id: int) -> List[Dict[str, Any]]:
         """
-        Update object properties.
+        Get all morphisms in a category.
         
         Args:
-            object_id: Object ID
-            name: New name (optional)
-            description: New description (optional)
+            category_id: Category ID
             
         Returns:
-            True if update successful
+            List of morphism dictionaries with source/target object info
         """
-        try:
-            if name is not None:
-                self.conn.execute(
-                    "MATCH (o:Object) WHERE o.ID = $id SET o.name = $name",
-                    {"id": object_id, "name": str(name)}
-                )
-            if description is not None:
-                self.conn.execute(
-                    "MATCH (o:Object) WHERE o.ID = $id SET o.description = $description",
-                    {"id": object_id, "description": str(description)}
-                )
-            logger.info(f"Updated object {object_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update object {object_id}: {e}")
-            raise
+        category_id = self.resolve_id(category_id)
+        rows = self.get_morphisms_in_category_arrow(category_id).to_pylist()
+        return self.buffer.overlay("Morphism", rows, category_id) if self.buffer else rows
     
-    def delete_object(self, object_id: int) -> bool:
+    def page_morphisms_in_category(self, category_id: int, after_name: Optional[str] = None, limit: int = 100,
+                                   after_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Delete object and all related morphisms.
+        Get one page of the morphisms in a category, ordered by (name, ID).
+        Endpoints are looked up only for the morphisms on the page.
         
         Args:
-            object_id: Object ID
+            category_id: Category ID
+            after_name: Name of the last morphism of the previous page (None for the first page)
+            limit: Maximum number of morphisms to return
+            after_id: ID of the last morphism of the previous page, to break name ties
             
         Returns:
-            True if deletion successful
+            List of morphism dictionaries with source/target object info
         """
+        category_id = self.resolve_id(category_id)
+        if self.buffer:
+            return _page_rows(self.get_morphisms_in_category(category_id), after_name, limit, after_id)
         try:
-            # Delete all morphisms that use this object as source or target
-            self.conn.execute(
-                "MATCH (m:Morphism)-[:morphism_source|morphism_target]->(o:Object) WHERE o.ID = $id DETACH DELETE m",
-                {"id": object_id}
-            )
-            
-            # Delete the object itself using DETACH DELETE
-            self.conn.execute(
-                "MATCH (o:Object) WHERE o.ID = $id DETACH DELETE o",
-                {"id": object_id}
+            result = self._execute(
+                f"""MATCH (c:Category)-[:category_morphisms]->(m:Morphism)
+                    WHERE c.ID = $id AND {_AFTER_CURSOR.format(v="m")}
+                    WITH m ORDER BY m.name, m.ID LIMIT {int(limit)}
+                    OPTIONAL MATCH (m)-[:morphism_source]->(s:Object)
+                    OPTIONAL MATCH (m)-[:morphism_target]->(t:Object)
+                    RETURN m.ID AS ID, m.name AS name, m.description AS description, m.is_identity AS is_identity,
+                           s.ID AS source_object_id, s.name AS source_object,
+                           t.ID AS target_object_id, t.name AS target_object
+                    ORDER BY name, ID""",
+                {"id": category_id, **_cursor_parameters(after_name, after_id)}
             )
-            
-            logger.info(f"Deleted object {object_id}")
-            return True
+            return _get_query_result(result).get_as_arrow().to_pylist()
         except Exception as e:
-            logger.error(f"Failed to delete object {object_id}: {e}")
+            logger.error(f"Failed to page morphisms in category {category_id}: {e}")
             raise
     
-    # Morphism operations
-    def create_morphism(self, name: str, source_id: int, target_id: int, category_id: int, description: str = "") -> int:
+    def iter_morphisms_in_category(self, category_id: int, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream the morphisms of a category in (name, ID) order, holding at most `batch_size` rows at a time."""
+        return _iter_pages(
+            lambda after_name, limit, after_id: self.page_morphisms_in_category(category_id, after_name, limit, after_id),
+            batch_size
+        )
+    
+    # Hom-set operations
+    def _invalidate_hom_sets(self, category_id: Optional[int] = None) -> None:
+        """Drop the cached hom-set index of one category, or of all categories."""
+        if category_id is None:
+            self._hom_sets.clear()
+        else:
+            self._hom_sets.pop(category_id, None)
+    
+    def _hom_set_index(self, category_id: int) -> HomSetIndex:
         """
-        Create a morphism between objects in a category.
+        Return the hom-set index of a category, building it with one query on a miss.
+        While a buffer holds changes the index is built from the merged listing and not cached.
+        """
+        category_id = self.resolve_id(category_id)
+        if self.buffer:
+            return HomSetIndex(self.get_morphisms_in_category(category_id))
+        self._sync_caches()
+        index = self._hom_sets.get(category_id)
+        if index is None:
+            index = HomSetIndex(self.get_morphisms_in_category(category_id))
+            self._hom_sets[category_id] = index
+        return index
+    
+    def get_hom_set(self, category_id: int, source_id: int, target_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all morphisms X → Y in a category.
         
         Args:
-            name: Morphism name
-            source_id: Source object ID
-            target_id: Target object ID
             category_id: Category ID
-            description: Optional description
+            source_id: Object ID of X
+            target_id: Object ID of Y
             
         Returns:
-            ID of the created morphism
+            List of morphism dictionaries, as returned by get_morphisms_in_category
         """
-        try:
-            # Check if morphism with this name already exists in the category
-            existing_morphisms = self.get_morphisms_in_category(category_id)
-            for morph in existing_morphisms:
-                if morph['name'] == name:
-                    raise ValueError(f"Morphism '{name}' already exists in category {category_id} with ID {morph['ID']}")
+        return self._hom_set_index(category_id).hom(source_id, target_id)
+    
+    def get_out_morphisms(self, category_id: int, object_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all morphisms out of an object.
+        
+        Args:
+            category_id: Category ID
+            object_id: Source object ID
             
-            # Create the morphism
-            result = self.conn.execute(
-                "CREATE (m:Morphism {name: $name, description: $description, is_identity: false}) RETURN m.ID",
-                {"name": name, "description": description}
-            )
-            query_result = _get_query_result(result)
-            row = query_result.get_next()  # type: ignore
-            morphism_id = int(row[0])  # type: ignore
+        Returns:
+            List of morphism dictionaries
+        """
+        return self._hom_set_index(category_id).out_of(object_id)
+    
+    def get_in_morphisms(self, category_id: int, object_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all morphisms into an object.
+        
+        Args:
+            category_id: Category ID
+            object_id: Target object ID
             
-            # Link to category
-            self.conn.execute(
-                "MATCH (c:Category), (m:Morphism) WHERE c.ID = $cat_id AND m.ID = $morph_id CREATE (c)-[:category_morphisms]->(m)",
-                {"cat_id": category_id, "morph_id": morphism_id}
-            )
+        Returns:
+            List of morphism dictionaries
+        """
+        return self._hom_set_index(category_id).into(object_id)
+    
+    # Composition operations
+    def set_composite(self, f_id: int, g_id: int, composite_id: int) -> bool:
+        """
+        Record g ∘ f = h in the composition table, replacing any previous entry for (f, g).
+        
+        Args:
+            f_id: ID of f: X → Y (applied first)
+            g_id: ID of g: Y → Z
+            composite_id: ID of h: X → Z
             
-            # Set source and target
-            self.conn.execute(
-                "MATCH (m:Morphism), (o:Object) WHERE m.ID = $morph_id AND o.ID = $obj_id CREATE (m)-[:morphism_source]->(o)",
-                {"morph_id": morphism_id, "obj_id": source_id}
-            )
-            self.conn.execute(
-                "MATCH (m:Morphism), (o:Object) WHERE m.ID = $morph_id AND o.ID = $obj_id CREATE (m)-[:morphism_target]->(o)",
-                {"morph_id": morphism_id, "obj_id": target_id}
+        Returns:
+            True if the composite was recorded
+        """
+        f_id, g_id, composite_id = self._write_through(f_id, g_id, composite_id)
+        try:
+            # f, g and h must share a category and have matching endpoints
+            result = self._execute(
+                """
+                MATCH (c:Category)-[:category_morphisms]->(f:Morphism),
+                      (c)-[:category_morphisms]->(g:Morphism),
+                      (c)-[:category_morphisms]->(h:Morphism),
+                      (f)-[:morphism_source]->(x:Object), (f)-[:morphism_target]->(y:Object),
+                      (g)-[:morphism_source]->(y), (g)-[:morphism_target]->(z:Object),
+                      (h)-[:morphism_source]->(x), (h)-[:morphism_target]->(z)
+                WHERE f.ID = $f_id AND g.ID = $g_id AND h.ID = $h_id
+                RETURN c.ID
+                """,
+                {"f_id": f_id, "g_id": g_id, "h_id": composite_id}
             )
-            
-            logger.info(f"Created morphism '{name}' with ID {morphism_id}")
-            return morphism_id
+            category_ids = _collect_ids(_get_query_result(result))
+            if not category_ids:
+                raise ValueError(
+                    f"Morphism {composite_id} is not a well-typed composite of {g_id} ∘ {f_id} in a single category"
+                )
+            with self._atomic():
+                self._execute(
+                    """
+                    MATCH (f:Morphism)<-[:composition_first]-(cp:Composition)-[:composition_second]->(g:Morphism)
+                    WHERE f.ID = $f_id AND g.ID = $g_id
+                    DETACH DELETE cp
+                    """,
+                    {"f_id": f_id, "g_id": g_id}
+                )
+                self._execute(
+                    """
+                    MATCH (f:Morphism), (g:Morphism), (h:Morphism) WHERE f.ID = $f_id AND g.ID = $g_id AND h.ID = $h_id
+                    CREATE (cp:Composition)
+                    CREATE (cp)-[:composition_first]->(f), (cp)-[:composition_second]->(g), (cp)-[:composition_result]->(h)
+                    """,
+                    {"f_id": f_id, "g_id": g_id, "h_id": composite_id}
+                )
+                self.compositions.invalidate(category_ids[0])
+                self._publish_write()
+            logger.info(f"Recorded composite {g_id} ∘ {f_id} = {composite_id}")
+            return True
         except Exception as e:
-            logger.error(f"Failed to create morphism '{name}': {e}")
+            logger.error(f"Failed to set composite {g_id} ∘ {f_id}: {e}")
             raise
     
-    def get_morphisms_in_category(self, category_id: int) -> List[Dict[str, Any]]:
+    def compose(self, f_id: int, g_id: int) -> Optional[int]:
         """
-        Get all morphisms in a category.
+        Compose two morphisms using the memoized composition table.
+        Identities compose without a stored entry.
         
         Args:
-            category_id: Category ID
+            f_id: ID of f: X → Y (applied first)
+            g_id: ID of g: Y → Z
             
         Returns:
-            List of morphism dictionaries with source/target object info
+            ID of g ∘ f, or None if the pair is not composable or no composite is recorded
         """
+        f_id, g_id = self.resolve_id(f_id), self.resolve_id(g_id)
+        if self.buffer:
+            if any(self.buffer.is_deleted("Morphism", m) for m in (f_id, g_id)):
+                return None
+            if f_id in self.buffer.creates["Morphism"] or g_id in self.buffer.creates["Morphism"]:
+                return self._compose_buffered(f_id, g_id)
+        self._sync_caches()
+        key = (f_id, g_id)
+        found, composite_id = self.compositions.get(key)
+        if found:
+            return composite_id
         try:
-            result = self.conn.execute(
-                """MATCH (c:Category)-[:category_morphisms]->(m:Morphism) WHERE c.ID = $id
-                   OPTIONAL MATCH (m)-[:morphism_source]->(s:Object)
-                   OPTIONAL MATCH (m)-[:morphism_target]->(t:Object)
-                   RETURN m.ID, m.name, m.description, m.is_identity, s.name, t.name ORDER BY m.name""",
-                {"id": category_id}
+            result = self._execute(
+                """
+                MATCH (c:Category)-[:category_morphisms]->(f:Morphism), (c)-[:category_morphisms]->(g:Morphism)
+                WHERE f.ID = $f_id AND g.ID = $g_id
+                OPTIONAL MATCH (f)<-[:composition_first]-(cp:Composition)-[:composition_second]->(g),
+                               (cp)-[:composition_result]->(h:Morphism)
+                OPTIONAL MATCH (f)-[:morphism_target]->(y:Object)
+                OPTIONAL MATCH (g)-[:morphism_source]->(y2:Object)
+                RETURN c.ID, h.ID, f.is_identity, g.is_identity, y.ID, y2.ID
+                """,
+                {"f_id": f_id, "g_id": g_id}
             )
             query_result = _get_query_result(result)
-            morphisms = []
-            while query_result.has_next():  # type: ignore
-                row = query_result.get_next()  # type: ignore
-                morphisms.append({
-                    "ID": int(row[0]),  # type: ignore
-                    "name": str(row[1]),  # type: ignore
-                    "description": str(row[2]),  # type: ignore
-                    "is_identity": bool(row[3]),  # type: ignore
-                    "source_object": str(row[4]) if row[4] is not None else None,  # type: ignore
-                    "target_object": str(row[5]) if row[5] is not None else None  # type: ignore
-                })
-            return morphisms
+            if not query_result.has_next():  # type: ignore
+                return None
+            row = query_result.get_next()  # type: ignore
+            category_id, stored, f_is_identity, g_is_identity, y_id, y2_id = row
+            if y_id is None or y_id != y2_id:
+                composite_id = None
+            elif stored is not None:
+                composite_id = int(stored)
+            elif f_is_identity:
+                composite_id = g_id
+            elif g_is_identity:
+                composite_id = f_id
+            else:
+                composite_id = None
+            self.compositions.put(key, int(category_id), composite_id)
+            if self.buffer and composite_id is not None and self.buffer.is_deleted("Morphism", composite_id):
+                return None
+            return composite_id
         except Exception as e:
-            logger.error(f"Failed to get morphisms in category {category_id}: {e}")
+            logger.error(f"Failed to compose {g_id} ∘ {f_id}: {e}")
             raise
     
+    def _compose_buffered(self, f_id: int, g_id: int) -> Optional[int]:
+        """Compose a pair involving a queued morphism. Queued morphisms have no recorded composites, so only identities compose."""
+        assert self.buffer is not None
+        ends = []
+        for morphism_id in (f_id, g_id):
+            pending = self.buffer.creates["Morphism"].get(morphism_id)
+            if pending is not None:
+                ends.append((pending["category_id"], pending["source_object_id"], pending["target_object_id"],
+                             pending["is_identity"]))
+                continue
+            result = self._execute(
+                """MATCH (c:Category)-[:category_morphisms]->(m:Morphism) WHERE m.ID = $id
+                   OPTIONAL MATCH (m)-[:morphism_source]->(s:Object)
+                   OPTIONAL MATCH (m)-[:morphism_target]->(t:Object)
+                   RETURN c.ID, s.ID, t.ID, m.is_identity""",
+                {"id": morphism_id}
+            )
+            query_result = _get_query_result(result)
+            if not query_result.has_next():  # type: ignore
+                return None
+            ends.append(tuple(query_result.get_next()))  # type: ignore
+        (f_cat, _, f_target, f_is_identity), (g_cat, g_source, _, g_is_identity) = ends
+        if f_cat != g_cat or f_target is None or f_target != g_source:
+            return None
+        if f_is_identity:
+            return g_id
+        if g_is_identity:
+            return f_id
+        return None
+
+    def compose_path(self, path: List[int]) -> Optional[int]:
+        """
+        Compose a path of morphisms f1, f2, ..., fn into fn ∘ ... ∘ f2 ∘ f1.
+        
+        Args:
+            path: Morphism IDs in the order they are applied
+            
+        Returns:
+            ID of the composite, or None if the path is empty or some step has no composite
+        """
+        if not path:
+            return None
+        composite: Optional[int] = path[0]
+        for next_id in path[1:]:
+            composite = self.compose(composite, next_id)  # type: ignore[arg-type]
+            if composite is None:
+                return None
+        return composite
+    
     # Functor operations
     def create_functor(self, name: str, source_cat_id: int, target_cat_id: int, description: str = "") -> int:
         """
@@ -507,24 +2726,21 @@ class CategoryDAL:
         Returns:
             ID of the created functor
         """
+        source_cat_id, target_cat_id = self._write_through(source_cat_id, target_cat_id)
         try:
-            result = self.conn.execute(
-                "CREATE (f:Functor {name: $name, description: $description}) RETURN f.ID",
-                {"name": name, "description": description}
-            )
-            query_result = _get_query_result(result)
-            row = query_result.get_next()  # type: ignore
-            functor_id = int(row[0])  # type: ignore
-            
-            # Link to source and target categories
-            self.conn.execute(
-                "MATCH (f:Functor), (c:Category) WHERE f.ID = $func_id AND c.ID = $cat_id CREATE (f)-[:functor_source]->(c)",
-                {"func_id": functor_id, "cat_id": source_cat_id}
-            )
-            self.conn.execute(
-                "MATCH (f:Functor), (c:Category) WHERE f.ID = $func_id AND c.ID = $cat_id CREATE (f)-[:functor_target]->(c)",
-                {"func_id": functor_id, "cat_id": target_cat_id}
+            # Create the functor and link source and target categories in one statement
+            result = self._execute(
+                """MATCH (sc:Category), (tc:Category) WHERE sc.ID = $src_id AND tc.ID = $tgt_id
+                   CREATE (f:Functor {name: $name, description: $description})
+                   CREATE (f)-[:functor_source]->(sc), (f)-[:functor_target]->(tc)
+                   RETURN f.ID""",
+                {"src_id": source_cat_id, "tgt_id": target_cat_id, "name": name, "description": description}
             )
+            ids = _collect_ids(_get_query_result(result))
+            if not ids:
+                raise ValueError(f"Source category {source_cat_id} or target category {target_cat_id} not found")
+            functor_id = ids[0]
+            self._index_write(lambda index: index.put("Functor", functor_id, name, description))
             
             logger.info(f"Created functor '{name}' with ID {functor_id}")
             return functor_id
@@ -532,38 +2748,41 @@ class CategoryDAL:
             logger.error(f"Failed to create functor '{name}': {e}")
             raise
     
-    def list_functors(self) -> List[Dict[str, Any]]:
+    def list_functors_arrow(self) -> "pa.Table":
         """
-        List all functors.
+        List all functors as a columnar table.
         
         Returns:
-            List of functor dictionaries with source/target category info
+            Arrow table with functor columns and source/target category info
         """
-        try:
-            result = self.conn.execute(
+        def read() -> "pa.Table":
+            result = self._execute(
                 """MATCH (f:Functor)
                    OPTIONAL MATCH (f)-[:functor_source]->(sc:Category)
                    OPTIONAL MATCH (f)-[:functor_target]->(tc:Category)
-                   RETURN f.ID, f.name, f.description, sc.name, tc.name, sc.ID, tc.ID ORDER BY f.name"""
+                   RETURN f.ID AS ID, f.name AS name, f.description AS description,
+                          sc.name AS source_category, tc.name AS target_category,
+                          sc.ID AS source_category_id, tc.ID AS target_category_id
+                   ORDER BY name"""
             )
-            query_result = _get_query_result(result)
-            functors = []
-            while query_result.has_next():  # type: ignore
-                row = query_result.get_next()  # type: ignore
-                functors.append({
-                    "ID": int(row[0]),  # type: ignore
-                    "name": str(row[1]),  # type: ignore
-                    "description": str(row[2]),  # type: ignore
-                    "source_category": str(row[3]) if row[3] is not None else None,  # type: ignore
-                    "target_category": str(row[4]) if row[4] is not None else None,  # type: ignore
-                    "source_category_id": int(row[5]) if row[5] is not None else None,  # type: ignore
-                    "target_category_id": int(row[6]) if row[6] is not None else None  # type: ignore
-                })
-            return functors
+            return _get_query_result(result).get_as_arrow()
+        
+        try:
+            return self._cached_listing("Functor", read)
         except Exception as e:
             logger.error(f"Failed to list functors: {e}")
             raise
     
+    def list_functors(self) -> List[Dict[str, Any]]:
+        """
+        List all functors.
+        
+        Returns:
+            List of functor dictionaries with source/target category info
+        """
+        rows = self.list_functors_arrow().to_pylist()
+        return self.buffer.overlay_functors(rows) if self.buffer else rows
+    
     def create_natural_transformation(self, name: str, source_functor_id: int, target_functor_id: int, description: str = "") -> int:
         """
         Create a natural transformation between functors.
@@ -577,24 +2796,21 @@ class CategoryDAL:
         Returns:
             ID of the created natural transformation
         """
+        self._write_through()
         try:
-            result = self.conn.execute(
-                "CREATE (nt:Natural_Transformation {name: $name, description: $description}) RETURN nt.ID",
-                {"name": name, "description": description}
-            )
-            query_result = _get_query_result(result)
-            row = query_result.get_next()  # type: ignore
-            nt_id = int(row[0])  # type: ignore
-            
-            # Link to source and target functors
-            self.conn.execute(
-                "MATCH (nt:Natural_Transformation), (f:Functor) WHERE nt.ID = $nt_id AND f.ID = $src_id CREATE (nt)-[:nat_trans_source]->(f)",
-                {"nt_id": nt_id, "src_id": source_functor_id}
-            )
-            self.conn.execute(
-                "MATCH (nt:Natural_Transformation), (f:Functor) WHERE nt.ID = $nt_id AND f.ID = $tgt_id CREATE (nt)-[:nat_trans_target]->(f)",
-                {"nt_id": nt_id, "tgt_id": target_functor_id}
+            # Create the natural transformation and link source and target functors in one statement
+            result = self._execute(
+                """MATCH (sf:Functor), (tf:Functor) WHERE sf.ID = $src_id AND tf.ID = $tgt_id
+                   CREATE (nt:Natural_Transformation {name: $name, description: $description})
+                   CREATE (nt)-[:nat_trans_source]->(sf), (nt)-[:nat_trans_target]->(tf)
+                   RETURN nt.ID""",
+                {"src_id": source_functor_id, "tgt_id": target_functor_id, "name": name, "description": description}
             )
+            ids = _collect_ids(_get_query_result(result))
+            if not ids:
+                raise ValueError(f"Source functor {source_functor_id} or target functor {target_functor_id} not found")
+            nt_id = ids[0]
+            self._index_write(lambda index: index.put("Natural_Transformation", nt_id, name, description))
             
             logger.info(f"Created natural transformation '{name}' with ID {nt_id}")
             return nt_id
@@ -602,53 +2818,54 @@ class CategoryDAL:
             logger.error(f"Failed to create natural transformation '{name}': {e}")
             raise
     
-    def list_natural_transformations(self) -> List[Dict[str, Any]]:
+    def list_natural_transformations_arrow(self) -> "pa.Table":
         """
-        List all natural transformations.
+        List all natural transformations as a columnar table.
         
         Returns:
-            List of natural transformation dictionaries including linked functors when available
+            Arrow table with natural transformation columns and linked functor info
         """
-        try:
-            result = self.conn.execute(
+        def read() -> "pa.Table":
+            result = self._execute(
                 """MATCH (nt:Natural_Transformation)
                    OPTIONAL MATCH (nt)-[:nat_trans_source]->(sf:Functor)
                    OPTIONAL MATCH (nt)-[:nat_trans_target]->(tf:Functor)
-                   RETURN nt.ID, nt.name, nt.description, sf.ID, sf.name, tf.ID, tf.name
-                   ORDER BY nt.name"""
+                   RETURN nt.ID AS ID, nt.name AS name, nt.description AS description,
+                          sf.ID AS source_functor_id, sf.name AS source_functor,
+                          tf.ID AS target_functor_id, tf.name AS target_functor
+                   ORDER BY name"""
             )
-            query_result = _get_query_result(result)
-            nat_trans = []
-            while query_result.has_next():  # type: ignore
-                row = query_result.get_next()  # type: ignore
-                nat_trans.append({
-                    "ID": int(row[0]),  # type: ignore
-                    "name": str(row[1]),  # type: ignore
-                    "description": str(row[2]),  # type: ignore
-                    "source_functor_id": int(row[3]) if row[3] is not None else None,  # type: ignore
-                    "source_functor": str(row[4]) if row[4] is not None else None,  # type: ignore
-                    "target_functor_id": int(row[5]) if row[5] is not None else None,  # type: ignore
-                    "target_functor": str(row[6]) if row[6] is not None else None  # type: ignore
-                })
-            return nat_trans
+            return _get_query_result(result).get_as_arrow()
+        
+        try:
+            return self._cached_listing("Natural_Transformation", read)
         except Exception as e:
             logger.error(f"Failed to list natural transformations: {e}")
             raise
     
+    def list_natural_transformations(self) -> List[Dict[str, Any]]:
+        """
+        List all natural transformations.
+        
+        Returns:
+            List of natural transformation dictionaries including linked functors when available
+        """
+        rows = self.list_natural_transformations_arrow().to_pylist()
+        if self.buffer and self.buffer.deletes["Category"]:
+            return self.buffer.overlay_natural_transformations(rows, self.list_functors_arrow().to_pylist())
+        return rows
+    
     def add_functor_object_mapping(self, functor_id: int, source_obj_id: int, target_obj_id: int) -> bool:
         """Add object mapping ensuring objects belong to functor's domain/codomain."""
+        source_obj_id, target_obj_id = self._write_through(source_obj_id, target_obj_id)
         try:
-            self.conn.execute(
+            self._execute(
                 """
-                MATCH (f:Functor) WHERE f.ID = $fid
-                OPTIONAL MATCH (f)-[:functor_source]->(sc:Category)
-                OPTIONAL MATCH (f)-[:functor_target]->(tc:Category)
-                MATCH (s:Object) WHERE s.ID = $sid
-                MATCH (t:Object) WHERE t.ID = $tid
-                WITH f, sc, tc, s, t
-                MATCH (sc)-[:category_objects]->(s)
-                MATCH (tc)-[:category_objects]->(t)
-                CREATE (s)-[:functor_object_map {via_functor_id: $fid}]->(t)
+                MATCH (f:Functor)-[:functor_source]->(sc:Category)-[:category_objects]->(s:Object),
+                      (f)-[:functor_target]->(tc:Category)-[:category_objects]->(t:Object)
+                WHERE f.ID = $fid AND s.ID = $sid AND t.ID = $tid
+                CREATE (f)-[:functor_object_mappings]->(mp:Object_Mapping)
+                CREATE (mp)-[:object_mapping_source]->(s), (mp)-[:object_mapping_target]->(t)
                 """,
                 {"fid": functor_id, "sid": source_obj_id, "tid": target_obj_id}
             )
@@ -658,14 +2875,71 @@ class CategoryDAL:
             logger.error(f"Failed to add functor object mapping: {e}")
             raise
 
+    def add_functor_object_mappings_bulk(self, functor_id: int, mappings: List[Tuple[int, int]]) -> int:
+        """
+        Add many object mappings for a functor in a single statement.
+        Pairs whose objects are outside the functor's domain/codomain are skipped, as in
+        add_functor_object_mapping.
+
+        Args:
+            functor_id: Functor ID
+            mappings: (source_obj_id, target_obj_id) pairs
+
+        Returns:
+            Number of mappings created
+        """
+        mappings = [self._write_through(s, t) for s, t in mappings]
+        try:
+            if not mappings:
+                return 0
+            source_ids = [int(s) for s, _ in mappings]
+            if len(set(source_ids)) != len(source_ids):
+                raise ValueError(f"Batch maps a source object more than once under functor {functor_id}")
+
+            # One duplicate check for the whole batch
+            result = self._execute(
+                """
+                MATCH (f:Functor)-[:functor_object_mappings]->(:Object_Mapping)-[:object_mapping_source]->(s:Object)
+                WHERE f.ID = $fid AND s.ID IN CAST($sids, 'INT64[]')
+                RETURN s.ID LIMIT 1
+                """,
+                {"fid": functor_id, "sids": source_ids}
+            )
+            query_result = _get_query_result(result)
+            if query_result.has_next():  # type: ignore
+                row = query_result.get_next()  # type: ignore
+                raise ValueError(f"Object {row[0]} is already mapped under functor {functor_id}")
+
+            result = self._execute(
+                """
+                MATCH (f:Functor)-[:functor_source]->(sc:Category), (f)-[:functor_target]->(tc:Category)
+                WHERE f.ID = $fid
+                UNWIND $rows AS row
+                MATCH (sc)-[:category_objects]->(s:Object), (tc)-[:category_objects]->(t:Object)
+                WHERE s.ID = row.sid AND t.ID = row.tid
+                CREATE (f)-[:functor_object_mappings]->(mp:Object_Mapping)
+                CREATE (mp)-[:object_mapping_source]->(s), (mp)-[:object_mapping_target]->(t)
+                RETURN count(*)
+                """,
+                {"fid": functor_id, "rows": [{"sid": int(s), "tid": int(t)} for s, t in mappings]}
+            )
+            created = _collect_ids(_get_query_result(result))
+            count = created[0] if created else 0
+            logger.info(f"Added {count} functor object mappings for F#{functor_id}")
+            return count
+        except Exception as e:
+            logger.error(f"Failed to bulk add functor object mappings: {e}")
+            raise
+
     def remove_functor_object_mapping(self, functor_id: int, source_obj_id: int) -> bool:
         """Remove object mapping for a given source object under a functor."""
+        (source_obj_id,) = self._write_through(source_obj_id)
         try:
-            self.conn.execute(
+            self._execute(
                 """
-                MATCH (s:Object)-[r:functor_object_map]->(:Object)
-                WHERE r.via_functor_id = $fid AND s.ID = $sid
-                DELETE r
+                MATCH (f:Functor)-[:functor_object_mappings]->(mp:Object_Mapping)-[:object_mapping_source]->(s:Object)
+                WHERE f.ID = $fid AND s.ID = $sid
+                DETACH DELETE mp
                 """,
                 {"fid": functor_id, "sid": source_obj_id}
             )
@@ -675,64 +2949,114 @@ class CategoryDAL:
             logger.error(f"Failed to remove functor object mapping: {e}")
             raise
 
-    def get_functor_object_mappings(self, functor_id: int) -> List[Dict[str, Any]]:
-        """List object mappings for a functor with names/IDs."""
+    def get_functor_object_mappings_arrow(self, functor_id: int) -> "pa.Table":
+        """List object mappings for a functor as a columnar table."""
         try:
-            result = self.conn.execute(
+            result = self._execute(
                 """
-                MATCH (s:Object)-[r:functor_object_map]->(t:Object)
-                WHERE r.via_functor_id = $fid
-                RETURN s.ID, s.name, t.ID, t.name
-                ORDER BY s.name
+                MATCH (f:Functor)-[:functor_object_mappings]->(mp:Object_Mapping),
+                      (mp)-[:object_mapping_source]->(s:Object), (mp)-[:object_mapping_target]->(t:Object)
+                WHERE f.ID = $fid
+                RETURN s.ID AS source_object_id, s.name AS source_object,
+                       t.ID AS target_object_id, t.name AS target_object
+                ORDER BY source_object
                 """,
                 {"fid": functor_id}
             )
-            qr = _get_query_result(result)
-            mappings: List[Dict[str, Any]] = []
-            while qr.has_next():  # type: ignore
-                row = qr.get_next()  # type: ignore
-                mappings.append({
-                    "source_object_id": int(row[0]),
-                    "source_object": str(row[1]),
-                    "target_object_id": int(row[2]),
-                    "target_object": str(row[3]),
-                })
-            return mappings
+            return _get_query_result(result).get_as_arrow()
         except Exception as e:
             logger.error(f"Failed to list functor object mappings: {e}")
             raise
 
-    def add_functor_morphism_mapping(self, functor_id: int, source_morph_id: int, target_morph_id: int) -> bool:
-        """Add morphism mapping ensuring morphisms belong to functor's domain/codomain."""
-        try:
-            self.conn.execute(
+    def get_functor_object_mappings(self, functor_id: int) -> List[Dict[str, Any]]:
+        """List object mappings for a functor with names/IDs."""
+        return self.get_functor_object_mappings_arrow(functor_id).to_pylist()
+
+    def add_functor_morphism_mapping(self, functor_id: int, source_morph_id: int, target_morph_id: int) -> bool:
+        """Add morphism mapping ensuring morphisms belong to functor's domain/codomain."""
+        source_morph_id, target_morph_id = self._write_through(source_morph_id, target_morph_id)
+        try:
+            self._execute(
+                """
+                MATCH (f:Functor)-[:functor_source]->(sc:Category)-[:category_morphisms]->(sm:Morphism),
+                      (f)-[:functor_target]->(tc:Category)-[:category_morphisms]->(tm:Morphism)
+                WHERE f.ID = $fid AND sm.ID = $smid AND tm.ID = $tmid
+                CREATE (f)-[:functor_morphism_mappings]->(mp:Morphism_Mapping)
+                CREATE (mp)-[:morphism_mapping_source]->(sm), (mp)-[:morphism_mapping_target]->(tm)
+                """,
+                {"fid": functor_id, "smid": source_morph_id, "tmid": target_morph_id}
+            )
+            logger.info(f"Added functor morphism mapping F#{functor_id}: {source_morph_id} -> {target_morph_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add functor morphism mapping: {e}")
+            raise
+
+    def add_functor_morphism_mappings_bulk(self, functor_id: int, mappings: List[Tuple[int, int]]) -> int:
+        """
+        Add many morphism mappings for a functor in a single statement.
+        Pairs whose morphisms are outside the functor's domain/codomain are skipped, as in
+        add_functor_morphism_mapping.
+
+        Args:
+            functor_id: Functor ID
+            mappings: (source_morph_id, target_morph_id) pairs
+
+        Returns:
+            Number of mappings created
+        """
+        mappings = [self._write_through(s, t) for s, t in mappings]
+        try:
+            if not mappings:
+                return 0
+            source_ids = [int(s) for s, _ in mappings]
+            if len(set(source_ids)) != len(source_ids):
+                raise ValueError(f"Batch maps a source morphism more than once under functor {functor_id}")
+
+            # One duplicate check for the whole batch
+            result = self._execute(
+                """
+                MATCH (f:Functor)-[:functor_morphism_mappings]->(:Morphism_Mapping)-[:morphism_mapping_source]->(sm:Morphism)
+                WHERE f.ID = $fid AND sm.ID IN CAST($smids, 'INT64[]')
+                RETURN sm.ID LIMIT 1
+                """,
+                {"fid": functor_id, "smids": source_ids}
+            )
+            query_result = _get_query_result(result)
+            if query_result.has_next():  # type: ignore
+                row = query_result.get_next()  # type: ignore
+                raise ValueError(f"Morphism {row[0]} is already mapped under functor {functor_id}")
+
+            result = self._execute(
                 """
-                MATCH (f:Functor) WHERE f.ID = $fid
-                OPTIONAL MATCH (f)-[:functor_source]->(sc:Category)
-                OPTIONAL MATCH (f)-[:functor_target]->(tc:Category)
-                MATCH (sm:Morphism) WHERE sm.ID = $smid
-                MATCH (tm:Morphism) WHERE tm.ID = $tmid
-                WITH f, sc, tc, sm, tm
-                MATCH (sc)-[:category_morphisms]->(sm)
-                MATCH (tc)-[:category_morphisms]->(tm)
-                CREATE (sm)-[:functor_morphism_map {via_functor_id: $fid}]->(tm)
+                MATCH (f:Functor)-[:functor_source]->(sc:Category), (f)-[:functor_target]->(tc:Category)
+                WHERE f.ID = $fid
+                UNWIND $rows AS row
+                MATCH (sc)-[:category_morphisms]->(sm:Morphism), (tc)-[:category_morphisms]->(tm:Morphism)
+                WHERE sm.ID = row.smid AND tm.ID = row.tmid
+                CREATE (f)-[:functor_morphism_mappings]->(mp:Morphism_Mapping)
+                CREATE (mp)-[:morphism_mapping_source]->(sm), (mp)-[:morphism_mapping_target]->(tm)
+                RETURN count(*)
                 """,
-                {"fid": functor_id, "smid": source_morph_id, "tmid": target_morph_id}
+                {"fid": functor_id, "rows": [{"smid": int(s), "tmid": int(t)} for s, t in mappings]}
             )
-            logger.info(f"Added functor morphism mapping F#{functor_id}: {source_morph_id} -> {target_morph_id}")
-            return True
+            created = _collect_ids(_get_query_result(result))
+            count = created[0] if created else 0
+            logger.info(f"Added {count} functor morphism mappings for F#{functor_id}")
+            return count
         except Exception as e:
-            logger.error(f"Failed to add functor morphism mapping: {e}")
+            logger.error(f"Failed to bulk add functor morphism mappings: {e}")
             raise
 
     def remove_functor_morphism_mapping(self, functor_id: int, source_morph_id: int) -> bool:
         """Remove morphism mapping for a given source morphism under a functor."""
+        (source_morph_id,) = self._write_through(source_morph_id)
         try:
-            self.conn.execute(
+            self._execute(
                 """
-                MATCH (sm:Morphism)-[r:functor_morphism_map]->(:Morphism)
-                WHERE r.via_functor_id = $fid AND sm.ID = $smid
-                DELETE r
+                MATCH (f:Functor)-[:functor_morphism_mappings]->(mp:Morphism_Mapping)-[:morphism_mapping_source]->(sm:Morphism)
+                WHERE f.ID = $fid AND sm.ID = $smid
+                DETACH DELETE mp
                 """,
                 {"fid": functor_id, "smid": source_morph_id}
             )
@@ -742,49 +3066,44 @@ class CategoryDAL:
             logger.error(f"Failed to remove functor morphism mapping: {e}")
             raise
 
-    def get_functor_morphism_mappings(self, functor_id: int) -> List[Dict[str, Any]]:
-        """List morphism mappings for a functor with names/IDs."""
+    def get_functor_morphism_mappings_arrow(self, functor_id: int) -> "pa.Table":
+        """List morphism mappings for a functor as a columnar table."""
         try:
-            result = self.conn.execute(
+            result = self._execute(
                 """
-                MATCH (sm:Morphism)-[r:functor_morphism_map]->(tm:Morphism)
-                WHERE r.via_functor_id = $fid
+                MATCH (f:Functor)-[:functor_morphism_mappings]->(mp:Morphism_Mapping),
+                      (mp)-[:morphism_mapping_source]->(sm:Morphism), (mp)-[:morphism_mapping_target]->(tm:Morphism)
+                WHERE f.ID = $fid
                 OPTIONAL MATCH (sm)-[:morphism_source]->(ss:Object)
                 OPTIONAL MATCH (sm)-[:morphism_target]->(st:Object)
                 OPTIONAL MATCH (tm)-[:morphism_source]->(ts:Object)
                 OPTIONAL MATCH (tm)-[:morphism_target]->(tt:Object)
-                RETURN sm.ID, sm.name, ss.name, st.name, tm.ID, tm.name, ts.name, tt.name
-                ORDER BY sm.name
+                RETURN sm.ID AS source_morphism_id, sm.name AS source_morphism,
+                       ss.ID AS source_from_id, ss.name AS source_from, st.ID AS source_to_id, st.name AS source_to,
+                       tm.ID AS target_morphism_id, tm.name AS target_morphism,
+                       ts.ID AS target_from_id, ts.name AS target_from, tt.ID AS target_to_id, tt.name AS target_to
+                ORDER BY source_morphism
                 """,
                 {"fid": functor_id}
             )
-            qr = _get_query_result(result)
-            mappings: List[Dict[str, Any]] = []
-            while qr.has_next():  # type: ignore
-                row = qr.get_next()  # type: ignore
-                mappings.append({
-                    "source_morphism_id": int(row[0]),
-                    "source_morphism": str(row[1]),
-                    "source_from": str(row[2]) if row[2] is not None else None,
-                    "source_to": str(row[3]) if row[3] is not None else None,
-                    "target_morphism_id": int(row[4]),
-                    "target_morphism": str(row[5]),
-                    "target_from": str(row[6]) if row[6] is not None else None,
-                    "target_to": str(row[7]) if row[7] is not None else None,
-                })
-            return mappings
+            return _get_query_result(result).get_as_arrow()
         except Exception as e:
             logger.error(f"Failed to list functor morphism mappings: {e}")
             raise
 
+    def get_functor_morphism_mappings(self, functor_id: int) -> List[Dict[str, Any]]:
+        """List morphism mappings for a functor with names/IDs."""
+        return self.get_functor_morphism_mappings_arrow(functor_id).to_pylist()
+
     def add_nt_component(self, nt_id: int, at_object_id: int, component_morphism_id: int) -> bool:
         """
         Add a component morphism α_X for natural transformation at object X.
         Enforces that X is in the source category of the linked functors and the morphism is in the target category.
         """
+        at_object_id, component_morphism_id = self._write_through(at_object_id, component_morphism_id)
         try:
             # Create component relationship only if typing holds
-            self.conn.execute(
+            self._execute(
                 """
                 MATCH (nt:Natural_Transformation)-[:nat_trans_source]->(:Functor)-[:functor_source]->(srcCat:Category),
                       (nt)-[:nat_trans_target]->(:Functor)-[:functor_target]->(tgtCat:Category),
@@ -792,7 +3111,8 @@ class CategoryDAL:
                 WHERE nt.ID = $nt_id AND x.ID = $x_id AND m.ID = $m_id
                   AND (srcCat)-[:category_objects]->(x)
                   AND (tgtCat)-[:category_morphisms]->(m)
-                CREATE (nt)-[:nat_trans_components {at_object_id: $x_id}]->(m)
+                CREATE (nt)-[:nat_trans_components]->(cp:Component)
+                CREATE (cp)-[:component_object]->(x), (cp)-[:component_morphism]->(m)
                 """,
                 {"nt_id": nt_id, "x_id": at_object_id, "m_id": component_morphism_id}
             )
@@ -802,14 +3122,71 @@ class CategoryDAL:
             logger.error(f"Failed to add natural transformation component: {e}")
             raise
 
+    def add_nt_components_bulk(self, nt_id: int, components: List[Tuple[int, int]]) -> int:
+        """
+        Add many components α_X for a natural transformation in a single statement.
+        Pairs that are not well-typed are skipped, as in add_nt_component.
+
+        Args:
+            nt_id: Natural transformation ID
+            components: (at_object_id, component_morphism_id) pairs
+
+        Returns:
+            Number of components created
+        """
+        components = [self._write_through(x, m) for x, m in components]
+        try:
+            if not components:
+                return 0
+            object_ids = [int(x) for x, _ in components]
+            if len(set(object_ids)) != len(object_ids):
+                raise ValueError(f"Batch has more than one component at the same object for nt={nt_id}")
+
+            # One duplicate check for the whole batch
+            result = self._execute(
+                """
+                MATCH (nt:Natural_Transformation)-[:nat_trans_components]->(:Component)-[:component_object]->(x:Object)
+                WHERE nt.ID = $nt_id AND x.ID IN CAST($x_ids, 'INT64[]')
+                RETURN x.ID LIMIT 1
+                """,
+                {"nt_id": nt_id, "x_ids": object_ids}
+            )
+            query_result = _get_query_result(result)
+            if query_result.has_next():  # type: ignore
+                row = query_result.get_next()  # type: ignore
+                raise ValueError(f"Natural transformation {nt_id} already has a component at object {row[0]}")
+
+            result = self._execute(
+                """
+                MATCH (nt:Natural_Transformation)-[:nat_trans_source]->(:Functor)-[:functor_source]->(srcCat:Category),
+                      (nt)-[:nat_trans_target]->(:Functor)-[:functor_target]->(tgtCat:Category)
+                WHERE nt.ID = $nt_id
+                UNWIND $rows AS row
+                MATCH (srcCat)-[:category_objects]->(x:Object), (tgtCat)-[:category_morphisms]->(m:Morphism)
+                WHERE x.ID = row.x_id AND m.ID = row.m_id
+                CREATE (nt)-[:nat_trans_components]->(cp:Component)
+                CREATE (cp)-[:component_object]->(x), (cp)-[:component_morphism]->(m)
+                RETURN count(*)
+                """,
+                {"nt_id": nt_id, "rows": [{"x_id": int(x), "m_id": int(m)} for x, m in components]}
+            )
+            created = _collect_ids(_get_query_result(result))
+            count = created[0] if created else 0
+            logger.info(f"Added {count} NT components for nt={nt_id}")
+            return count
+        except Exception as e:
+            logger.error(f"Failed to bulk add natural transformation components: {e}")
+            raise
+
     def remove_nt_component(self, nt_id: int, at_object_id: int) -> bool:
         """Remove component morphism for a specific object X."""
+        (at_object_id,) = self._write_through(at_object_id)
         try:
-            self.conn.execute(
+            self._execute(
                 """
-                MATCH (nt:Natural_Transformation)-[r:nat_trans_components]->(:Morphism)
-                WHERE nt.ID = $nt_id AND r.at_object_id = $x_id
-                DELETE r
+                MATCH (nt:Natural_Transformation)-[:nat_trans_components]->(cp:Component)-[:component_object]->(x:Object)
+                WHERE nt.ID = $nt_id AND x.ID = $x_id
+                DETACH DELETE cp
                 """,
                 {"nt_id": nt_id, "x_id": at_object_id}
             )
@@ -819,49 +3196,481 @@ class CategoryDAL:
             logger.error(f"Failed to remove natural transformation component: {e}")
             raise
 
-    def get_nt_components(self, nt_id: int) -> List[Dict[str, Any]]:
-        """List components α_X for a natural transformation with basic labels."""
+    def get_nt_components_arrow(self, nt_id: int) -> "pa.Table":
+        """
+        List components α_X for a natural transformation as a columnar table.
+        WITH cp fixes the NT's components before the joins, so the planner cannot start from a
+        scan over every component once the table grows.
+        """
         try:
-            result = self.conn.execute(
+            result = self._execute(
                 """
-                MATCH (nt:Natural_Transformation)-[r:nat_trans_components]->(m:Morphism)
+                MATCH (nt:Natural_Transformation)-[:nat_trans_components]->(cp:Component)
+                WHERE nt.ID = $nt_id
+                WITH cp
+                MATCH (cp)-[:component_object]->(x:Object), (cp)-[:component_morphism]->(m:Morphism)
                 OPTIONAL MATCH (m)-[:morphism_source]->(s:Object)
                 OPTIONAL MATCH (m)-[:morphism_target]->(t:Object)
-                WHERE nt.ID = $nt_id
-                RETURN r.at_object_id, m.ID, m.name, s.ID, s.name, t.ID, t.name
-                ORDER BY r.at_object_id
+                RETURN x.ID AS at_object_id, m.ID AS morphism_id, m.name AS morphism_name,
+                       s.ID AS source_object_id, s.name AS source_object,
+                       t.ID AS target_object_id, t.name AS target_object
+                ORDER BY at_object_id
                 """,
                 {"nt_id": nt_id}
             )
-            query_result = _get_query_result(result)
-            components: List[Dict[str, Any]] = []
-            while query_result.has_next():  # type: ignore
-                row = query_result.get_next()  # type: ignore
-                components.append({
-                    "at_object_id": int(row[0]) if row[0] is not None else None,  # type: ignore
-                    "morphism_id": int(row[1]),  # type: ignore
-                    "morphism_name": str(row[2]),  # type: ignore
-                    "source_object_id": int(row[3]) if row[3] is not None else None,  # type: ignore
-                    "source_object": str(row[4]) if row[4] is not None else None,  # type: ignore
-                    "target_object_id": int(row[5]) if row[5] is not None else None,  # type: ignore
-                    "target_object": str(row[6]) if row[6] is not None else None,  # type: ignore
-                })
-            return components
+            return _get_query_result(result).get_as_arrow()
         except Exception as e:
             logger.error(f"Failed to list NT components for nt={nt_id}: {e}")
             raise
 
+    def get_nt_components(self, nt_id: int) -> List[Dict[str, Any]]:
+        """List components α_X for a natural transformation with basic labels."""
+        return self.get_nt_components_arrow(nt_id).to_pylist()
+
+    # Export and import
+    def export_data(self, directory: str, file_format: str = "parquet") -> Dict[str, Any]:
+        """
+        Write every node and relationship table to `directory` with Kuzu's COPY TO, one file per
+        table, plus a manifest with the schema version and row counts. Node files keep their IDs.
+        
+        Args:
+            directory: Output directory (created if missing)
+            file_format: "parquet" (lossless) or "csv"
+            
+        Returns:
+            The manifest
+        """
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{file_format}'; expected one of {sorted(EXPORT_FORMATS)}")
+        if self.transaction_active:
+            raise ValueError("Cannot export inside a transaction")
+        try:
+            out = Path(directory)
+            out.mkdir(parents=True, exist_ok=True)
+            options = EXPORT_FORMATS[file_format]["to"]
+            nodes, rels, ends = _read_table_catalog(self.conn)
+            manifest: Dict[str, Any] = {"format": file_format, "schema_version": self.schema_version,
+                                        "nodes": {}, "rels": {}}
+            
+            # One read-only transaction gives every COPY and count the same snapshot, so writers on
+            # other connections can proceed without tearing the export
+            self.conn.execute("BEGIN TRANSACTION READ ONLY")
+            try:
+                for table, columns in nodes.items():
+                    projection = ", ".join(f"n.`{c}` AS `{c}`" for c, _ in columns)
+                    path = out / f"{table}.{file_format}"
+                    self._execute(f"COPY (MATCH (n:{table}) RETURN {projection} ORDER BY `ID`) TO {_copy_path(path)}{options}")
+                    manifest["nodes"][table] = {"file": path.name, "columns": columns, "rows": self._count_rows(f"(n:{table})")}
+            
+                for table, columns in rels.items():
+                    source, target = ends[table]
+                    projection = ", ".join(["a.ID AS `from`", "b.ID AS `to`"] + [f"r.`{c}` AS `{c}`" for c, _ in columns])
+                    pattern = f"(a:{source})-[r:{table}]->(b:{target})"
+                    path = out / f"{table}.{file_format}"
+                    self._execute(f"COPY (MATCH {pattern} RETURN {projection}) TO {_copy_path(path)}{options}")
+                    manifest["rels"][table] = {"file": path.name, "from": source, "to": target,
+                                               "columns": columns, "rows": self._count_rows(pattern, "r")}
+            finally:
+                self.conn.execute("ROLLBACK")
+            
+            (out / EXPORT_MANIFEST).write_text(json.dumps(manifest, indent=2))
+            logger.info(f"Exported {len(nodes)} node and {len(rels)} relationship tables to {out} as {file_format}")
+            return manifest
+        except Exception as e:
+            logger.error(f"Failed to export to {directory}: {e}")
+            raise
+    
+    def _count_rows(self, pattern: str, variable: str = "n") -> int:
+        """Count the matches of a MATCH pattern."""
+        result = _get_query_result(self._execute(f"MATCH {pattern} RETURN count({variable})"))
+        return int(result.get_next()[0])
+    
+    def import_data(self, directory: str) -> Dict[str, int]:
+        """
+        Load an export written by `export_data` into this database, which must never have held
+        rows, with Kuzu's COPY FROM, preserving entity IDs and therefore all relationships and
+        mappings. A failed import removes the rows it loaded.
+        
+        Args:
+            directory: Directory containing the export and its manifest
+            
+        Returns:
+            Rows imported per table, counted in the database after loading
+        """
+        if self.transaction_active or self.buffer is not None:
+            raise ValueError("Cannot import inside a transaction")
+        try:
+            source_dir = Path(directory)
+            manifest = json.loads((source_dir / EXPORT_MANIFEST).read_text())
+            if manifest["schema_version"] != self.schema_version:
+                raise ValueError(
+                    f"Export is at schema version {manifest['schema_version']} but this database is at "
+                    f"version {self.schema_version}"
+                )
+            nodes, rels, _ = _read_table_catalog(self.conn)
+            unknown = (set(manifest["nodes"]) - set(nodes)) | (set(manifest["rels"]) - set(rels))
+            if unknown:
+                raise ValueError(f"Export contains tables this schema does not have: {sorted(unknown)}")
+            used = self._tables_with_assigned_ids(nodes)
+            if used:
+                raise ValueError(
+                    f"Import requires an empty database that has never held rows; tables {used} have "
+                    f"already assigned IDs, so the imported IDs would not be preserved"
+                )
+            
+            try:
+                imported = self._load_export(source_dir, manifest)
+            except Exception:
+                # COPY FROM cannot run in a transaction, so undo a partial import by hand
+                for table in manifest["nodes"]:
+                    self._execute(f"MATCH (n:{table}) DETACH DELETE n")
+                logger.info("Removed the rows of the failed import")
+                raise
+            
+            self._invalidate_hom_sets()
+            self.compositions.invalidate()
+            self._publish_write()
+            self.search_index.apply([SearchIndex.reset])
+            logger.info(f"Imported {sum(imported.values())} rows from {source_dir}")
+            return imported
+        except Exception as e:
+            logger.error(f"Failed to import from {directory}: {e}")
+            raise
+    
+    def _tables_with_assigned_ids(self, nodes: Dict[str, List[Tuple[str, str]]]) -> List[str]:
+        """
+        Node tables whose SERIAL counter has moved past 0. Deleting rows does not reset the counter,
+        so each table is probed with a node created in a transaction that is rolled back.
+        """
+        used = []
+        self._wait_for_writer(lambda: self.conn.execute("BEGIN TRANSACTION"))
+        try:
+            for table, columns in nodes.items():
+                if ("ID", "SERIAL") in columns:
+                    result = _get_query_result(self.conn.execute(f"CREATE (n:{table}) RETURN n.ID"))
+                    if result.get_next()[0] != 0:
+                        used.append(table)
+        finally:
+            self.conn.execute("ROLLBACK")
+        return used
+    
+    def _load_export(self, source_dir: Path, manifest: Dict[str, Any]) -> Dict[str, int]:
+        """COPY every table of an export and return the rows now in each, raising ValueError unless they match the manifest."""
+        file_format = manifest["format"]
+        options = EXPORT_FORMATS[file_format]["from"]
+        for table, info in manifest["nodes"].items():
+            self._import_node_table(table, source_dir / info["file"], info, file_format)
+        for table, info in manifest["rels"].items():
+            if info["rows"]:
+                self._execute(f"COPY {table} FROM {_copy_path(source_dir / info['file'])}{options}")
+        
+        # Count what actually landed, so a truncated or edited file cannot pass as a full import
+        imported = {table: self._count_rows(f"(n:{table})") for table in manifest["nodes"]}
+        imported.update({table: self._count_rows(f"(a:{info['from']})-[r:{table}]->(b:{info['to']})", "r")
+                         for table, info in manifest["rels"].items()})
+        expected = {table: info["rows"] for kind in ("nodes", "rels") for table, info in manifest[kind].items()}
+        mismatched = {table: (imported[table], rows) for table, rows in expected.items() if imported[table] != rows}
+        if mismatched:
+            raise ValueError(
+                "Imported row counts do not match the manifest (imported, expected): "
+                + ", ".join(f"{table} {counts}" for table, counts in sorted(mismatched.items()))
+            )
+        return imported
+    
+    def _import_node_table(self, table: str, path: Path, info: Dict[str, Any], file_format: str) -> None:
+        """
+        COPY one node table. SERIAL IDs are assigned in file order, so a file whose IDs have gaps
+        (from deletions) is loaded with placeholder rows in the gaps, which are deleted afterwards.
+        """
+        if not info["rows"]:
+            return
+        columns = [c for c, _ in info["columns"] if c != "ID"]
+        column_list = ", ".join(f"`{c}`" for c in columns)
+        source = _load_source(path, info["columns"], file_format)
+        ids = _get_query_result(self._execute(f"{source} RETURN ID")).get_as_arrow()["ID"].to_numpy()
+        # Export writes rows in ID order; rows[i] is the file row holding ID i, or -1 for a gap
+        rows = np.full(int(ids.max()) + 1, -1, dtype=np.int64)
+        rows[ids] = np.arange(len(ids))
+        gaps = np.flatnonzero(rows < 0)
+        
+        if not columns:
+            # Nothing to load but the IDs themselves (mapping and component nodes)
+            self._execute(f"UNWIND range(0, {len(rows) - 1}) AS i CREATE (:{table})")
+        elif len(gaps):
+            self._copy_padded(table, source, path, info, rows)
+        elif file_format == "parquet":
+            self._execute(f"COPY {table}({column_list}) FROM ({source} RETURN {column_list})")
+        else:
+            # CSV cannot tell empty strings from NULL; the DAL always writes strings
+            strings = {c for c, t in info["columns"] if t == "STRING"}
+            projection = ", ".join(f"coalesce(`{c}`, '') AS `{c}`" if c in strings else f"`{c}`" for c in columns)
+            self._execute(f"COPY {table}({column_list}) FROM ({source} RETURN {projection})")
+        
+        if len(gaps):
+            strings = [c for c, t in info["columns"] if t == "STRING"]
+            if strings:
+                # Only placeholders have NULL strings; a scan beats matching the gap IDs one by one
+                self._execute(f"MATCH (n:{table}) WHERE n.`{strings[0]}` IS NULL DELETE n")
+            else:
+                self._execute(f"MATCH (n:{table}) WHERE n.ID IN CAST($ids, 'INT64[]') DELETE n", {"ids": gaps.tolist()})
+    
+    def _copy_padded(self, table: str, source: str, path: Path, info: Dict[str, Any], rows: "np.ndarray") -> None:
+        """COPY a node file with its ID gaps filled by null rows, so SERIAL assigns the original IDs."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+        
+        columns = [c for c, _ in info["columns"] if c != "ID"]
+        column_list = ", ".join(f"`{c}`" for c in columns)
+        data = _get_query_result(self._execute(f"{source} RETURN {column_list}")).get_as_arrow()
+        # CSV reads empty strings back as NULL; the DAL always writes strings
+        for c, t in info["columns"]:
+            if t == "STRING":
+                data = data.set_column(data.schema.get_field_index(c), c, pc.fill_null(data[c], ""))
+        padded = data.take(pa.array(rows, mask=rows < 0))
+        padded_path = path.with_name(f".{table}.padded.parquet")
+        pq.write_table(padded, padded_path)
+        try:
+            self._execute(f"COPY {table}({column_list}) FROM (LOAD FROM {_copy_path(padded_path)} RETURN {column_list})")
+        finally:
+            padded_path.unlink(missing_ok=True)
+    
+    # Snapshots
+    def snapshot(self, path: str) -> None:
+        """
+        Write a consistent copy of the database files to the new directory `path` while other
+        sessions keep reading. The database is checkpointed first, then writes are held back
+        (as by an open transaction) while the files are cloned copy-on-write where the filesystem
+        allows, else copied.
+        
+        Args:
+            path: Snapshot directory; must not exist
+        """
+        if self.transaction_active:
+            raise ValueError("Cannot take a snapshot inside a transaction")
+        target = Path(path)
+        if target.exists():
+            raise ValueError(f"{target} already exists")
+        try:
+            try:
+                self.conn.execute("CHECKPOINT")
+            except RuntimeError as e:
+                # Another session has a transaction open; its committed writes are still in the WAL
+                logger.warning(f"Snapshot without checkpoint: {e}")
+            fence = kuzu.Connection(self.db)
+            try:
+                self._wait_for_writer(lambda: fence.execute("BEGIN TRANSACTION"))
+                try:
+                    _clone_database_files(Path(self.db_path), target)
+                finally:
+                    fence.execute("ROLLBACK")
+            finally:
+                fence.close()
+            logger.info(f"Saved snapshot of {self.db_path} to {target}")
+        except Exception as e:
+            logger.error(f"Failed to take snapshot {path}: {e}")
+            raise
+    
+    def restore(self, path: str) -> None:
+        """
+        Replace the database with a snapshot and reopen it. Only a DAL that opened its own
+        database can restore; for shared databases use `ConnectionManager.restore`.
+        
+        Args:
+            path: Snapshot directory written by `snapshot`
+        """
+        if self.transaction_active:
+            raise ValueError("Cannot restore inside a transaction")
+        if not self._owns_database:
+            raise ValueError("This DAL shares its database; restore through its ConnectionManager")
+        try:
+            self.close()
+            restore_snapshot(path, self.db_path)
+            self._connect(kuzu.Database(self.db_path))
+            self._invalidate_hom_sets()
+            self.compositions.invalidate()
+            self._publish_write()
+            self.search_index.reset()
+            logger.info(f"Restored database from snapshot {path}")
+        except Exception as e:
+            logger.error(f"Failed to restore snapshot {path}: {e}")
+            raise
+    
+    # Statistics
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Count every entity type, and the objects and morphisms of each category, in one query.
+        Only counts are returned; no entity rows are materialized. The counts cover the database
+        (and an open transaction's writes) but not a buffered transaction's queued changes,
+        which may cascade to functors, mappings and components once flushed.
+
+        Returns:
+            Dict with totals (categories, objects, morphisms, functors, natural_transformations,
+            object_mappings, morphism_mappings, components, compositions) and `per_category`,
+            a list of {ID, name, objects, morphisms} ordered by name
+        """
+        try:
+            result = self._execute(
+                """
+                OPTIONAL MATCH (f:Functor) WITH count(f) AS functors
+                OPTIONAL MATCH (n:Natural_Transformation) WITH functors, count(n) AS natural_transformations
+                OPTIONAL MATCH (om:Object_Mapping)
+                WITH functors, natural_transformations, count(om) AS object_mappings
+                OPTIONAL MATCH (mm:Morphism_Mapping)
+                WITH functors, natural_transformations, object_mappings, count(mm) AS morphism_mappings
+                OPTIONAL MATCH (cp:Component)
+                WITH functors, natural_transformations, object_mappings, morphism_mappings, count(cp) AS components
+                OPTIONAL MATCH (cm:Composition)
+                WITH functors, natural_transformations, object_mappings, morphism_mappings, components,
+                     count(cm) AS compositions
+                OPTIONAL MATCH (c:Category)
+                RETURN functors, natural_transformations, object_mappings, morphism_mappings, components,
+                       compositions, c.ID AS ID, c.name AS name,
+                       COUNT { MATCH (c)-[:category_objects]->(:Object) } AS objects,
+                       COUNT { MATCH (c)-[:category_morphisms]->(:Morphism) } AS morphisms
+                ORDER BY name
+                """
+            )
+            rows = _get_query_result(result).get_as_arrow().to_pylist()
+            per_category = [
+                {"ID": row["ID"], "name": row["name"], "objects": row["objects"], "morphisms": row["morphisms"]}
+                for row in rows if row["ID"] is not None
+            ]
+            totals = rows[0]
+            return {
+                "categories": len(per_category),
+                "objects": sum(c["objects"] for c in per_category),
+                "morphisms": sum(c["morphisms"] for c in per_category),
+                "functors": totals["functors"],
+                "natural_transformations": totals["natural_transformations"],
+                "object_mappings": totals["object_mappings"],
+                "morphism_mappings": totals["morphism_mappings"],
+                "components": totals["components"],
+                "compositions": totals["compositions"],
+                "per_category": per_category,
+            }
+        except Exception as e:
+            logger.error(f"Failed to get statistics: {e}")
+            raise
+
+    # Search
+    def search(self, query: str, types: Optional[List[str]] = None, limit: int = 20,
+               category_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Type-ahead search over entity names and descriptions.
+        The in-memory index is built on first use and kept in sync with DAL writes; writes made
+        inside a transaction are indexed when it commits. The queued changes of a buffered
+        transaction are merged into the results.
+        
+        Args:
+            query: Search text; matches name prefixes first, then words of names and descriptions
+            types: Entity types to include, from SearchIndex.TYPES (default: all)
+            limit: Maximum number of results
+            category_id: Only include objects and morphisms of this category
+            
+        Returns:
+            List of dicts with type, ID, name, description and category_id
+        """
+        try:
+            if not self.search_index.built:
+                self._build_search_index()
+            if self.buffer:
+                return self._search_buffered(query, types, limit, category_id)
+            return self.search_index.search(query, types, limit, category_id)
+        except Exception as e:
+            logger.error(f"Failed to search for '{query}': {e}")
+            raise
+    
+    def _search_buffered(self, query: str, types: Optional[List[str]], limit: int,
+                         category_id: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        Search with the buffer's queued changes applied. Queued creates and the new names of
+        renamed entities are matched in a scratch index; indexed entities that are renamed or
+        deleted, directly or with their category or an endpoint, are dropped from the index's
+        results, which are fetched in growing batches until `limit` of them remain.
+        """
+        buffer = self.buffer
+        assert buffer is not None
+        hidden: Set[Tuple[str, int]] = set()
+        entries = []
+        for table in MutationBuffer.TABLES:
+            entries += [{"type": table, "ID": row["ID"], "name": row["name"], "description": row["description"],
+                         "category_id": row.get("category_id")} for row in buffer.creates[table].values()]
+            for entity_id in buffer.updates[table]:
+                entry = self.search_index.get(table, entity_id)
+                if entry is not None:
+                    entries.append(buffer.patch(table, entry))
+            hidden.update((table, entity_id) for entity_id in [*buffer.updates[table], *buffer.deletes[table]])
+        pending = SearchIndex()
+        pending.load(entries)
+        
+        size = limit + len(hidden)
+        while True:
+            indexed = self.search_index.search(query, types, size, category_id)
+            kept = [entry for entry in indexed if (entry["type"], entry["ID"]) not in hidden
+                    and not buffer.is_deleted("Category", entry["category_id"])]
+            morphism_ids = [entry["ID"] for entry in kept if entry["type"] == "Morphism"]
+            if buffer.deletes["Object"] and morphism_ids:
+                result = self._execute(
+                    """MATCH (m:Morphism)-[:morphism_source|morphism_target]->(o:Object)
+                       WHERE m.ID IN CAST($ids, 'INT64[]') AND o.ID IN CAST($objects, 'INT64[]')
+                       RETURN DISTINCT m.ID""",
+                    {"ids": morphism_ids, "objects": sorted(buffer.deletes["Object"])}
+                )
+                orphaned = set(_collect_ids(_get_query_result(result)))
+                kept = [entry for entry in kept if entry["type"] != "Morphism" or entry["ID"] not in orphaned]
+            if len(kept) >= limit or len(indexed) < size:
+                break
+            size *= 2
+        
+        text = query.strip().lower()
+        merged = kept + pending.search(query, types, limit, category_id)
+        merged.sort(key=lambda entry: (not (entry["name"] or "").lower().startswith(text),
+                                       (entry["name"] or "").lower(), entry["type"], entry["ID"]))
+        return merged[:limit]
+    
+    def _build_search_index(self) -> None:
+        """
+        Load every entity into the search index. Runs on its own connection so that an open
+        transaction's uncommitted writes are not indexed, and holds the index lock so that
+        writes committed meanwhile are applied after the load.
+        """
+        queries = {
+            "Category": "MATCH (e:Category) RETURN e.ID AS ID, e.name AS name, e.description AS description, NULL AS category_id",
+            "Object": """MATCH (c:Category)-[:category_objects]->(e:Object)
+                         RETURN e.ID AS ID, e.name AS name, e.description AS description, c.ID AS category_id""",
+            "Morphism": """MATCH (c:Category)-[:category_morphisms]->(e:Morphism)
+                           RETURN e.ID AS ID, e.name AS name, e.description AS description, c.ID AS category_id""",
+            "Functor": "MATCH (e:Functor) RETURN e.ID AS ID, e.name AS name, e.description AS description, NULL AS category_id",
+            "Natural_Transformation": """MATCH (e:Natural_Transformation)
+                                         RETURN e.ID AS ID, e.name AS name, e.description AS description, NULL AS category_id""",
+        }
+        with self.search_index._lock:
+            if self.search_index.built:
+                return
+            entries = []
+            conn = kuzu.Connection(self.db)
+            try:
+                for entity_type, query in queries.items():
+                    for row in _get_query_result(conn.execute(query)).get_as_arrow().to_pylist():
+                        row["type"] = entity_type
+                        entries.append(row)
+            finally:
+                conn.close()
+            self.search_index.load(entries)
+            logger.info(f"Built search index with {len(entries)} entities")
+    
     def validate_nt_structure(self, nt_id: int) -> List[str]:
         """Validate that components are well-typed relative to linked functors' domain/codomain."""
         errors: List[str] = []
         try:
             # Retrieve linked functors and categories
-            result = self.conn.execute(
+            result = self._execute(
                 """
                 MATCH (nt:Natural_Transformation)
+                WHERE nt.ID = $nt_id
                 OPTIONAL MATCH (nt)-[:nat_trans_source]->(sf:Functor)-[:functor_source]->(srcCat:Category)
                 OPTIONAL MATCH (nt)-[:nat_trans_target]->(tf:Functor)-[:functor_target]->(tgtCat:Category)
-                WHERE nt.ID = $nt_id
                 RETURN srcCat.ID, tgtCat.ID
                 """,
                 {"nt_id": nt_id}
@@ -877,15 +3686,17 @@ class CategoryDAL:
                 return errors
 
             # Check every component typing with categories
-            result2 = self.conn.execute(
+            result2 = self._execute(
                 """
-                MATCH (nt:Natural_Transformation)-[r:nat_trans_components]->(m:Morphism)
+                MATCH (nt:Natural_Transformation)-[:nat_trans_components]->(cp:Component)
                 WHERE nt.ID = $nt_id
-                OPTIONAL MATCH (srcCat:Category)-[:category_objects]->(x:Object)
-                WHERE srcCat.ID = $src_cat AND x.ID = r.at_object_id
+                WITH cp
+                MATCH (cp)-[:component_object]->(x:Object), (cp)-[:component_morphism]->(m:Morphism)
+                OPTIONAL MATCH (srcCat:Category)-[:category_objects]->(x)
+                WHERE srcCat.ID = $src_cat
                 OPTIONAL MATCH (tgtCat:Category)-[:category_morphisms]->(m)
                 WHERE tgtCat.ID = $tgt_cat
-                RETURN r.at_object_id IS NULL AS badX, m.ID IS NULL AS badM, r.at_object_id
+                RETURN srcCat.ID IS NULL AS badX, tgtCat.ID IS NULL AS badM, x.ID
                 """,
                 {"nt_id": nt_id, "src_cat": src_cat_id, "tgt_cat": tgt_cat_id}
             )
@@ -911,17 +3722,19 @@ class CategoryDAL:
         mappings F(f), G(f) exist, verify the square is well-typed:
         G(f) ∘ α_X and α_Y ∘ F(f) are both F(X) → G(Y). Equality is not provable in this schema;
         we report shape compatibility and missing data.
+        Mappings, components and morphisms are each fetched in one query and the squares are
+        checked in memory by object ID.
         """
         messages: List[str] = []
         try:
             # Get linked functors and their categories
-            res = self.conn.execute(
+            res = self._execute(
                 """
                 MATCH (nt:Natural_Transformation)
+                WHERE nt.ID = $nt_id
                 OPTIONAL MATCH (nt)-[:nat_trans_source]->(F:Functor)-[:functor_source]->(C:Category)
                 OPTIONAL MATCH (nt)-[:nat_trans_source]->(F)-[:functor_target]->(D1:Category)
                 OPTIONAL MATCH (nt)-[:nat_trans_target]->(G:Functor)-[:functor_target]->(D2:Category)
-                WHERE nt.ID = $nt_id
                 RETURN F.ID, G.ID, C.ID, D1.ID, D2.ID
                 """,
                 {"nt_id": nt_id}
@@ -939,23 +3752,44 @@ class CategoryDAL:
                 return ["Missing linked functors or categories; cannot check naturality"]
             if int(D1_id) != int(D2_id):
                 return ["Functor codomains differ; naturality undefined"]
-            D_id = int(D1_id)
             F_id = int(F_id)
             G_id = int(G_id)
             C_id = int(C_id)
 
+            # F(f) and G(f) for every mapped f, as (source, target) object IDs
+            res_maps = self._execute(
+                """
+                MATCH (fn:Functor)-[:functor_morphism_mappings]->(mp:Morphism_Mapping),
+                      (mp)-[:morphism_mapping_source]->(sm:Morphism), (mp)-[:morphism_mapping_target]->(tm:Morphism)
+                WHERE fn.ID = $fid OR fn.ID = $gid
+                OPTIONAL MATCH (tm)-[:morphism_source]->(tms:Object)
+                OPTIONAL MATCH (tm)-[:morphism_target]->(tmt:Object)
+                RETURN fn.ID, sm.ID, tms.ID, tmt.ID
+                """,
+                {"fid": F_id, "gid": G_id}
+            )
+            F_of: Dict[int, Tuple[Any, Any]] = {}
+            G_of: Dict[int, Tuple[Any, Any]] = {}
+            qr_maps = _get_query_result(res_maps)
+            while qr_maps.has_next():  # type: ignore
+                via, sm_id, tm_src, tm_tgt = qr_maps.get_next()  # type: ignore
+                if via == F_id:
+                    F_of[int(sm_id)] = (tm_src, tm_tgt)
+                if via == G_id:
+                    G_of[int(sm_id)] = (tm_src, tm_tgt)
+
             # Build maps of α components by object ID
             comps = self.get_nt_components(nt_id)
             alpha_by_X = {c["at_object_id"]: c for c in comps if c.get("at_object_id") is not None}
 
             # Iterate morphisms f: X->Y in C
-            res2 = self.conn.execute(
+            res2 = self._execute(
                 """
                 MATCH (c:Category)-[:category_morphisms]->(f:Morphism)
                 WHERE c.ID = $cid
                 OPTIONAL MATCH (f)-[:morphism_source]->(x:Object)
                 OPTIONAL MATCH (f)-[:morphism_target]->(y:Object)
-                RETURN f.ID, f.name, x.ID, x.name, y.ID, y.name
+                RETURN f.ID, f.name, x.ID, y.ID
                 """,
                 {"cid": C_id}
             )
@@ -965,62 +3799,33 @@ class CategoryDAL:
                 f_id = int(r[0])
                 f_name = str(r[1])
                 X_id = r[2]
-                X_name = r[3]
-                Y_id = r[4]
-                Y_name = r[5]
+                Y_id = r[3]
                 if X_id is None or Y_id is None:
                     continue
-                X_id = int(X_id)
-                Y_id = int(Y_id)
 
                 # Need α_X and α_Y
-                aX = alpha_by_X.get(X_id)
-                aY = alpha_by_X.get(Y_id)
+                aX = alpha_by_X.get(int(X_id))
+                aY = alpha_by_X.get(int(Y_id))
                 if aX is None or aY is None:
                     messages.append(f"Skipping f={f_name}: missing α_X or α_Y")
                     continue
 
-                # Retrieve F(f) and G(f)
-                resF = self.conn.execute(
-                    """
-                    MATCH (sm:Morphism)-[r:functor_morphism_map]->(tm:Morphism)
-                    WHERE r.via_functor_id = $fid AND sm.ID = $smid
-                    OPTIONAL MATCH (tm)-[:morphism_source]->(tms:Object)
-                    OPTIONAL MATCH (tm)-[:morphism_target]->(tmt:Object)
-                    RETURN tm.ID, tm.name, tms.name, tmt.name
-                    """,
-                    {"fid": F_id, "smid": f_id}
-                )
-                resG = self.conn.execute(
-                    """
-                    MATCH (sm:Morphism)-[r:functor_morphism_map]->(tm:Morphism)
-                    WHERE r.via_functor_id = $gid AND sm.ID = $smid
-                    OPTIONAL MATCH (tm)-[:morphism_source]->(tms:Object)
-                    OPTIONAL MATCH (tm)-[:morphism_target]->(tmt:Object)
-                    RETURN tm.ID, tm.name, tms.name, tmt.name
-                    """,
-                    {"gid": G_id, "smid": f_id}
-                )
-                qF = _get_query_result(resF)
-                qG = _get_query_result(resG)
-                if not qF.has_next() or not qG.has_next():  # type: ignore
+                # Need F(f) and G(f)
+                if f_id not in F_of or f_id not in G_of:
                     messages.append(f"Skipping f={f_name}: missing F(f) or G(f) mapping")
                     continue
-                Ff = qF.get_next()  # type: ignore
-                Gf = qG.get_next()  # type: ignore
-                Ff_src, Ff_tgt = Ff[2], Ff[3]
-                Gf_src, Gf_tgt = Gf[2], Gf[3]
+                Ff_src, Ff_tgt = F_of[f_id]
+                Gf_src, Gf_tgt = G_of[f_id]
 
                 # We can only check shape compatibility of the square
                 # α_X: F(X) -> G(X)
                 # α_Y: F(Y) -> G(Y)
                 # G(f): G(X) -> G(Y)
                 # F(f): F(X) -> F(Y)
-                # For shape, need labels for α_X and α_Y
-                aX_src = aX.get("source_object")
-                aX_tgt = aX.get("target_object")
-                aY_src = aY.get("source_object")
-                aY_tgt = aY.get("target_object")
+                aX_src = aX.get("source_object_id")
+                aX_tgt = aX.get("target_object_id")
+                aY_src = aY.get("source_object_id")
+                aY_tgt = aY.get("target_object_id")
                 shape_ok = (Gf_src == aX_tgt) and (Gf_tgt == aY_tgt) and (aY_src == Ff_tgt) and (aX_src == Ff_src)
                 if shape_ok:
                     messages.append(f"Square for f={f_name} is well-typed (cannot prove equality)")
@@ -1047,7 +3852,7 @@ class CategoryDAL:
         errors = []
         try:
             # Check that all objects have identity morphisms
-            result = self.conn.execute(
+            result = self._execute(
                 """MATCH (c:Category)-[:category_objects]->(o:Object)
                    WHERE c.ID = $id
                    OPTIONAL MATCH (c)-[:category_morphisms]->(m:Morphism)
@@ -1067,3 +3872,378 @@ class CategoryDAL:
         except Exception as e:
             logger.error(f"Failed to validate category {category_id}: {e}")
             return [f"Validation failed: {e}"]
+    
+    def validate_category_laws(self, category_id: int, max_errors: int = 100) -> List[str]:
+        """
+        Validate the category laws against the composition table: identities,
+        closure of composition, left/right identity and associativity.
+        
+        Args:
+            category_id: Category ID to validate
+            max_errors: Maximum number of messages reported per law
+            
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        errors: List[str] = []
+        
+        def report(law: str, messages: List[str], total: int) -> None:
+            errors.extend(messages[:max_errors])
+            if total > max_errors:
+                errors.append(f"... and {total - max_errors} more {law} violations")
+        
+        try:
+            result = self._execute(
+                """MATCH (c:Category)-[:category_morphisms]->(f:Morphism)<-[:composition_first]-(cp:Composition),
+                         (cp)-[:composition_second]->(g:Morphism), (cp)-[:composition_result]->(h:Morphism)
+                   WHERE c.ID = $id
+                   RETURN f.ID AS f_id, g.ID AS g_id, h.ID AS composite_id""",
+                {"id": category_id}
+            )
+            matrix = CompositionMatrix(
+                self.get_morphisms_in_category_arrow(category_id),
+                self.get_objects_in_category_arrow(category_id),
+                _get_query_result(result).get_as_arrow(),
+            )
+            name = matrix.name
+            
+            # Identities: exactly one per object, and each one an endomorphism
+            ids = np.flatnonzero(matrix.is_identity)
+            bad = ids[matrix.source[ids] != matrix.target[ids]]
+            report("identity", [f"Identity morphism '{name(i)}' is not an endomorphism" for i in bad], len(bad))
+            ids = ids[matrix.source[ids] == matrix.target[ids]]
+            counts = np.bincount(matrix.source[ids], minlength=matrix.n_objects)
+            missing = np.flatnonzero(counts == 0)
+            report("identity", [f"Object '{matrix.object_names[o]}' missing identity morphism" for o in missing],
+                   len(missing))
+            repeated = np.flatnonzero(counts > 1)
+            report("identity", [f"Object '{matrix.object_names[o]}' has {counts[o]} identity morphisms"
+                                for o in repeated], len(repeated))
+            
+            # Recorded composites must stay inside the category and be well-typed
+            f_bad, g_bad = matrix.foreign
+            report("closure", [f"Composite of '{name(g)}' ∘ '{name(f)}' is not in the category"
+                               for f, g in zip(f_bad, g_bad)], len(f_bad))
+            
+            # Closure and identity laws over every composable pair (f, g)
+            f, g = matrix.composable_after(np.arange(matrix.n))
+            gf = matrix.compose(f, g)
+            missing = np.flatnonzero(gf < 0)
+            report("closure", [f"No composite recorded for '{name(g[k])}' ∘ '{name(f[k])}'" for k in missing],
+                   len(missing))
+            known = gf >= 0
+            ill_typed = np.flatnonzero(known & ((matrix.source[np.maximum(gf, 0)] != matrix.source[f]) |
+                                                (matrix.target[np.maximum(gf, 0)] != matrix.target[g])))
+            report("closure", [f"Composite '{name(gf[k])}' of '{name(g[k])}' ∘ '{name(f[k])}' has the wrong "
+                               f"source or target" for k in ill_typed], len(ill_typed))
+            left = np.flatnonzero(known & matrix.is_identity[g] & (gf != f))
+            report("left identity", [f"Left identity law fails: '{name(g[k])}' ∘ '{name(f[k])}' = "
+                                     f"'{name(gf[k])}'" for k in left], len(left))
+            right = np.flatnonzero(known & matrix.is_identity[f] & (gf != g))
+            report("right identity", [f"Right identity law fails: '{name(g[k])}' ∘ '{name(f[k])}' = "
+                                      f"'{name(gf[k])}'" for k in right], len(right))
+            
+            # Associativity over every composable triple (f, g, h), in chunks of pairs
+            pairs = np.flatnonzero(known)
+            violations: List[str] = []
+            total = 0
+            for start in range(0, len(pairs), 65_536):
+                chunk = pairs[start:start + 65_536]
+                j, h = matrix.composable_after(g[chunk])
+                p = chunk[j]
+                hg = matrix.compose(g[p], h)
+                lhs = matrix.compose(gf[p], h)                         # h ∘ (g ∘ f)
+                rhs = matrix.compose(f[p], np.where(hg >= 0, hg, 0))   # (h ∘ g) ∘ f
+                fails = np.flatnonzero((hg >= 0) & (lhs >= 0) & (rhs >= 0) & (lhs != rhs))
+                total += len(fails)
+                for k in fails[:max(0, max_errors - len(violations))]:
+                    violations.append(
+                        f"Associativity fails for '{name(h[k])}' ∘ '{name(g[p[k]])}' ∘ '{name(f[p[k]])}': "
+                        f"'{name(lhs[k])}' ≠ '{name(rhs[k])}'"
+                    )
+            report("associativity", violations, total)
+            
+            logger.info(f"Validated category laws for {category_id}: {len(errors)} issue(s)")
+            return errors
+        except Exception as e:
+            logger.error(f"Failed to validate category laws for {category_id}: {e}")
+            return [f"Validation failed: {e}"]
+
+
+class ConnectionManager:
+    """
+    Hands out one CategoryDAL per session over a single shared Database.
+    Each session has its own Connection, prepared statements, transaction state and caches;
+    committed writes invalidate the other sessions' caches through a shared WriteClock and
+    update the shared SearchIndex. Category, functor and natural transformation listings are
+    shared through one ReadCache.
+    Kuzu admits one write transaction at a time, so a session's writes wait (up to
+    `write_timeout`) while another session holds an open transaction. The sessions' `fan_out`
+    calls share one ReadPool.
+    """
+
+    def __init__(self, db_path: str = "./kuzu_db", write_timeout: float = 10.0,
+                 read_pool_size: Optional[int] = None):
+        """
+        Open the database and run pending schema migrations once.
+        
+        Args:
+            db_path: Path to the Kuzu database directory
+            write_timeout: Seconds a session's write waits for another session's transaction
+            read_pool_size: Read connections shared by all sessions' fan_out calls
+                (default: CPU count, at most 8)
+        """
+        self.db_path = db_path
+        self.db = kuzu.Database(db_path)
+        self.schema_version = _migrate_database(self.db)
+        self.write_clock = WriteClock()
+        self.search_index = SearchIndex()
+        self.read_cache = ReadCache()
+        self.write_timeout = write_timeout
+        self.read_pool = ReadPool(read_pool_size if read_pool_size is not None else min(8, os.cpu_count() or 1))
+        self._sessions: Dict[str, CategoryDAL] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> CategoryDAL:
+        """Return the DAL of a session, opening a connection for it on first use."""
+        with self._lock:
+            dal = self._sessions.get(session_id)
+            if dal is None:
+                dal = CategoryDAL(self.db_path, database=self.db, write_clock=self.write_clock,
+                                  write_timeout=self.write_timeout, search_index=self.search_index,
+                                  read_cache=self.read_cache, schema_version=self.schema_version,
+                                  read_pool=self.read_pool)
+                self._sessions[session_id] = dal
+                logger.info(f"Opened connection for session {session_id}")
+            return dal
+
+    def release(self, session_id: str) -> None:
+        """Close a session, rolling back its open transaction so other sessions can write."""
+        with self._lock:
+            dal = self._sessions.pop(session_id, None)
+        if dal is not None:
+            dal.close()
+            logger.info(f"Released connection for session {session_id}")
+
+    def release_inactive(self, is_active: Callable[[str], bool]) -> int:
+        """
+        Release every session for which `is_active` returns False.
+        
+        Returns:
+            Number of sessions released
+        """
+        with self._lock:
+            inactive = [session_id for session_id in self._sessions if not is_active(session_id)]
+        for session_id in inactive:
+            self.release(session_id)
+        return len(inactive)
+
+    def snapshot(self, snapshot_path: str) -> None:
+        """
+        Write a snapshot of the shared database while the sessions keep running; see
+        `CategoryDAL.snapshot`. The database directory is locked by this process, so this
+        (not a second process) is how a running app takes snapshots.
+        
+        Args:
+            snapshot_path: Snapshot directory; must not exist
+        """
+        dal = CategoryDAL(self.db_path, database=self.db, write_clock=self.write_clock,
+                          write_timeout=self.write_timeout, read_pool_size=0, search_index=self.search_index,
+                          read_cache=self.read_cache, schema_version=self.schema_version)
+        try:
+            dal.snapshot(snapshot_path)
+        finally:
+            dal.close()
+
+    def restore(self, snapshot_path: str) -> None:
+        """
+        Release every session, replace the database with a snapshot and reopen it.
+        Sessions reconnect on their next `get`.
+        
+        Args:
+            snapshot_path: Snapshot directory written by `CategoryDAL.snapshot`
+        """
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+            for dal in sessions:
+                dal.close()
+            self.read_pool.close()  # its readers are connected to the old database
+            self.db.close()
+            restore_snapshot(snapshot_path, self.db_path)
+            self.db = kuzu.Database(self.db_path)
+            self.schema_version = _migrate_database(self.db)
+            self.write_clock.advance(self.write_clock.value)
+            self.search_index.reset()
+        logger.info(f"Restored {self.db_path} from snapshot {snapshot_path}; released {len(sessions)} sessions")
+
+    def close(self) -> None:
+        """Release every session, stop the shared read pool and close the database."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for dal in sessions:
+            dal.close()
+        self.read_pool.close()
+        self.db.close()
+
+    def session_ids(self) -> List[str]:
+        """Return the IDs of the open sessions."""
+        with self._lock:
+            return list(self._sessions)
+
+
+class _AsyncDispatch(ABC):
+    """Base for the asyncio facades; each public CategoryDAL method gets an async twin that calls `_call`."""
+
+    @abstractmethod
+    async def _call(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        """Run the CategoryDAL method `name` with the given arguments and return its result."""
+
+
+# CategoryDAL methods that manage connection or transaction state, return lazy generators
+# (use page_* instead), or need a DAL that owns its database (restore), and are not mirrored as coroutines
+_SYNC_ONLY_METHODS = {"begin_transaction", "commit_transaction", "rollback_transaction", "close", "fan_out",
+                      "restore"}
+_SYNC_ONLY_PREFIXES = ("iter_",)
+
+
+def _async_method(name: str) -> Callable[..., Any]:
+    """Build the coroutine that dispatches `name` through `_call`."""
+    @functools.wraps(getattr(CategoryDAL, name))
+    async def method(self: _AsyncDispatch, *args: Any, **kwargs: Any) -> Any:
+        return await self._call(name, args, kwargs)
+    return method
+
+
+for _name, _member in list(vars(CategoryDAL).items()):
+    if (callable(_member) and not _name.startswith(("_",) + _SYNC_ONLY_PREFIXES)
+            and _name not in _SYNC_ONLY_METHODS):
+        setattr(_AsyncDispatch, _name, _async_method(_name))
+
+
+class AsyncCategoryDAL(_AsyncDispatch):
+    """
+    Asyncio facade over CategoryDAL. Every public DAL method is a coroutine that runs on a
+    bounded thread pool, each worker with its own connection over one shared Database, so
+    independent calls can be awaited together with asyncio.gather without blocking the loop.
+    At most `max_pending` calls are queued or running; further callers wait for a slot.
+    """
+
+    def __init__(self, db_path: str = "./kuzu_db", pool_size: int = 4, max_pending: int = 64,
+                 write_timeout: float = 10.0):
+        """
+        Open the database and run pending schema migrations.
+        
+        Args:
+            db_path: Path to the Kuzu database directory
+            pool_size: Number of worker threads, each with its own connection
+            max_pending: Maximum calls queued or running before callers wait
+            write_timeout: Seconds a write waits for another connection's transaction
+        """
+        self.db_path = db_path
+        self.db = kuzu.Database(db_path)
+        self.schema_version = _migrate_database(self.db)
+        self.write_clock = WriteClock()
+        self.search_index = SearchIndex()
+        self.read_cache = ReadCache()
+        self.write_timeout = write_timeout
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="kuzu-async")
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._local = threading.local()
+        self._dals: List[CategoryDAL] = []
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> "AsyncCategoryDAL":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _open_dal(self) -> CategoryDAL:
+        """Open a DAL on a new connection to the shared database."""
+        dal = CategoryDAL(self.db_path, database=self.db, write_clock=self.write_clock,
+                          write_timeout=self.write_timeout, read_pool_size=0, search_index=self.search_index,
+                          read_cache=self.read_cache, schema_version=self.schema_version)
+        with self._lock:
+            self._dals.append(dal)
+        return dal
+
+    def _close_dal(self, dal: CategoryDAL) -> None:
+        """Close a DAL opened by `_open_dal`."""
+        with self._lock:
+            self._dals.remove(dal)
+        dal.close()
+
+    def _run(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        """Run a DAL method on this worker thread's connection."""
+        dal = getattr(self._local, "dal", None)
+        if dal is None:
+            dal = self._local.dal = self._open_dal()
+        return getattr(dal, name)(*args, **kwargs)
+
+    async def _call(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(self._run, name, args, kwargs))
+
+    def transaction(self) -> "AsyncTransaction":
+        """
+        Open a transaction on a dedicated connection. Commits when the block exits normally
+        and rolls back on an exception:
+        
+            async with adal.transaction() as tx:
+                cat_id = await tx.create_category("C")
+        """
+        return AsyncTransaction(self)
+
+    async def aclose(self) -> None:
+        """Roll back open transactions, close the connections and stop the worker threads."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        with self._lock:
+            dals, self._dals = self._dals, []
+        for dal in dals:
+            dal.close()
+
+
+class AsyncTransaction(_AsyncDispatch):
+    """
+    A transaction pinned to one connection and one worker thread, so its calls run in order
+    and never queue behind pool calls that are waiting for its write lock.
+    """
+
+    def __init__(self, owner: AsyncCategoryDAL):
+        self._owner = owner
+        self._dal: Optional[CategoryDAL] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> "AsyncTransaction":
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kuzu-transaction")
+
+        def begin() -> CategoryDAL:
+            dal = self._owner._open_dal()
+            dal.begin_transaction()
+            return dal
+        self._dal = await self._in_thread(begin)
+        return self
+
+    async def __aexit__(self, exc_type: Any, *exc_info: Any) -> None:
+        dal, self._dal = self._dal, None
+        try:
+            if dal is not None:
+                try:
+                    await self._in_thread(dal.commit_transaction if exc_type is None else dal.rollback_transaction)
+                finally:
+                    self._owner._close_dal(dal)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def _in_thread(self, run: Callable[[], Any]) -> Any:
+        """Run a blocking call on the transaction's worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+
+    async def _call(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        if self._dal is None:
+            raise RuntimeError("Transaction is not open; use 'async with adal.transaction() as tx'")
+        return await self._in_thread(functools.partial(getattr(self._dal, name), *args, **kwargs))
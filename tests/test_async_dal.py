@@ -0,0 +1,108 @@
+import asyncio
+import inspect
+import threading
+
+import pytest
+
+from kuzu_DAL import AsyncCategoryDAL, CategoryDAL
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncCategoryDAL:
+    """Test the asyncio facade over the DAL."""
+
+    def test_public_methods_are_coroutines(self):
+        for name in ("create_category", "get_objects_in_category", "add_functor_object_mappings_bulk",
+                     "validate_naturality", "get_hom_set", "list_functors_arrow"):
+            assert inspect.iscoroutinefunction(getattr(AsyncCategoryDAL, name))
+        assert AsyncCategoryDAL.create_category.__doc__ == CategoryDAL.create_category.__doc__
+        assert not hasattr(AsyncCategoryDAL, "begin_transaction")
+        assert not hasattr(AsyncCategoryDAL, "restore")
+
+    def test_gather_independent_calls(self, temp_db_path):
+        async def scenario():
+            async with AsyncCategoryDAL(temp_db_path, pool_size=3) as adal:
+                cat_ids = await asyncio.gather(*(adal.create_category(f"C{i}") for i in range(5)))
+                await asyncio.gather(*(
+                    adal.create_objects_bulk(cat_id, [{"name": f"O{j}"} for j in range(i + 1)])
+                    for i, cat_id in enumerate(cat_ids)
+                ))
+                objects = await asyncio.gather(*(adal.get_objects_in_category(c) for c in cat_ids))
+                return [len(objs) for objs in objects]
+
+        assert run(scenario()) == [1, 2, 3, 4, 5]
+
+    def test_calls_do_not_block_the_event_loop(self, temp_db_path):
+        async def scenario():
+            async with AsyncCategoryDAL(temp_db_path) as adal:
+                loop_thread = threading.get_ident()
+                seen = []
+
+                async def ticker():
+                    for _ in range(3):
+                        seen.append(threading.get_ident())
+                        await asyncio.sleep(0)
+                await asyncio.gather(adal.list_categories(), ticker())
+                return loop_thread, seen
+
+        loop_thread, seen = run(scenario())
+        assert seen == [loop_thread] * 3
+
+    def test_backpressure_limits_pending_calls(self, temp_db_path):
+        async def scenario():
+            async with AsyncCategoryDAL(temp_db_path, pool_size=2, max_pending=3) as adal:
+                results = await asyncio.gather(*(adal.list_categories() for _ in range(20)))
+                return results, adal._slots._value
+
+        results, free_slots = run(scenario())
+        assert results == [[]] * 20
+        assert free_slots == 3
+
+    def test_transaction_commits_and_rolls_back(self, temp_db_path):
+        async def scenario():
+            async with AsyncCategoryDAL(temp_db_path) as adal:
+                async with adal.transaction() as tx:
+                    cat_id = await tx.create_category("Kept")
+                    await asyncio.gather(tx.create_object("A", cat_id), tx.create_object("B", cat_id))
+                    # Not yet visible to the pool's connections
+                    assert await adal.list_categories() == []
+
+                with pytest.raises(ValueError):
+                    async with adal.transaction() as tx:
+                        await tx.create_category("Dropped")
+                        raise ValueError("abort")
+
+                return await adal.list_categories(), await adal.get_objects_in_category(cat_id)
+
+        categories, objects = run(scenario())
+        assert [c["name"] for c in categories] == ["Kept"]
+        assert {o["name"] for o in objects} == {"A", "B"}
+
+    def test_failed_commit_closes_the_transaction_connection(self, temp_db_path, monkeypatch):
+        def fail(dal):
+            raise RuntimeError("commit failed")
+
+        async def scenario():
+            async with AsyncCategoryDAL(temp_db_path) as adal:
+                monkeypatch.setattr(CategoryDAL, "commit_transaction", fail)
+                with pytest.raises(RuntimeError, match="commit failed"):
+                    async with adal.transaction() as tx:
+                        await tx.create_category("Lost")
+                monkeypatch.undo()
+                return list(adal._dals), await adal.list_categories()
+
+        dals, categories = run(scenario())
+        assert dals == []
+        assert categories == []
+
+    def test_errors_propagate(self, temp_db_path):
+        async def scenario():
+            async with AsyncCategoryDAL(temp_db_path) as adal:
+                await adal.create_category("C")
+                await adal.create_category("C")
+
+        with pytest.raises(ValueError, match="already exists"):
+            run(scenario())
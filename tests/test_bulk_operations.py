@@ -0,0 +1,220 @@
+import pytest
+
+from kuzu_DAL import CategoryDAL
+
+
+class TestBulkCreation:
+    """Test batch creation of objects and morphisms."""
+
+    def test_create_objects_bulk_returns_ids_in_order(self, dal: CategoryDAL):
+        cat_id = dal.create_category("BulkCat", "bulk objects")
+        rows = [{"name": f"O{i}", "description": f"Object {i}"} for i in range(20)]
+
+        ids = dal.create_objects_bulk(cat_id, rows)
+
+        assert len(ids) == 20
+        for i, obj_id in enumerate(ids):
+            obj = dal.get_object(obj_id)
+            assert obj["name"] == f"O{i}"
+            assert obj["description"] == f"Object {i}"
+        assert len(dal.get_objects_in_category(cat_id)) == 20
+
+    def test_create_objects_bulk_duplicate_check(self, dal: CategoryDAL):
+        cat_id = dal.create_category("BulkDupCat")
+        dal.create_object("A", cat_id)
+
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_objects_bulk(cat_id, [{"name": "B"}, {"name": "A"}])
+        with pytest.raises(ValueError, match="more than once"):
+            dal.create_objects_bulk(cat_id, [{"name": "C"}, {"name": "C"}])
+
+        # Nothing from the rejected batches was written
+        assert [o["name"] for o in dal.get_objects_in_category(cat_id)] == ["A"]
+
+    def test_create_objects_bulk_empty(self, dal: CategoryDAL):
+        cat_id = dal.create_category("EmptyBulk")
+        assert dal.create_objects_bulk(cat_id, []) == []
+
+    def test_create_morphisms_bulk(self, dal: CategoryDAL):
+        cat_id = dal.create_category("BulkMorphCat")
+        a, b, c = dal.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}, {"name": "C"}])
+
+        ids = dal.create_morphisms_bulk(cat_id, [
+            {"name": "g", "source_id": b, "target_id": c},
+            {"name": "f", "source_id": a, "target_id": b, "description": "f: A->B"},
+            {"name": "id_A", "source_id": a, "target_id": a, "is_identity": True},
+        ])
+
+        assert len(ids) == 3
+        morphisms = {m["ID"]: m for m in dal.get_morphisms_in_category(cat_id)}
+        assert morphisms[ids[0]]["name"] == "g"
+        assert (morphisms[ids[0]]["source_object"], morphisms[ids[0]]["target_object"]) == ("B", "C")
+        assert morphisms[ids[1]]["description"] == "f: A->B"
+        assert morphisms[ids[2]]["is_identity"] is True
+
+    def test_create_morphisms_bulk_rejects_foreign_endpoints(self, dal: CategoryDAL):
+        cat_id = dal.create_category("BulkMorphCat2")
+        other_id = dal.create_category("Elsewhere")
+        a = dal.create_object("A", cat_id)
+        z = dal.create_object("Z", other_id)
+
+        with pytest.raises(ValueError, match="not in category"):
+            dal.create_morphisms_bulk(cat_id, [{"name": "f", "source_id": a, "target_id": z}])
+        assert dal.get_morphisms_in_category(cat_id) == []
+
+    def test_create_morphisms_bulk_many_endpoints(self, dal: CategoryDAL):
+        cat_id = dal.create_category("BulkMorphWide")
+        objs = dal.create_objects_bulk(cat_id, [{"name": f"O{i}"} for i in range(1000)])
+
+        ids = dal.create_morphisms_bulk(cat_id, [
+            {"name": f"m{i}", "source_id": objs[i], "target_id": objs[i + 1]} for i in range(999)
+        ])
+
+        assert len(ids) == 999
+
+    def test_create_morphisms_bulk_duplicate_check(self, dal: CategoryDAL):
+        cat_id = dal.create_category("BulkMorphDup")
+        a, b = dal.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}])
+        dal.create_morphism("f", a, b, cat_id)
+
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_morphisms_bulk(cat_id, [{"name": "f", "source_id": b, "target_id": a}])
+
+
+class TestBulkMappings:
+    """Test batch creation of functor mappings and NT components."""
+
+    def _build(self, dal: CategoryDAL):
+        c = dal.create_category("C", "domain")
+        d = dal.create_category("D", "codomain")
+        x, y = dal.create_objects_bulk(c, [{"name": "X"}, {"name": "Y"}])
+        fx, fy, gx, gy = dal.create_objects_bulk(d, [{"name": n} for n in ("FX", "FY", "GX", "GY")])
+        (f,) = dal.create_morphisms_bulk(c, [{"name": "f", "source_id": x, "target_id": y}])
+        ff, gf, ax, ay = dal.create_morphisms_bulk(d, [
+            {"name": "Ff", "source_id": fx, "target_id": fy},
+            {"name": "Gf", "source_id": gx, "target_id": gy},
+            {"name": "aX", "source_id": fx, "target_id": gx},
+            {"name": "aY", "source_id": fy, "target_id": gy},
+        ])
+        F = dal.create_functor("F", c, d)
+        G = dal.create_functor("G", c, d)
+        return {"x": x, "y": y, "fx": fx, "fy": fy, "f": f, "ff": ff, "gf": gf, "ax": ax, "ay": ay, "F": F, "G": G}
+
+    def test_functor_mappings_bulk(self, dal: CategoryDAL):
+        e = self._build(dal)
+        created = dal.add_functor_object_mappings_bulk(e["F"], [(e["x"], e["fx"]), (e["y"], e["fy"])])
+        assert created == 2
+        assert {(m["source_object"], m["target_object"]) for m in dal.get_functor_object_mappings(e["F"])} == {
+            ("X", "FX"), ("Y", "FY")
+        }
+
+        assert dal.add_functor_morphism_mappings_bulk(e["F"], [(e["f"], e["ff"])]) == 1
+        assert dal.get_functor_morphism_mappings(e["F"])[0]["target_morphism"] == "Ff"
+
+        # Already mapped sources are rejected for the whole batch
+        with pytest.raises(ValueError, match="already mapped"):
+            dal.add_functor_object_mappings_bulk(e["F"], [(e["x"], e["fy"])])
+
+    def test_functor_mappings_bulk_skips_ill_typed_pairs(self, dal: CategoryDAL):
+        e = self._build(dal)
+        # fx is in the codomain, so it cannot be a source under F
+        created = dal.add_functor_object_mappings_bulk(e["F"], [(e["x"], e["fx"]), (e["fx"], e["fy"])])
+        assert created == 1
+
+    def test_nt_components_bulk(self, dal: CategoryDAL):
+        e = self._build(dal)
+        dal.add_functor_morphism_mappings_bulk(e["F"], [(e["f"], e["ff"])])
+        dal.add_functor_morphism_mappings_bulk(e["G"], [(e["f"], e["gf"])])
+        nt_id = dal.create_natural_transformation("alpha", e["F"], e["G"])
+
+        created = dal.add_nt_components_bulk(nt_id, [(e["x"], e["ax"]), (e["y"], e["ay"])])
+
+        assert created == 2
+        assert {c["at_object_id"] for c in dal.get_nt_components(nt_id)} == {e["x"], e["y"]}
+        assert dal.validate_nt_structure(nt_id) == []
+        with pytest.raises(ValueError, match="already has a component"):
+            dal.add_nt_components_bulk(nt_id, [(e["x"], e["ay"])])
+
+
+class TestBulkUpdates:
+    """Test batch renames and description changes."""
+
+    def test_update_objects_bulk(self, dal: CategoryDAL):
+        cat_id = dal.create_category("RenameCat")
+        ids = dal.create_objects_bulk(cat_id, [{"name": f"O{i}", "description": "old"} for i in range(10)])
+
+        updated = dal.update_objects_bulk(
+            [{"ID": obj_id, "name": f"ns.O{i}"} for i, obj_id in enumerate(ids[:5])]
+            + [{"ID": obj_id, "description": "new"} for obj_id in ids[5:]]
+        )
+
+        assert updated == 10
+        objects = {o["ID"]: o for o in dal.get_objects_in_category(cat_id)}
+        assert [objects[i]["name"] for i in ids[:5]] == [f"ns.O{i}" for i in range(5)]
+        assert all(objects[i]["description"] == "old" for i in ids[:5])
+        assert [objects[i]["name"] for i in ids[5:]] == [f"O{i}" for i in range(5, 10)]
+        assert all(objects[i]["description"] == "new" for i in ids[5:])
+
+    def test_update_bulk_allows_swaps_and_rejects_duplicates(self, dal: CategoryDAL):
+        cat_id = dal.create_category("SwapCat")
+        a, b, c = dal.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}, {"name": "C"}])
+
+        dal.update_objects_bulk([{"ID": a, "name": "B"}, {"ID": b, "name": "A"}])
+        assert dal.get_object(a)["name"] == "B" and dal.get_object(b)["name"] == "A"
+
+        with pytest.raises(ValueError, match="already exists"):
+            dal.update_objects_bulk([{"ID": c, "name": "A"}])
+        with pytest.raises(ValueError, match="already exists"):
+            dal.update_objects_bulk([{"ID": a, "name": "D"}, {"ID": c, "name": "D"}])
+        with pytest.raises(ValueError, match="more than once"):
+            dal.update_objects_bulk([{"ID": a, "name": "E"}, {"ID": a, "name": "F"}])
+        with pytest.raises(ValueError, match="not found"):
+            dal.update_objects_bulk([{"ID": a, "name": "E"}, {"ID": 999999, "name": "F"}])
+
+        # Rejected batches leave the names untouched
+        assert {o["name"] for o in dal.get_objects_in_category(cat_id)} == {"A", "B", "C"}
+
+    def test_update_morphisms_and_categories_bulk(self, dal: CategoryDAL):
+        first = dal.create_category("First")
+        second = dal.create_category("Second")
+        x, y = dal.create_objects_bulk(first, [{"name": "X"}, {"name": "Y"}])
+        f, g = dal.create_morphisms_bulk(first, [
+            {"name": "f", "source_id": x, "target_id": y},
+            {"name": "g", "source_id": y, "target_id": x},
+        ])
+
+        assert dal.update_morphisms_bulk([{"ID": f, "name": "p.f"}, {"ID": g, "name": "p.g", "description": "back"}]) == 2
+        morphisms = {m["ID"]: m for m in dal.get_morphisms_in_category(first)}
+        assert morphisms[f]["name"] == "p.f"
+        assert (morphisms[g]["name"], morphisms[g]["description"]) == ("p.g", "back")
+        with pytest.raises(ValueError, match="already exists"):
+            dal.update_morphisms_bulk([{"ID": f, "name": "p.g"}])
+
+        assert dal.update_categories_bulk([{"ID": first, "name": "p.First"}, {"ID": second, "description": "two"}]) == 2
+        assert dal.get_category(first)["name"] == "p.First"
+        assert dal.get_category(second)["description"] == "two"
+        with pytest.raises(ValueError, match="already exists"):
+            dal.update_categories_bulk([{"ID": second, "name": "p.First"}])
+
+    def test_update_bulk_empty(self, dal: CategoryDAL):
+        assert dal.update_objects_bulk([]) == 0
+
+    def test_update_object_checks_names(self, dal: CategoryDAL):
+        cat_id = dal.create_category("SingleCat")
+        a, b = dal.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}])
+
+        with pytest.raises(ValueError, match="already exists"):
+            dal.update_object(b, name="A")
+        with pytest.raises(ValueError, match="not found"):
+            dal.update_object(999999, name="C")
+        assert dal.update_object(a, name="A")  # keeping its own name is allowed
+
+    def test_description_update_refreshes_hom_sets(self, dal: CategoryDAL):
+        cat_id = dal.create_category("DescCat")
+        x, y = dal.create_objects_bulk(cat_id, [{"name": "X"}, {"name": "Y"}])
+        (f,) = dal.create_morphisms_bulk(cat_id, [{"name": "f", "source_id": x, "target_id": y}])
+        assert dal.get_hom_set(cat_id, x, y)[0]["description"] == ""
+
+        dal.update_morphisms_bulk([{"ID": f, "description": "new desc"}])
+
+        assert dal.get_hom_set(cat_id, x, y)[0]["description"] == "new desc"
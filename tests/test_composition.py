@@ -0,0 +1,221 @@
+import pytest
+
+from kuzu_DAL import CategoryDAL, CompositionCache
+
+
+class TestComposition:
+    """Test the composition table and memoized composition engine."""
+
+    @pytest.fixture
+    def chain(self, dal: CategoryDAL):
+        cat_id = dal.create_category("Chain")
+        a, b, c, d = dal.create_objects_bulk(cat_id, [{"name": n} for n in "ABCD"])
+        f, g, h, gf, hg, hgf, id_b = dal.create_morphisms_bulk(cat_id, [
+            {"name": "f", "source_id": a, "target_id": b},
+            {"name": "g", "source_id": b, "target_id": c},
+            {"name": "h", "source_id": c, "target_id": d},
+            {"name": "g∘f", "source_id": a, "target_id": c},
+            {"name": "h∘g", "source_id": b, "target_id": d},
+            {"name": "h∘g∘f", "source_id": a, "target_id": d},
+            {"name": "id_B", "source_id": b, "target_id": b, "is_identity": True},
+        ])
+        dal.set_composite(f, g, gf)
+        dal.set_composite(g, h, hg)
+        dal.set_composite(gf, h, hgf)
+        dal.set_composite(f, hg, hgf)
+        return {"cat": cat_id, "a": a, "c": c, "f": f, "g": g, "h": h, "gf": gf, "hg": hg, "hgf": hgf, "id_b": id_b}
+
+    def test_compose_recorded_and_identity(self, dal: CategoryDAL, chain):
+        c = chain
+        assert dal.compose(c["f"], c["g"]) == c["gf"]
+        assert dal.compose(c["f"], c["id_b"]) == c["f"]
+        assert dal.compose(c["id_b"], c["g"]) == c["g"]
+        # Not composable: target of g is not the source of f
+        assert dal.compose(c["g"], c["f"]) is None
+
+    def test_compose_path(self, dal: CategoryDAL, chain):
+        c = chain
+        assert dal.compose_path([c["f"], c["g"], c["h"]]) == c["hgf"]
+        assert dal.compose_path([c["f"], c["id_b"], c["g"]]) == c["gf"]
+        assert dal.compose_path([c["h"]]) == c["h"]
+        assert dal.compose_path([]) is None
+        assert dal.compose_path([c["h"], c["f"]]) is None
+
+    def test_repeated_paths_hit_the_cache(self, dal: CategoryDAL, chain, monkeypatch):
+        c = chain
+        dal.compose_path([c["f"], c["g"], c["h"]])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("warm compositions should not query the database")
+        monkeypatch.setattr(dal, "_execute", fail)
+
+        for _ in range(10):
+            assert dal.compose_path([c["f"], c["g"], c["h"]]) == c["hgf"]
+        assert dal.compositions.stats()["hits"] >= 20
+
+    def test_set_composite_validates_and_replaces(self, dal: CategoryDAL, chain):
+        c = chain
+        with pytest.raises(ValueError, match="not a well-typed composite"):
+            dal.set_composite(c["f"], c["g"], c["h"])
+
+        assert dal.compose(c["f"], c["g"]) == c["gf"]
+        alt = dal.create_morphism("g∘f'", c["a"], c["c"], c["cat"])
+        dal.set_composite(c["f"], c["g"], alt)
+        assert dal.compose(c["f"], c["g"]) == alt
+
+    def test_failed_replacement_keeps_the_old_composite(self, dal: CategoryDAL, chain, monkeypatch):
+        c = chain
+        alt = dal.create_morphism("g∘f'", c["a"], c["c"], c["cat"])
+        execute = dal._execute
+
+        def fail_on_create(query, parameters=None):
+            if "CREATE (cp:Composition)" in query:
+                raise RuntimeError("disk full")
+            return execute(query, parameters)
+        monkeypatch.setattr(dal, "_execute", fail_on_create)
+        with pytest.raises(RuntimeError, match="disk full"):
+            dal.set_composite(c["f"], c["g"], alt)
+        monkeypatch.undo()
+
+        # The delete of the old entry was rolled back with the failed create
+        dal.compositions.invalidate()
+        assert dal.compose(c["f"], c["g"]) == c["gf"]
+        assert dal.get_statistics()["compositions"] == 4
+
+    def test_rollback_invalidates(self, dal: CategoryDAL, chain):
+        c = chain
+        dal.begin_transaction()
+        alt = dal.create_morphism("g∘f'", c["a"], c["c"], c["cat"])
+        dal.set_composite(c["f"], c["g"], alt)
+        assert dal.compose(c["f"], c["g"]) == alt
+        dal.rollback_transaction()
+        assert dal.compose(c["f"], c["g"]) == c["gf"]
+
+
+class TestCompositionCache:
+    """Test LRU behaviour of the composition cache."""
+
+    def test_lru_eviction_and_category_invalidation(self):
+        cache = CompositionCache(capacity=2)
+        cache.put((1, 2), 10, 3)
+        cache.put((2, 3), 10, None)
+        assert cache.get((1, 2)) == (True, 3)
+        cache.put((4, 5), 11, 6)  # evicts (2, 3), the least recently used
+
+        assert cache.get((2, 3)) == (False, None)
+        assert cache.get((4, 5)) == (True, 6)
+
+        cache.invalidate(10)
+        assert cache.get((1, 2)) == (False, None)
+        assert cache.stats()["size"] == 1
+
+
+class TestCategoryLaws:
+    """Test the vectorized category-law validator."""
+
+    @pytest.fixture
+    def square(self, dal: CategoryDAL):
+        """A → B → C with a recorded composite and all identities."""
+        cat_id = dal.create_category("Square")
+        a, b, c = dal.create_objects_bulk(cat_id, [{"name": n} for n in "ABC"])
+        f, g, gf, g2, *_ = dal.create_morphisms_bulk(cat_id, [
+            {"name": "f", "source_id": a, "target_id": b},
+            {"name": "g", "source_id": b, "target_id": c},
+            {"name": "g∘f", "source_id": a, "target_id": c},
+            {"name": "g'", "source_id": b, "target_id": c},
+            {"name": "id_A", "source_id": a, "target_id": a, "is_identity": True},
+            {"name": "id_B", "source_id": b, "target_id": b, "is_identity": True},
+            {"name": "id_C", "source_id": c, "target_id": c, "is_identity": True},
+        ])
+        dal.set_composite(f, g, gf)
+        dal.set_composite(f, g2, gf)
+        return {"cat": cat_id, "a": a, "b": b, "c": c, "f": f, "g": g, "gf": gf, "g2": g2}
+
+    @pytest.fixture
+    def chain_with_identities(self, dal: CategoryDAL):
+        """A → B → C → D with all composites and identities recorded."""
+        cat_id = dal.create_category("Chain")
+        a, b, c, d = dal.create_objects_bulk(cat_id, [{"name": n} for n in "ABCD"])
+        f, g, h, gf, hg, hgf = dal.create_morphisms_bulk(cat_id, [
+            {"name": "f", "source_id": a, "target_id": b},
+            {"name": "g", "source_id": b, "target_id": c},
+            {"name": "h", "source_id": c, "target_id": d},
+            {"name": "g∘f", "source_id": a, "target_id": c},
+            {"name": "h∘g", "source_id": b, "target_id": d},
+            {"name": "h∘g∘f", "source_id": a, "target_id": d},
+        ])
+        dal.create_morphisms_bulk(cat_id, [
+            {"name": f"id_{n}", "source_id": o, "target_id": o, "is_identity": True}
+            for n, o in zip("ABCD", (a, b, c, d))
+        ])
+        for pair, composite in (((f, g), gf), ((g, h), hg), ((gf, h), hgf), ((f, hg), hgf)):
+            dal.set_composite(*pair, composite)
+        return {"cat": cat_id, "a": a, "d": d, "f": f, "g": g, "h": h, "hg": hg}
+
+    def test_valid_category(self, dal: CategoryDAL, square):
+        assert dal.validate_category_laws(square["cat"]) == []
+
+    def test_missing_identity_and_composite(self, dal: CategoryDAL, square):
+        s = square
+        d = dal.create_object("D", s["cat"])
+        dal.create_morphism("h", s["c"], d, s["cat"])
+
+        errors = dal.validate_category_laws(s["cat"])
+
+        assert "Object 'D' missing identity morphism" in errors
+        assert "No composite recorded for 'h' ∘ 'g'" in errors
+        assert "No composite recorded for 'h' ∘ 'g∘f'" in errors
+
+    def test_identity_law_violation(self, dal: CategoryDAL, square):
+        s = square
+        id_b = next(m["ID"] for m in dal.get_morphisms_in_category(s["cat"]) if m["name"] == "id_B")
+        dal.set_composite(id_b, s["g"], s["g2"])
+
+        assert dal.validate_category_laws(s["cat"]) == ["Right identity law fails: 'g' ∘ 'id_B' = 'g''"]
+
+    def test_associativity_violation(self, dal: CategoryDAL, chain_with_identities):
+        c = chain_with_identities
+        k = dal.create_morphism("k", c["a"], c["d"], c["cat"])
+        dal.set_composite(c["f"], c["hg"], k)
+
+        errors = dal.validate_category_laws(c["cat"])
+
+        assert errors == ["Associativity fails for 'h' ∘ 'g' ∘ 'f': 'h∘g∘f' ≠ 'k'"]
+
+    def test_errors_are_capped_per_law(self, dal: CategoryDAL):
+        cat_id = dal.create_category("NoIdentities")
+        dal.create_objects_bulk(cat_id, [{"name": f"O{i}"} for i in range(5)])
+
+        errors = dal.validate_category_laws(cat_id, max_errors=2)
+
+        assert len(errors) == 3
+        assert errors[-1] == "... and 3 more identity violations"
+
+    def test_large_category_validates_quickly(self, dal: CategoryDAL):
+        """The preorder 0 ≤ 1 ≤ ... ≤ 39 has ~10k composable triples."""
+        import time
+
+        n = 40
+        cat_id = dal.create_category("Preorder")
+        objs = dal.create_objects_bulk(cat_id, [{"name": f"O{i}"} for i in range(n)])
+        pairs = [(i, j) for i in range(n) for j in range(i, n)]
+        ids = dal.create_morphisms_bulk(cat_id, [
+            {"name": f"{i}≤{j}", "source_id": objs[i], "target_id": objs[j], "is_identity": i == j}
+            for i, j in pairs
+        ])
+        arrow = dict(zip(pairs, ids))
+        rows = [{"f": arrow[(i, j)], "g": arrow[(j, k)], "h": arrow[(i, k)]}
+                for i in range(n) for j in range(i + 1, n) for k in range(j + 1, n)]
+        dal._execute(
+            """UNWIND $rows AS row
+               MATCH (f:Morphism {ID: row.f}), (g:Morphism {ID: row.g}), (h:Morphism {ID: row.h})
+               CREATE (cp:Composition)
+               CREATE (cp)-[:composition_first]->(f), (cp)-[:composition_second]->(g), (cp)-[:composition_result]->(h)""",
+            {"rows": rows}
+        )
+
+        start = time.time()
+        errors = dal.validate_category_laws(cat_id)
+
+        assert errors == []
+        assert time.time() - start < 5.0
@@ -1,5 +1,5 @@
 import pytest
-from kuzu_DAL import CategoryDAL, initialize_schema
+from kuzu_DAL import CategoryDAL, StatementRegistry, initialize_schema
 
 
 class TestCategoryOperations:
@@ -103,6 +103,123 @@ class TestMorphismOperations:
         # Should have at least the morphism we created
         assert len(morphisms) >= 1
         assert any(m["name"] == "f" for m in morphisms)
+        f = next(m for m in morphisms if m["name"] == "f")
+        assert (f["source_object_id"], f["target_object_id"]) == (obj1, obj2)
+    
+    def test_create_statements_single_round_trip(self, dal, sample_category, monkeypatch):
+        """Test that each create issues exactly one statement on success."""
+        obj1 = dal.create_object("Object1", sample_category)
+        obj2 = dal.create_object("Object2", sample_category)
+        other = dal.create_category("Other")
+        
+        calls = []
+        original_execute = dal.conn.execute
+        def counting_execute(*args, **kwargs):
+            calls.append(args[0])
+            return original_execute(*args, **kwargs)
+        monkeypatch.setattr(dal.conn, "execute", counting_execute)
+        
+        dal.create_category("Single")
+        dal.create_object("Object3", sample_category)
+        dal.create_morphism("f", obj1, obj2, sample_category)
+        functor_id = dal.create_functor("F", sample_category, other)
+        dal.create_natural_transformation("alpha", functor_id, functor_id)
+        assert len(calls) == 5
+        
+        morphisms = dal.get_morphisms_in_category(sample_category)
+        assert [(m["source_object"], m["target_object"]) for m in morphisms] == [("Object1", "Object2")]
+    
+    def test_create_morphism_missing_endpoint(self, dal, sample_category):
+        """Test that a morphism with an unknown endpoint is rejected without side effects."""
+        obj1 = dal.create_object("Object1", sample_category)
+        with pytest.raises(ValueError, match="not found"):
+            dal.create_morphism("f", obj1, 99999, sample_category)
+        assert dal.get_morphisms_in_category(sample_category) == []
+    
+    def test_create_morphism_rejects_objects_of_another_category(self, dal, sample_category):
+        """Test that both endpoints must be objects of the morphism's category."""
+        other = dal.create_category("Other")
+        obj1 = dal.create_object("Object1", sample_category)
+        stray = dal.create_object("Stray", other)
+        for source, target in ((obj1, stray), (stray, obj1), (stray, stray)):
+            with pytest.raises(ValueError, match=f"not found in category {sample_category}"):
+                dal.create_morphism("f", source, target, sample_category)
+        assert dal.get_morphisms_in_category(sample_category) == []
+        assert dal.get_morphisms_in_category(other) == []
+
+
+class TestStatementRegistry:
+    """Test prepared-statement reuse."""
+    
+    def test_hot_path_queries_are_prepared_once(self, dal, sample_category):
+        """Test that repeated list calls hit the prepared-statement cache."""
+        obj1 = dal.create_object("Object1", sample_category)
+        obj2 = dal.create_object("Object2", sample_category)
+        dal.create_morphism("f", obj1, obj2, sample_category)
+        
+        dal.get_objects_in_category(sample_category)
+        dal.get_morphisms_in_category(sample_category)
+        before = dal.statements.stats()
+        
+        for _ in range(10):
+            assert len(dal.get_objects_in_category(sample_category)) == 2
+            assert len(dal.get_morphisms_in_category(sample_category)) == 1
+        after = dal.statements.stats()
+        
+        assert after["misses"] == before["misses"]
+        assert after["hits"] == before["hits"] + 20
+    
+    def test_prepared_statements_survive_transactions(self, dal, sample_category):
+        """Test that cached statements keep working across commit and rollback."""
+        dal.begin_transaction()
+        dal.create_objects_bulk(sample_category, [{"name": "A"}, {"name": "B"}])
+        dal.rollback_transaction()
+        dal.create_objects_bulk(sample_category, [{"name": "A"}, {"name": "B"}, {"name": "C"}])
+        
+        assert [o["name"] for o in dal.get_objects_in_category(sample_category)] == ["A", "B", "C"]
+        assert dal.statements.stats()["hits"] > 0
+    
+    def test_registry_is_bounded(self, dal, sample_category):
+        """Test that queries with inlined limits evict the least recently used statements."""
+        dal.statements = StatementRegistry(dal.conn, capacity=8)
+        dal.get_objects_in_category(sample_category)
+        for limit in range(1, 30):
+            dal.page_objects_in_category(sample_category, limit=limit)
+            dal.get_objects_in_category(sample_category)  # kept warm
+        
+        stats = dal.statements.stats()
+        assert stats["size"] == 8
+        assert stats["misses"] == 30
+        assert stats["hits"] == 29
+
+
+class TestColumnarResults:
+    """Test Arrow-backed list methods."""
+    
+    def test_arrow_tables_match_dict_listings(self, dal, sample_category):
+        """Test that columnar results carry the same rows as the dict APIs."""
+        a, b = dal.create_objects_bulk(sample_category, [{"name": "A"}, {"name": "B"}])
+        dal.create_morphism("f", a, b, sample_category, "f: A->B")
+        
+        objects = dal.get_objects_in_category_arrow(sample_category)
+        assert objects.num_rows == 2
+        assert objects.column("name").to_pylist() == ["A", "B"]
+        assert objects.to_pylist() == dal.get_objects_in_category(sample_category)
+        
+        morphisms = dal.get_morphisms_in_category_arrow(sample_category)
+        assert morphisms.column_names == [
+            "ID", "name", "description", "is_identity",
+            "source_object_id", "source_object", "target_object_id", "target_object",
+        ]
+        assert morphisms.to_pylist()[0]["is_identity"] is False
+        assert dal.list_categories_arrow().num_rows == 1
+    
+    def test_arrow_empty_results_keep_schema(self, dal):
+        """Test that empty listings still return typed tables."""
+        table = dal.list_functors_arrow()
+        assert table.num_rows == 0
+        assert "source_category_id" in table.column_names
+        assert dal.list_functors() == []
 
 
 class TestTransactionManagement:
@@ -148,3 +265,100 @@ class TestValidation:
         errors = dal.validate_category_structure(sample_category)
         # Since we skipped identity morphism creation, expect validation errors
         assert isinstance(errors, list)
+
+
+class TestStatistics:
+    """Test the aggregate statistics query."""
+    
+    def test_empty_database(self, dal):
+        """Test that an empty database reports zero counts."""
+        stats = dal.get_statistics()
+        assert stats["categories"] == stats["objects"] == stats["functors"] == 0
+        assert stats["per_category"] == []
+    
+    def test_counts_match_listings_in_one_query(self, dal, monkeypatch):
+        """Test that all counts come from a single statement."""
+        c = dal.create_category("C")
+        d = dal.create_category("D")
+        x, y = dal.create_objects_bulk(c, [{"name": "X"}, {"name": "Y"}])
+        fx, = dal.create_objects_bulk(d, [{"name": "FX"}])
+        f, = dal.create_morphisms_bulk(c, [{"name": "f", "source_id": x, "target_id": y}])
+        id_fx = dal.create_morphism("id_FX", fx, fx, d)
+        functor_id = dal.create_functor("F", c, d)
+        dal.add_functor_object_mappings_bulk(functor_id, [(x, fx), (y, fx)])
+        dal.add_functor_morphism_mappings_bulk(functor_id, [(f, id_fx)])
+        nt_id = dal.create_natural_transformation("alpha", functor_id, functor_id)
+        dal.add_nt_component(nt_id, x, id_fx)
+        
+        calls = []
+        original_execute = dal.conn.execute
+        def counting_execute(*args, **kwargs):
+            calls.append(args[0])
+            return original_execute(*args, **kwargs)
+        monkeypatch.setattr(dal.conn, "execute", counting_execute)
+        
+        stats = dal.get_statistics()
+        
+        assert len(calls) == 1
+        assert {k: v for k, v in stats.items() if k != "per_category"} == {
+            "categories": 2, "objects": 3, "morphisms": 2, "functors": 1, "natural_transformations": 1,
+            "object_mappings": 2, "morphism_mappings": 1, "components": 1, "compositions": 0,
+        }
+        assert stats["per_category"] == [
+            {"ID": c, "name": "C", "objects": 2, "morphisms": 1},
+            {"ID": d, "name": "D", "objects": 1, "morphisms": 1},
+        ]
+
+
+class TestPagination:
+    """Test keyset pagination and streaming iterators."""
+    
+    @pytest.fixture
+    def populated(self, dal, sample_category):
+        objs = dal.create_objects_bulk(sample_category, [{"name": f"O{i:03d}"} for i in range(25)])
+        dal.create_morphisms_bulk(sample_category, [
+            {"name": f"m{i:03d}", "source_id": objs[i], "target_id": objs[(i + 1) % 25]} for i in range(25)
+        ])
+        return sample_category
+    
+    def test_pages_follow_name_order(self, dal, populated):
+        """Test that consecutive pages cover the listing once, in order."""
+        first = dal.page_objects_in_category(populated, limit=10)
+        second = dal.page_objects_in_category(populated, first[-1]["name"], 10, first[-1]["ID"])
+        by_name = dal.page_objects_in_category(populated, after_name="O009", limit=3)
+        
+        assert [o["name"] for o in first] == [f"O{i:03d}" for i in range(10)]
+        assert [o["name"] for o in second] == [f"O{i:03d}" for i in range(10, 20)]
+        assert [o["name"] for o in by_name] == ["O010", "O011", "O012"]
+        assert dal.page_objects_in_category(populated, after_name="O024") == []
+    
+    def test_morphism_pages_carry_endpoints(self, dal, populated):
+        """Test that paged morphisms match the full listing."""
+        page = dal.page_morphisms_in_category(populated, after_name="m019", limit=100)
+        full = dal.get_morphisms_in_category(populated)
+        assert page == full[20:]
+        assert page[-1]["target_object"] == "O000"
+    
+    def test_iterators_stream_the_full_listing(self, dal, populated):
+        """Test that iterators match the list methods for any batch size."""
+        for batch_size in (1, 7, 25, 1000):
+            assert list(dal.iter_objects_in_category(populated, batch_size)) == dal.get_objects_in_category(populated)
+            assert list(dal.iter_morphisms_in_category(populated, batch_size)) == dal.get_morphisms_in_category(populated)
+        dal.create_category("Another")
+        assert list(dal.iter_categories(batch_size=1)) == dal.list_categories()
+        assert len(dal.list_categories()) == 2
+    
+    def test_duplicate_names_are_ordered_by_id(self, dal):
+        """Test that the ID cursor breaks ties between equal names."""
+        cat_ids = [dal.create_category(name) for name in ("A", "B")]
+        dal._execute("CREATE (:Category {name: 'A', description: 'twin'})")
+        rows = []
+        after_name, after_id = None, None
+        while True:
+            page = dal.page_categories(after_name, 1, after_id)
+            if not page:
+                break
+            rows.extend(page)
+            after_name, after_id = page[-1]["name"], page[-1]["ID"]
+        assert [(c["name"], c["description"]) for c in rows] == [("A", ""), ("A", "twin"), ("B", "")]
+        assert rows[0]["ID"] == cat_ids[0]
@@ -138,3 +138,30 @@ class TestDuplicatePrevention:
         assert "MYCATEGORY" in names  
         assert "myCategory" in names
         assert len(set(names)) >= 3  # At least our 3 unique names
+    
+    def test_uniqueness_checks_do_not_list_entities(self, dal, monkeypatch):
+        """Test that duplicate checks use keyed lookups rather than full listings."""
+        cat_id = dal.create_category("KeyedCat", "Keyed lookup category")
+        obj1 = dal.create_object("A", cat_id)
+        obj2 = dal.create_object("B", cat_id)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("uniqueness check should not list entities")
+        
+        monkeypatch.setattr(dal, "list_categories", fail)
+        monkeypatch.setattr(dal, "get_objects_in_category", fail)
+        monkeypatch.setattr(dal, "get_morphisms_in_category", fail)
+        
+        dal.create_category("OtherCat")
+        dal.update_category(cat_id, name="KeyedCat")  # renaming to its own name is allowed
+        dal.create_object("C", cat_id)
+        dal.create_morphism("f", obj1, obj2, cat_id)
+        
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_category("OtherCat")
+        with pytest.raises(ValueError, match="already exists"):
+            dal.update_category(cat_id, name="OtherCat")
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_object("C", cat_id)
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_morphism("f", obj2, obj1, cat_id)
@@ -0,0 +1,154 @@
+import json
+
+import pytest
+
+import codices_cli
+from kuzu_DAL import CategoryDAL
+
+
+def snapshot(dal: CategoryDAL):
+    """Everything an export should preserve, keyed by ID."""
+    functors = dal.list_functors()
+    nts = dal.list_natural_transformations()
+    categories = dal.list_categories()
+    return {
+        "categories": categories,
+        "objects": [dal.get_objects_in_category(c["ID"]) for c in categories],
+        "morphisms": [dal.get_morphisms_in_category(c["ID"]) for c in categories],
+        "functors": functors,
+        "object_mappings": [dal.get_functor_object_mappings(f["ID"]) for f in functors],
+        "morphism_mappings": [dal.get_functor_morphism_mappings(f["ID"]) for f in functors],
+        "nts": nts,
+        "components": [dal.get_nt_components(nt["ID"]) for nt in nts],
+        "statistics": dal.get_statistics(),
+    }
+
+
+@pytest.fixture
+def populated(dal: CategoryDAL):
+    """A small database with deleted rows, so IDs have gaps."""
+    cat_id = dal.create_category("Sets", 'Sets, "functions"\nand more')
+    scratch = dal.create_category("Scratch")
+    dal.create_object("Gone", scratch)
+    a, b, gone, c = dal.create_objects_bulk(cat_id, [
+        {"name": "A", "description": "first, with a comma"},
+        {"name": "B"},
+        {"name": "Gone"},
+        {"name": "C", "description": "line one\nline two"},
+    ])
+    id_a, id_b, f, g, gf = dal.create_morphisms_bulk(cat_id, [
+        {"name": "id_A", "source_id": a, "target_id": a, "is_identity": True},
+        {"name": "id_B", "source_id": b, "target_id": b, "is_identity": True},
+        {"name": "f", "source_id": a, "target_id": b},
+        {"name": "g", "source_id": b, "target_id": c},
+        {"name": "gf", "source_id": a, "target_id": c},
+    ])
+    dal.set_composite(f, g, gf)
+    dal.delete_object(gone)
+    dal.delete_category(scratch)
+    functor_id = dal.create_functor("Id", cat_id, cat_id)
+    dal.add_functor_object_mappings_bulk(functor_id, [(a, a), (b, b), (c, c)])
+    dal.add_functor_morphism_mappings_bulk(functor_id, [(f, f), (g, g)])
+    nt_id = dal.create_natural_transformation("1", functor_id, functor_id)
+    dal.add_nt_components_bulk(nt_id, [(a, id_a), (b, id_b)])
+    return {"cat": cat_id, "f": f, "g": g, "gf": gf}
+
+
+class TestExportImport:
+    """Test COPY-based export and import round trips."""
+
+    @pytest.mark.parametrize("file_format", ["parquet", "csv"])
+    def test_round_trip_preserves_ids(self, dal: CategoryDAL, populated, tmp_path, file_format):
+        before = snapshot(dal)
+        manifest = dal.export_data(str(tmp_path / "export"), file_format)
+        assert manifest["nodes"]["Object"]["rows"] == 3
+        assert (tmp_path / "export" / f"Object.{file_format}").exists()
+
+        restored = CategoryDAL(str(tmp_path / "restored"))
+        imported = restored.import_data(str(tmp_path / "export"))
+
+        assert imported["Object"] == 3
+        assert snapshot(restored) == before
+        assert restored.compose(populated["f"], populated["g"]) == populated["gf"]
+        assert [r["name"] for r in restored.search("line two")] == ["C"]
+
+    def test_export_is_a_single_snapshot(self, dal: CategoryDAL, populated, tmp_path):
+        before = snapshot(dal)
+        writer = CategoryDAL(dal.db_path, database=dal.db)
+        count_rows = dal._count_rows
+
+        def write_between_copies(pattern, variable="n"):
+            # Another connection commits between the first COPY and the rest
+            if writer.get_objects_in_category(populated["cat"])[-1]["name"] != "D":
+                d = writer.create_object("D", populated["cat"])
+                writer.create_morphism("h", d, d, populated["cat"])
+            return count_rows(pattern, variable)
+        dal._count_rows = write_between_copies
+        manifest = dal.export_data(str(tmp_path / "export"))
+        del dal._count_rows
+
+        assert manifest["nodes"]["Object"]["rows"] == 3
+        restored = CategoryDAL(str(tmp_path / "restored"))
+        restored.import_data(str(tmp_path / "export"))
+        assert snapshot(restored) == before
+        assert len(dal.get_objects_in_category(populated["cat"])) == 4
+
+    def test_new_rows_after_import_get_fresh_ids(self, dal: CategoryDAL, populated, tmp_path):
+        dal.export_data(str(tmp_path / "export"))
+        restored = CategoryDAL(str(tmp_path / "restored"))
+        restored.import_data(str(tmp_path / "export"))
+
+        existing = {o["ID"] for o in restored.get_objects_in_category(populated["cat"])}
+        new_id = restored.create_object("D", populated["cat"])
+        assert new_id not in existing
+
+    def test_import_counts_rows_it_loaded(self, dal: CategoryDAL, populated, tmp_path):
+        dal.export_data(str(tmp_path / "export"), "csv")
+        rel_file = tmp_path / "export" / "category_objects.csv"
+        lines = rel_file.read_text().splitlines(keepends=True)
+        rel_file.write_text("".join(lines[:-1]))  # lose one row; the manifest still lists it
+
+        restored = CategoryDAL(str(tmp_path / "restored"))
+        with pytest.raises(ValueError, match=r"category_objects \(2, 3\)"):
+            restored.import_data(str(tmp_path / "export"))
+        assert restored.get_statistics()["categories"] == 0  # the partial import is removed
+
+    def test_import_requires_empty_database(self, dal: CategoryDAL, populated, tmp_path):
+        dal.export_data(str(tmp_path / "export"))
+        with pytest.raises(ValueError, match="empty database"):
+            dal.import_data(str(tmp_path / "export"))
+
+    def test_import_requires_a_database_that_never_held_rows(self, dal: CategoryDAL, populated, tmp_path):
+        dal.export_data(str(tmp_path / "export"))
+        used = CategoryDAL(str(tmp_path / "used"))
+        used.delete_category(used.create_category("Temporary"))
+
+        with pytest.raises(ValueError, match=r"never held rows; tables \['Category'\]"):
+            used.import_data(str(tmp_path / "export"))
+        assert used.list_categories() == []
+
+    def test_rejects_other_schema_versions_and_transactions(self, dal: CategoryDAL, tmp_path):
+        dal.export_data(str(tmp_path / "export"))
+        manifest_path = tmp_path / "export" / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["schema_version"] += 1
+        manifest_path.write_text(json.dumps(manifest))
+
+        with pytest.raises(ValueError, match="schema version"):
+            CategoryDAL(str(tmp_path / "restored")).import_data(str(tmp_path / "export"))
+        dal.begin_transaction()
+        with pytest.raises(ValueError, match="inside a transaction"):
+            dal.export_data(str(tmp_path / "again"))
+        dal.rollback_transaction()
+
+    def test_cli(self, dal: CategoryDAL, populated, temp_db_path, tmp_path, capsys):
+        before = snapshot(dal)
+        del dal
+        out = str(tmp_path / "export")
+        restored = str(tmp_path / "restored")
+
+        assert codices_cli.main(["export", out, "--db", temp_db_path, "--format", "csv"]) == 0
+        assert codices_cli.main(["import", out, "--db", restored]) == 0
+        assert "Object: 3 rows" in capsys.readouterr().out
+        assert snapshot(CategoryDAL(restored)) == before
+        assert codices_cli.main(["import", out, "--db", restored]) == 1
@@ -63,6 +63,8 @@ class TestFunctorMappings:
         assert m["target_morphism"] == "Ff"
         assert m["source_from"] == "X" and m["source_to"] == "Y"
         assert m["target_from"] == "FX" and m["target_to"] == "FY"
+        assert (m["source_from_id"], m["source_to_id"]) == (x, y)
+        assert (m["target_from_id"], m["target_to_id"]) == (fx, fy)
 
         # Remove
         ok = dal.remove_functor_morphism_mapping(fid, f)
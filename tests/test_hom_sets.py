@@ -0,0 +1,57 @@
+import pytest
+
+from kuzu_DAL import CategoryDAL
+
+
+class TestHomSets:
+    """Test hom-set lookups and cache invalidation."""
+
+    @pytest.fixture
+    def triangle(self, dal: CategoryDAL):
+        cat_id = dal.create_category("Triangle")
+        a, b, c = dal.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}, {"name": "C"}])
+        f, f2, g = dal.create_morphisms_bulk(cat_id, [
+            {"name": "f", "source_id": a, "target_id": b},
+            {"name": "f2", "source_id": a, "target_id": b},
+            {"name": "g", "source_id": b, "target_id": c},
+        ])
+        return {"cat": cat_id, "a": a, "b": b, "c": c, "f": f, "f2": f2, "g": g}
+
+    def test_hom_set_out_and_in(self, dal: CategoryDAL, triangle):
+        t = triangle
+        assert {m["ID"] for m in dal.get_hom_set(t["cat"], t["a"], t["b"])} == {t["f"], t["f2"]}
+        assert dal.get_hom_set(t["cat"], t["a"], t["c"]) == []
+        assert {m["name"] for m in dal.get_out_morphisms(t["cat"], t["b"])} == {"g"}
+        assert {m["name"] for m in dal.get_in_morphisms(t["cat"], t["b"])} == {"f", "f2"}
+        assert dal.get_in_morphisms(t["cat"], t["a"]) == []
+
+    def test_index_is_built_once(self, dal: CategoryDAL, triangle, monkeypatch):
+        t = triangle
+        dal.get_hom_set(t["cat"], t["a"], t["b"])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("hom-set lookups should be served from the index")
+        monkeypatch.setattr(dal, "get_morphisms_in_category", fail)
+
+        for _ in range(5):
+            dal.get_hom_set(t["cat"], t["b"], t["c"])
+            dal.get_out_morphisms(t["cat"], t["a"])
+
+    def test_create_and_delete_invalidate(self, dal: CategoryDAL, triangle):
+        t = triangle
+        assert dal.get_hom_set(t["cat"], t["a"], t["c"]) == []
+
+        h = dal.create_morphism("h", t["a"], t["c"], t["cat"])
+        assert [m["ID"] for m in dal.get_hom_set(t["cat"], t["a"], t["c"])] == [h]
+
+        dal.delete_object(t["c"])
+        assert dal.get_hom_set(t["cat"], t["a"], t["c"]) == []
+        assert dal.get_out_morphisms(t["cat"], t["b"]) == []
+
+    def test_rollback_invalidates(self, dal: CategoryDAL, triangle):
+        t = triangle
+        dal.begin_transaction()
+        dal.create_morphism("h", t["a"], t["c"], t["cat"])
+        assert len(dal.get_hom_set(t["cat"], t["a"], t["c"])) == 1
+        dal.rollback_transaction()
+        assert dal.get_hom_set(t["cat"], t["a"], t["c"]) == []
@@ -1,4 +1,5 @@
 import pytest
+import re
 import time
 from kuzu_DAL import CategoryDAL, initialize_schema
 from visualization import get_visualization_data
@@ -226,6 +227,61 @@ class TestPerformance:
         assert len(categories) >= 20
         assert total_time < 5.0, f"Concurrent operations took {total_time:.2f}s (should be <5s)"
 
+    def test_nt_component_lookup_independent_of_nt_count(self, dal):
+        """Test that per-NT component lookups do not scale with the number of NTs."""
+        c = dal.create_category("NTPerfC", "domain")
+        d = dal.create_category("NTPerfD", "codomain")
+        xs = dal.create_objects_bulk(c, [{"name": f"X{i}"} for i in range(20)])
+        y = dal.create_object("Y", d)
+        (a,) = dal.create_morphisms_bulk(d, [{"name": "a", "source_id": y, "target_id": y}])
+        functor_id = dal.create_functor("F", c, d)
+        
+        probe = dal.create_natural_transformation("probe", functor_id, functor_id)
+        dal.add_nt_components_bulk(probe, [(x, a) for x in xs[:5]])
+        
+        def component_rows():
+            """Largest row count any component-table operator emits while listing the probe's components.
+
+            PROFILE prints operators as boxes on a 39-column grid; each box's
+            ``Tables:`` line is paired with the ``NumOutputTuples`` below it.
+            """
+            plans = []
+            execute = dal._execute
+
+            def profile(query, parameters=None):
+                result = dal.conn.execute(dal.statements.prepare(f"PROFILE {query}"), parameters)
+                plans.append("".join(result.get_next()[0] for _ in range(result.get_num_tuples())))
+                return execute(query, parameters)
+            dal._execute = profile
+            components = dal.get_nt_components(probe)
+            del dal._execute
+            assert len(components) == 5
+
+            tables, counts = {}, []
+            for line in plans[0].splitlines():
+                for match in re.finditer(r"Tables: (\w+)|NumOutputTuples: (\d+)", line):
+                    column = match.start() // 39
+                    if match.group(1):
+                        tables[column] = match.group(1)
+                    elif tables.get(column) in component_tables:
+                        counts.append(int(match.group(2)))
+                        del tables[column]
+                    else:
+                        tables.pop(column, None)
+            assert counts, "PROFILE output reported no component-table operators"
+            return max(counts)
+
+        component_tables = {"nat_trans_components", "Component", "component_object", "component_morphism"}
+        assert component_rows() == 5
+        dal.begin_transaction()
+        for i in range(200):
+            nt_id = dal.create_natural_transformation(f"nt_{i}", functor_id, functor_id)
+            dal.add_nt_components_bulk(nt_id, [(x, a) for x in xs])
+        dal.commit_transaction()
+
+        assert dal.validate_nt_structure(probe) == []
+        # Only the probe's five components are read; none of the 4,000 others are
+        assert component_rows() == 5
 
 class TestMathematicalValidation:
     """Mathematical validation testing."""
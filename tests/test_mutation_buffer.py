@@ -0,0 +1,214 @@
+import pytest
+
+from kuzu_DAL import CategoryDAL, ConnectionManager
+
+
+class TestMutationBuffer:
+    """Test buffered transactions: queued edits, preview reads and the batched flush on commit."""
+
+    def test_buffered_creates_are_previewed_then_committed(self, dal: CategoryDAL):
+        dal.begin_transaction(buffered=True)
+        cat_id = dal.create_category("Buffered", "queued")
+        a = dal.create_object("A", cat_id)
+        b, c = dal.create_objects_bulk(cat_id, [{"name": "B"}, {"name": "C", "description": "third"}])
+        f = dal.create_morphism("f", a, b, cat_id)
+
+        # Nothing has reached the database; reads merge the buffer in
+        assert min(cat_id, a, b, c, f) < 0
+        assert not dal.transaction_active
+        assert dal.list_categories_arrow().num_rows == 0
+        assert [row["name"] for row in dal.list_categories()] == ["Buffered"]
+        assert dal.get_category(cat_id)["description"] == "queued"
+        assert [o["name"] for o in dal.get_objects_in_category(cat_id)] == ["A", "B", "C"]
+        assert [o["name"] for o in dal.page_objects_in_category(cat_id, after_name="A", limit=1)] == ["B"]
+        (morphism,) = dal.get_morphisms_in_category(cat_id)
+        assert (morphism["source_object"], morphism["target_object"]) == ("A", "B")
+
+        dal.commit_transaction()
+
+        real_cat = dal.resolve_id(cat_id)
+        assert real_cat >= 0 and dal.buffer is None
+        assert [o["name"] for o in dal.get_objects_in_category(real_cat)] == ["A", "B", "C"]
+        assert dal.get_object(dal.resolve_id(c))["description"] == "third"
+        (morphism,) = dal.get_morphisms_in_category(real_cat)
+        assert morphism["ID"] == dal.resolve_id(f)
+        assert morphism["source_object_id"] == dal.resolve_id(a)
+        assert [r["ID"] for r in dal.search("Buffered", types=["Category"])] == [real_cat]
+
+    def test_commit_flushes_in_batches(self, dal: CategoryDAL):
+        dal.begin_transaction(buffered=True)
+        cat_id = dal.create_category("Batch")
+        ids = [dal.create_object(f"O{i}", cat_id) for i in range(50)]
+        for i in range(49):
+            dal.create_morphism(f"m{i}", ids[i], ids[i + 1], cat_id)
+
+        statements = []
+        execute = dal._execute
+        dal._execute = lambda query, parameters=None: statements.append(query) or execute(query, parameters)
+        dal.commit_transaction()
+        dal._execute = execute
+
+        assert len(statements) < 10
+        real_cat = dal.resolve_id(cat_id)
+        assert len(dal.get_objects_in_category(real_cat)) == 50
+        assert len(dal.get_morphisms_in_category(real_cat)) == 49
+
+    def test_buffered_updates_and_deletes(self, dal: CategoryDAL):
+        cat_id = dal.create_category("Existing")
+        a, b, c = dal.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}, {"name": "C"}])
+        f, g = dal.create_morphisms_bulk(cat_id, [
+            {"name": "f", "source_id": a, "target_id": b},
+            {"name": "g", "source_id": b, "target_id": c},
+        ])
+
+        dal.begin_transaction(buffered=True)
+        dal.update_object(a, name="A2")
+        dal.delete_object(c)
+        dal.create_object("C", cat_id)  # the name is free once C is deleted
+        dal.create_object("A", cat_id)  # and A's once it is renamed
+        dal.update_category(cat_id, description="edited")
+
+        assert [o["name"] for o in dal.get_objects_in_category(cat_id)] == ["A", "A2", "B", "C"]
+        assert [(m["name"], m["source_object"]) for m in dal.get_morphisms_in_category(cat_id)] == [("f", "A2")]
+        assert dal.get_object(c) is None
+        assert dal.get_object(b)["name"] == "B"
+        assert dal.get_category(cat_id)["description"] == "edited"
+
+        dal.commit_transaction()
+
+        objects = dal.get_objects_in_category(cat_id)
+        assert [o["name"] for o in objects] == ["A", "A2", "B", "C"]
+        assert c not in {o["ID"] for o in objects}
+        assert [m["ID"] for m in dal.get_morphisms_in_category(cat_id)] == [f]
+        assert dal.get_category(cat_id)["description"] == "edited"
+
+    def test_buffered_validation(self, dal: CategoryDAL):
+        cat_id = dal.create_category("Checked")
+        a = dal.create_object("A", cat_id)
+        other = dal.create_category("Other")
+        x = dal.create_object("X", other)
+
+        dal.begin_transaction(buffered=True)
+        pending = dal.create_object("P", cat_id)
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_object("A", cat_id)
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_object("P", cat_id)
+        with pytest.raises(ValueError, match="already exists"):
+            dal.update_object(a, name="P")
+        with pytest.raises(ValueError, match="already exists"):
+            dal.create_category("Other")
+        with pytest.raises(ValueError, match="not in category"):
+            dal.create_morphism("f", a, x, cat_id)
+        with pytest.raises(ValueError, match="not found"):
+            dal.create_object("Q", 999999)
+
+        # Deleting a queued object drops the queued morphisms that use it
+        dal.create_morphism("f", a, pending, cat_id)
+        dal.delete_object(pending)
+        assert dal.get_morphisms_in_category(cat_id) == []
+
+    def test_rollback_discards_buffer(self, dal: CategoryDAL):
+        dal.begin_transaction(buffered=True)
+        cat_id = dal.create_category("Discarded")
+        dal.create_object("A", cat_id)
+        dal.rollback_transaction()
+
+        assert dal.buffer is None
+        assert dal.list_categories() == []
+
+    def test_unbuffered_write_flushes_into_open_transaction(self, dal: CategoryDAL):
+        dal.begin_transaction(buffered=True)
+        src = dal.create_category("Source")
+        tgt = dal.create_category("Target")
+        x = dal.create_object("X", src)
+        y = dal.create_object("Y", tgt)
+
+        # Functors are not buffered; their categories are flushed first, uncommitted
+        functor_id = dal.create_functor("F", src, tgt)
+        assert dal.transaction_active
+        assert dal.add_functor_object_mapping(functor_id, x, y)
+        assert dal.get_objects_in_category(src)[0]["ID"] == dal.resolve_id(x)
+
+        dal.create_object("Z", src)  # buffered again after the flush
+        dal.rollback_transaction()
+
+        assert dal.list_categories() == []
+        assert dal.list_functors() == []
+
+    def _warm_category(self, dal: CategoryDAL):
+        cat_id = dal.create_category("Warm")
+        a, b = dal.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}])
+        (f,) = dal.create_morphisms_bulk(cat_id, [{"name": "f", "source_id": a, "target_id": b}])
+        assert [m["name"] for m in dal.get_hom_set(cat_id, a, b)] == ["f"]
+        return cat_id, a, b, f
+
+    def test_hom_sets_follow_buffered_creates(self, dal: CategoryDAL):
+        cat_id, a, b, f = self._warm_category(dal)
+        dal.begin_transaction(buffered=True)
+        g = dal.create_morphism("g", a, b, cat_id)
+
+        assert [m["name"] for m in dal.get_hom_set(cat_id, a, b)] == ["f", "g"]
+        dal.delete_morphisms([f])
+        assert [m["ID"] for m in dal.get_out_morphisms(cat_id, a)] == [g]
+
+        dal.commit_transaction()
+        assert [m["ID"] for m in dal.get_hom_set(cat_id, a, b)] == [dal.resolve_id(g)]
+
+    def test_rollback_leaves_no_buffered_morphisms_in_hom_sets(self, dal: CategoryDAL):
+        cat_id, a, b, f = self._warm_category(dal)
+        dal.begin_transaction(buffered=True)
+        dal.create_morphism("g", a, b, cat_id)
+        assert len(dal.get_hom_set(cat_id, a, b)) == 2
+        dal.rollback_transaction()
+
+        assert [m["name"] for m in dal.get_hom_set(cat_id, a, b)] == ["f"]
+        assert [m["name"] for m in dal.get_morphisms_in_category(cat_id)] == ["f"]
+
+    def test_compose_with_buffered_morphisms_is_not_memoized(self, dal: CategoryDAL):
+        cat_id, a, b, f = self._warm_category(dal)
+        dal.begin_transaction(buffered=True)
+        id_b = dal.create_morphisms_bulk(cat_id, [{"name": "id_B", "source_id": b, "target_id": b, "is_identity": True}])[0]
+        assert dal.compose(f, id_b) == f
+        assert dal.compose_path([f, id_b, id_b]) == f
+        assert dal.compositions.stats()["size"] == 0
+        dal.delete_morphisms([f])
+        assert dal.compose(f, id_b) is None
+        dal.rollback_transaction()
+
+    def test_overlay_hides_deleted_categories(self, dal: CategoryDAL):
+        c = dal.create_category("C")
+        d = dal.create_category("D")
+        x = dal.create_object("X", c)
+        dal.create_functor("F", c, d)
+        dal.create_functor("G", d, d)
+
+        dal.begin_transaction(buffered=True)
+        dal.update_category(d, name="D2")
+        assert {(f["name"], f["target_category"]) for f in dal.list_functors()} == {("F", "D2"), ("G", "D2")}
+        dal.delete_category(c)
+
+        assert dal.get_objects_in_category(c) == []
+        assert dal.get_object(x) is None
+        assert [f["name"] for f in dal.list_functors()] == ["G"]
+        dal.rollback_transaction()
+
+    def test_failed_commit_keeps_the_buffer(self, temp_db_path):
+        manager = ConnectionManager(temp_db_path)
+        alice, bob = manager.get("alice"), manager.get("bob")
+        cat_id = alice.create_category("Shared")
+
+        alice.begin_transaction(buffered=True)
+        x = alice.create_object("X", cat_id)
+        alice.create_object("Y", cat_id)
+        bob.create_object("X", cat_id)  # committed while alice's X is still queued
+
+        with pytest.raises(ValueError, match="already exists"):
+            alice.commit_transaction()
+        assert alice.buffer is not None and not alice.transaction_active
+        assert [o["name"] for o in bob.get_objects_in_category(cat_id)] == ["X"]
+
+        # Resolve the conflict and retry
+        alice.update_object(x, name="X2")
+        alice.commit_transaction()
+        assert [o["name"] for o in bob.get_objects_in_category(cat_id)] == ["X", "X2", "Y"]
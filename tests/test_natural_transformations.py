@@ -91,3 +91,73 @@ class TestNaturalTransformationsDAL:
 
         msgs = dal.validate_naturality(nt_id)
         assert any("missing F(f) or G(f)" in m for m in msgs)
+
+    def test_naturality_uses_constant_number_of_queries(self, dal: CategoryDAL, monkeypatch):
+        n = 50
+        c = dal.create_category("Chain", "domain")
+        d = dal.create_category("Image", "codomain")
+        xs = dal.create_objects_bulk(c, [{"name": f"X{i}"} for i in range(n)])
+        fxs = dal.create_objects_bulk(d, [{"name": f"FX{i}"} for i in range(n)])
+        gxs = dal.create_objects_bulk(d, [{"name": f"GX{i}"} for i in range(n)])
+        fs = dal.create_morphisms_bulk(c, [
+            {"name": f"f{i}", "source_id": xs[i], "target_id": xs[i + 1]} for i in range(n - 1)
+        ])
+        ffs = dal.create_morphisms_bulk(d, [
+            {"name": f"Ff{i}", "source_id": fxs[i], "target_id": fxs[i + 1]} for i in range(n - 1)
+        ])
+        gfs = dal.create_morphisms_bulk(d, [
+            {"name": f"Gf{i}", "source_id": gxs[i], "target_id": gxs[i + 1]} for i in range(n - 1)
+        ])
+        alphas = dal.create_morphisms_bulk(d, [
+            {"name": f"a{i}", "source_id": fxs[i], "target_id": gxs[i]} for i in range(n)
+        ])
+        F_id = dal.create_functor("F", c, d)
+        G_id = dal.create_functor("G", c, d)
+        dal.add_functor_morphism_mappings_bulk(F_id, list(zip(fs, ffs)))
+        # The last square points G(f) at the wrong codomain object
+        dal.add_functor_morphism_mappings_bulk(G_id, list(zip(fs, gfs[:-1] + [gfs[0]])))
+        nt_id = dal.create_natural_transformation("alpha", F_id, G_id)
+        dal.add_nt_components_bulk(nt_id, list(zip(xs, alphas)))
+
+        calls = []
+        original_execute = dal.conn.execute
+        def counting_execute(*args, **kwargs):
+            calls.append(args[0])
+            return original_execute(*args, **kwargs)
+        monkeypatch.setattr(dal.conn, "execute", counting_execute)
+
+        msgs = dal.validate_naturality(nt_id)
+
+        assert len(calls) == 4
+        assert len(msgs) == n - 1
+        assert sum("is well-typed" in m for m in msgs) == n - 2
+        assert msgs.count(f"Square for f=f{n - 2} not well-typed: check component/mapping sources/targets") == 1
+
+    def test_components_and_structure_are_scoped_to_one_nt(self, dal: CategoryDAL):
+        c = dal.create_category("C3", "domain3")
+        d = dal.create_category("D3", "codomain3")
+        X = dal.create_object("X", c)
+        Y = dal.create_object("Y", c)
+        FX = dal.create_object("FX", d)
+        a = dal.create_morphism("a", FX, FX, d)
+        F_id = dal.create_functor("F3", c, d)
+        alpha = dal.create_natural_transformation("alpha3", F_id, F_id)
+        beta = dal.create_natural_transformation("beta3", F_id, F_id)
+        dal.add_nt_component(alpha, X, a)
+        dal.add_nt_component(beta, X, a)
+        dal.add_nt_component(beta, Y, a)
+
+        assert [c["at_object_id"] for c in dal.get_nt_components(alpha)] == [X]
+        assert all(c["target_object_id"] == FX for c in dal.get_nt_components(beta))
+
+        # A component edge at an object outside the source category is reported
+        stray = dal.create_object("Z", d)
+        dal._execute(
+            """MATCH (nt:Natural_Transformation), (m:Morphism), (x:Object)
+               WHERE nt.ID = $nt_id AND m.ID = $m_id AND x.ID = $x_id
+               CREATE (nt)-[:nat_trans_components]->(cp:Component)
+               CREATE (cp)-[:component_object]->(x), (cp)-[:component_morphism]->(m)""",
+            {"nt_id": alpha, "m_id": a, "x_id": stray}
+        )
+        assert dal.validate_nt_structure(alpha) == [f"Component at object ID {stray} is not in the source category"]
+        assert dal.validate_nt_structure(beta) == []
@@ -0,0 +1,202 @@
+import kuzu
+import pytest
+
+import kuzu_DAL
+from kuzu_DAL import CategoryDAL, get_schema_version, initialize_schema, migrate_schema
+
+
+def _count(dal: CategoryDAL, query: str) -> int:
+    result = dal._execute(query)
+    return int(result.get_next()[0])
+
+
+class CountingConnection:
+    """Connection wrapper that records executed statements."""
+
+    def __init__(self, conn: kuzu.Connection):
+        self.conn = conn
+        self.statements = []
+
+    def execute(self, query, *args):
+        self.statements.append(query)
+        return self.conn.execute(query, *args)
+
+
+class TestSchemaVersioning:
+    """Test the schema version check and migration runner."""
+
+    def test_new_database_is_at_latest_version(self, temp_db_path):
+        dal = CategoryDAL(temp_db_path)
+        latest = kuzu_DAL.SCHEMA_MIGRATIONS[-1][0]
+        assert dal.schema_version == latest
+        assert get_schema_version(dal.conn) == latest
+        assert _count(dal, "MATCH (v:SchemaVersion) RETURN count(v)") == 1
+
+    def test_current_database_is_checked_with_one_query(self, temp_db_path):
+        dal = CategoryDAL(temp_db_path)
+        conn = CountingConnection(dal.conn)
+
+        assert migrate_schema(conn) == dal.schema_version
+        assert len(conn.statements) == 1
+
+    def test_only_pending_migrations_run(self, temp_db_path, monkeypatch):
+        dal = CategoryDAL(temp_db_path)
+        applied = []
+
+        def add_index_table(conn):
+            applied.append(True)
+            conn.execute("CREATE NODE TABLE Marker(ID SERIAL PRIMARY KEY)")
+
+        migrations = kuzu_DAL.SCHEMA_MIGRATIONS + [(dal.schema_version + 1, "Add marker", add_index_table)]
+        monkeypatch.setattr(kuzu_DAL, "SCHEMA_MIGRATIONS", migrations)
+
+        assert migrate_schema(dal.conn) == dal.schema_version + 1
+        assert migrate_schema(dal.conn) == dal.schema_version + 1
+        assert applied == [True]
+        assert _count(dal, "MATCH (v:SchemaVersion) RETURN count(v)") == 1
+
+
+class TestMappingMigration:
+    """Test migration of integer-keyed mapping edges to mapping nodes."""
+
+    @pytest.fixture
+    def legacy_db(self, temp_db_path):
+        """A database in the pre-migration layout, with one dangling component."""
+        db = kuzu.Database(temp_db_path)
+        conn = kuzu.Connection(db)
+        for statement in [
+            "CREATE NODE TABLE Category(ID SERIAL PRIMARY KEY, name STRING, description STRING)",
+            "CREATE NODE TABLE Object(ID SERIAL PRIMARY KEY, name STRING, description STRING)",
+            "CREATE NODE TABLE Morphism(ID SERIAL PRIMARY KEY, name STRING, description STRING, is_identity BOOLEAN)",
+            "CREATE NODE TABLE Functor(ID SERIAL PRIMARY KEY, name STRING, description STRING)",
+            "CREATE NODE TABLE Natural_Transformation(ID SERIAL PRIMARY KEY, name STRING, description STRING)",
+            "CREATE REL TABLE morphism_source(FROM Morphism TO Object)",
+            "CREATE REL TABLE morphism_target(FROM Morphism TO Object)",
+            "CREATE REL TABLE functor_source(FROM Functor TO Category)",
+            "CREATE REL TABLE functor_target(FROM Functor TO Category)",
+            "CREATE REL TABLE category_objects(FROM Category TO Object)",
+            "CREATE REL TABLE category_morphisms(FROM Category TO Morphism)",
+            "CREATE REL TABLE functor_object_map(FROM Object TO Object, via_functor_id INT)",
+            "CREATE REL TABLE functor_morphism_map(FROM Morphism TO Morphism, via_functor_id INT)",
+            "CREATE REL TABLE nat_trans_source(FROM Natural_Transformation TO Functor)",
+            "CREATE REL TABLE nat_trans_target(FROM Natural_Transformation TO Functor)",
+            "CREATE REL TABLE nat_trans_components(FROM Natural_Transformation TO Morphism, at_object_id INT)",
+            """CREATE (c:Category {name: 'C', description: ''}), (d:Category {name: 'D', description: ''}),
+                      (x:Object {name: 'X', description: ''}), (y:Object {name: 'Y', description: ''}),
+                      (fx:Object {name: 'FX', description: ''}), (fy:Object {name: 'FY', description: ''}),
+                      (f:Morphism {name: 'f', description: '', is_identity: false}),
+                      (ff:Morphism {name: 'Ff', description: '', is_identity: false}),
+                      (a:Morphism {name: 'a', description: '', is_identity: false}),
+                      (F:Functor {name: 'F', description: ''}),
+                      (nt:Natural_Transformation {name: 'alpha', description: ''}),
+                      (c)-[:category_objects]->(x), (c)-[:category_objects]->(y),
+                      (d)-[:category_objects]->(fx), (d)-[:category_objects]->(fy),
+                      (c)-[:category_morphisms]->(f), (d)-[:category_morphisms]->(ff), (d)-[:category_morphisms]->(a),
+                      (f)-[:morphism_source]->(x), (f)-[:morphism_target]->(y),
+                      (ff)-[:morphism_source]->(fx), (ff)-[:morphism_target]->(fy),
+                      (a)-[:morphism_source]->(fx), (a)-[:morphism_target]->(fx),
+                      (F)-[:functor_source]->(c), (F)-[:functor_target]->(d),
+                      (nt)-[:nat_trans_source]->(F), (nt)-[:nat_trans_target]->(F),
+                      (x)-[:functor_object_map {via_functor_id: 0}]->(fx),
+                      (y)-[:functor_object_map {via_functor_id: 0}]->(fy),
+                      (f)-[:functor_morphism_map {via_functor_id: 0}]->(ff),
+                      (nt)-[:nat_trans_components {at_object_id: 0}]->(a),
+                      (nt)-[:nat_trans_components {at_object_id: 999}]->(a)""",
+        ]:
+            conn.execute(statement)
+        del conn, db
+        return temp_db_path
+
+    def test_legacy_edges_become_mapping_nodes(self, legacy_db):
+        initialize_schema(legacy_db)
+        dal = CategoryDAL(legacy_db)
+
+        assert {(m["source_object"], m["target_object"]) for m in dal.get_functor_object_mappings(0)} == {
+            ("X", "FX"), ("Y", "FY")
+        }
+        (mm,) = dal.get_functor_morphism_mappings(0)
+        assert (mm["source_morphism"], mm["target_morphism"]) == ("f", "Ff")
+        # The component at the non-existent object 999 is dropped
+        assert [(c["at_object_id"], c["morphism_name"]) for c in dal.get_nt_components(0)] == [(0, "a")]
+
+        tables = set()
+        result = dal._execute("CALL show_tables() RETURN name")
+        while result.has_next():
+            tables.add(result.get_next()[0])
+        assert not {t for t in tables if t.startswith("legacy_") or t.endswith("_map")}
+
+    def test_dal_migrates_unversioned_database_on_open(self, legacy_db):
+        dal = CategoryDAL(legacy_db)
+        assert dal.schema_version == kuzu_DAL.SCHEMA_MIGRATIONS[-1][0]
+        assert len(dal.get_functor_object_mappings(0)) == 2
+        assert len(dal.get_nt_components(0)) == 1
+
+    def test_initialize_schema_is_idempotent_after_migration(self, legacy_db):
+        initialize_schema(legacy_db)
+        initialize_schema(legacy_db)
+        dal = CategoryDAL(legacy_db)
+        assert len(dal.get_functor_object_mappings(0)) == 2
+        assert len(dal.get_nt_components(0)) == 1
+
+
+
+class TestCompositionMigration:
+    """Test migration of integer-keyed composition edges to composition nodes."""
+
+    def test_composition_edges_become_nodes(self, temp_db_path, monkeypatch):
+        monkeypatch.setattr(kuzu_DAL, "SCHEMA_MIGRATIONS", kuzu_DAL.SCHEMA_MIGRATIONS[:1])
+        dal = CategoryDAL(temp_db_path)
+        cat_id = dal.create_category("C")
+        a, b, c = dal.create_objects_bulk(cat_id, [{"name": n} for n in "ABC"])
+        f, g, gf = dal.create_morphisms_bulk(cat_id, [
+            {"name": "f", "source_id": a, "target_id": b},
+            {"name": "g", "source_id": b, "target_id": c},
+            {"name": "gf", "source_id": a, "target_id": c},
+        ])
+        for composite in (gf, 999):  # the second entry names a missing composite
+            dal._execute("MATCH (f:Morphism), (g:Morphism) WHERE f.ID = $f AND g.ID = $g "
+                         "CREATE (f)-[:morphism_composition {composite_id: $h}]->(g)", {"f": f, "g": g, "h": composite})
+        dal.close()
+        monkeypatch.undo()
+
+        dal = CategoryDAL(temp_db_path)
+        assert dal.schema_version == 2
+        assert dal.compose(f, g) == gf
+        assert _count(dal, "MATCH (cp:Composition) RETURN count(cp)") == 1
+        with pytest.raises(RuntimeError):
+            dal._execute("MATCH ()-[r:morphism_composition]->() RETURN count(r)")
+
+class TestMappingReferences:
+    """Test that deletions do not leave mappings pointing at missing entities."""
+
+    def test_delete_object_removes_its_mappings_and_components(self, dal: CategoryDAL):
+        c = dal.create_category("C")
+        d = dal.create_category("D")
+        x, y = dal.create_objects_bulk(c, [{"name": "X"}, {"name": "Y"}])
+        fx, fy = dal.create_objects_bulk(d, [{"name": "FX"}, {"name": "FY"}])
+        (f,) = dal.create_morphisms_bulk(c, [{"name": "f", "source_id": x, "target_id": y}])
+        ff, ax, ay = dal.create_morphisms_bulk(d, [
+            {"name": "Ff", "source_id": fx, "target_id": fy},
+            {"name": "aX", "source_id": fx, "target_id": fx},
+            {"name": "aY", "source_id": fy, "target_id": fy},
+        ])
+        F = dal.create_functor("F", c, d)
+        dal.add_functor_object_mappings_bulk(F, [(x, fx), (y, fy)])
+        dal.add_functor_morphism_mappings_bulk(F, [(f, ff)])
+        nt_id = dal.create_natural_transformation("alpha", F, F)
+        dal.add_nt_components_bulk(nt_id, [(x, ax), (y, ay)])
+
+        dal.delete_object(fy)
+
+        assert [m["source_object"] for m in dal.get_functor_object_mappings(F)] == ["X"]
+        assert dal.get_functor_morphism_mappings(F) == []
+        assert [c["at_object_id"] for c in dal.get_nt_components(nt_id)] == [x]
+        assert _count(dal, "MATCH (mp:Object_Mapping) RETURN count(mp)") == 1
+        assert _count(dal, "MATCH (mp:Morphism_Mapping) RETURN count(mp)") == 0
+        assert _count(dal, "MATCH (cp:Component) RETURN count(cp)") == 1
+
+        dal.delete_category(c)
+
+        assert dal.get_functor_object_mappings(F) == []
+        assert _count(dal, "MATCH (mp:Object_Mapping) RETURN count(mp)") == 0
+        assert _count(dal, "MATCH (cp:Component) RETURN count(cp)") == 0
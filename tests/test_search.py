@@ -0,0 +1,160 @@
+import pytest
+
+from kuzu_DAL import CategoryDAL, ConnectionManager, SearchIndex
+
+
+def names(results):
+    return [r["name"] for r in results]
+
+
+class TestSearchIndex:
+    """Test prefix and word lookups of the in-memory index."""
+
+    @pytest.fixture
+    def index(self):
+        index = SearchIndex()
+        index.load([
+            {"type": "Category", "ID": 0, "name": "Groups", "description": "Groups and homomorphisms", "category_id": None},
+            {"type": "Object", "ID": 0, "name": "Z", "description": "The integers", "category_id": 0},
+            {"type": "Object", "ID": 1, "name": "Z/2", "description": "Cyclic group of order two", "category_id": 0},
+            {"type": "Object", "ID": 2, "name": "Zero", "description": "Trivial group", "category_id": 1},
+            {"type": "Morphism", "ID": 0, "name": "mod2", "description": "Reduction of integers", "category_id": 0},
+        ])
+        return index
+
+    def test_name_prefix_matches_come_first(self, index):
+        assert names(index.search("z")) == ["Z", "Z/2", "Zero"]
+        assert names(index.search("GROUP")) == ["Groups", "Z/2", "Zero"]
+
+    def test_words_match_names_and_descriptions(self, index):
+        assert names(index.search("integ")) == ["mod2", "Z"]
+        assert names(index.search("cyclic gr")) == ["Z/2"]
+        assert index.search("cyclic trivial") == []
+
+    def test_filters_and_limit(self, index):
+        assert names(index.search("z", types=["Morphism"])) == []
+        assert names(index.search("integers", types=["Morphism"])) == ["mod2"]
+        assert names(index.search("z", category_id=0)) == ["Z", "Z/2"]
+        assert names(index.search("group", category_id=1)) == ["Zero"]
+        assert len(index.search("z", limit=2)) == 2
+        with pytest.raises(ValueError, match="Unknown entity types"):
+            index.search("z", types=["Widget"])
+
+    def test_updates_and_removals(self, index):
+        index.update("Object", 0, name="Integers")
+        index.remove("Object", [1])
+        index.put("Functor", 0, "Forget", "Forgetful functor to sets")
+
+        assert names(index.search("z")) == ["Zero"]
+        assert names(index.search("the int")) == ["Integers"]
+        assert names(index.search("forget")) == ["Forget"]
+        assert index.search("cyclic") == []
+        assert len(index) == 5
+
+        assert index.search("cyclic", category_id=0) == []
+        assert names(index.search("the int", category_id=0)) == ["Integers"]
+
+    def test_category_word_lookups_use_the_category_index(self):
+        index = SearchIndex()
+        index.load([{"type": "Object", "ID": i, "name": f"O{i}", "description": "plain", "category_id": 0}
+                    for i in range(5000)])
+        index.put("Object", 5000, "Target", "rare word", category_id=0)
+        index.put("Object", 5001, "Elsewhere", "rare word", category_id=1)
+
+        checked = []
+        words = index._words
+        index._words = type("Counting", (dict,), {
+            "__getitem__": lambda self, key: checked.append(key) or dict.__getitem__(self, key)
+        })(words)
+
+        assert names(index.search("rare pla", category_id=0)) == []
+        assert names(index.search("rare wo", category_id=0)) == ["Target"]
+        assert names(index.search("rar", category_id=1)) == ["Elsewhere"]
+        # Only entities holding the query's words in that category are checked, not all 5000 members
+        assert len(checked) <= 3
+
+
+class TestDALSearch:
+    """Test that DAL writes keep the search index in sync."""
+
+    @pytest.fixture
+    def groups(self, dal: CategoryDAL):
+        cat_id = dal.create_category("Groups", "Groups and homomorphisms")
+        z, z2 = dal.create_objects_bulk(cat_id, [
+            {"name": "Z", "description": "The integers"},
+            {"name": "Z/2", "description": "Cyclic group of order two"},
+        ])
+        dal.create_morphism("mod2", z, z2, cat_id, "Reduction mod two")
+        return {"cat": cat_id, "z": z, "z2": z2}
+
+    def test_index_built_on_first_search(self, dal: CategoryDAL, groups):
+        assert not dal.search_index.built
+        results = dal.search("z")
+        assert [(r["type"], r["name"], r["category_id"]) for r in results] == [
+            ("Object", "Z", groups["cat"]), ("Object", "Z/2", groups["cat"])
+        ]
+        assert dal.search_index.built
+
+    def test_writes_update_the_index(self, dal: CategoryDAL, groups):
+        dal.search("warm up")
+        g = groups
+        other = dal.create_category("Rings")
+        dal.create_object("Zeta", other, "Zeta ring")
+        functor_id = dal.create_functor("Abelianization", g["cat"], g["cat"])
+        dal.create_natural_transformation("unit", functor_id, functor_id, "Unit of the adjunction")
+        dal.update_object(g["z"], name="Integers")
+
+        assert names(dal.search("z")) == ["Z/2", "Zeta"]
+        assert names(dal.search("abel")) == ["Abelianization"]
+        assert names(dal.search("adjunction")) == ["unit"]
+
+        dal.delete_object(g["z2"])
+        assert names(dal.search("z")) == ["Zeta"]
+        assert dal.search("mod2") == []
+
+        dal.delete_category(other)
+        assert dal.search("z") == []
+        assert dal.search("rings") == []
+        assert names(dal.search("integers")) == ["Integers"]
+
+    def test_transaction_writes_are_indexed_on_commit(self, dal: CategoryDAL, groups):
+        dal.search("warm up")
+        dal.begin_transaction()
+        dal.create_object("Zeta", groups["cat"])
+        assert names(dal.search("ze")) == []
+        dal.rollback_transaction()
+        assert names(dal.search("ze")) == []
+
+        dal.begin_transaction()
+        dal.create_object("Zeta", groups["cat"])
+        dal.commit_transaction()
+        assert names(dal.search("ze")) == ["Zeta"]
+
+    def test_buffered_changes_are_merged_into_results(self, dal: CategoryDAL, groups):
+        g = groups
+        rings = dal.create_category("Rings")
+        dal.create_object("Zn", rings, "Integers mod n")
+        dal.begin_transaction(buffered=True)
+        zeta = dal.create_object("Zeta", g["cat"], "Zeta function")
+        dal.update_object(g["z"], name="Integers")
+        dal.delete_object(g["z2"])
+        dal.delete_category(rings)
+
+        assert names(dal.search("z")) == ["Zeta"]
+        assert [r["ID"] for r in dal.search("zeta", category_id=g["cat"])] == [zeta]
+        assert names(dal.search("integers")) == ["Integers"]
+        assert dal.search("mod2") == []  # its source Z/2 is queued for deletion
+        assert names(dal.search("z", limit=1)) == ["Zeta"]
+
+        dal.rollback_transaction()
+        assert names(dal.search("z")) == ["Z", "Z/2", "Zn"]
+
+    def test_sessions_share_one_index(self, temp_db_path):
+        manager = ConnectionManager(temp_db_path)
+        alice, bob = manager.get("alice"), manager.get("bob")
+        assert bob.search("groups") == []
+
+        alice.create_category("Groups")
+
+        assert names(bob.search("gr")) == ["Groups"]
+        assert alice.search_index is bob.search_index
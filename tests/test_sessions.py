@@ -0,0 +1,231 @@
+import threading
+import time
+
+import pytest
+
+from kuzu_DAL import CategoryDAL, ConnectionManager
+
+
+@pytest.fixture
+def manager(temp_db_path):
+    return ConnectionManager(temp_db_path, write_timeout=2.0)
+
+
+class TestConnectionManager:
+    """Test per-session connections over one shared database."""
+
+    def test_sessions_get_their_own_dal(self, manager: ConnectionManager):
+        alice = manager.get("alice")
+        bob = manager.get("bob")
+
+        assert manager.get("alice") is alice
+        assert alice is not bob
+        assert alice.db is bob.db
+        assert alice.conn is not bob.conn
+        assert sorted(manager.session_ids()) == ["alice", "bob"]
+
+    def test_transaction_is_isolated_to_its_session(self, manager: ConnectionManager):
+        alice, bob = manager.get("alice"), manager.get("bob")
+        alice.begin_transaction()
+        alice.create_category("Draft")
+
+        assert not bob.transaction_active
+        assert bob.list_categories() == []
+        assert [c["name"] for c in alice.list_categories()] == ["Draft"]
+
+        alice.rollback_transaction()
+        assert bob.list_categories() == []
+
+    def test_write_waits_for_other_sessions_transaction(self, manager: ConnectionManager):
+        alice, bob = manager.get("alice"), manager.get("bob")
+        alice.begin_transaction()
+        alice.create_category("A")
+
+        def commit_later():
+            time.sleep(0.2)
+            alice.commit_transaction()
+        committer = threading.Thread(target=commit_later)
+        committer.start()
+        bob.create_category("B")
+        committer.join()
+
+        assert {c["name"] for c in bob.list_categories()} == {"A", "B"}
+
+    def test_write_times_out_while_transaction_is_held(self, temp_db_path):
+        manager = ConnectionManager(temp_db_path, write_timeout=0.2)
+        alice, bob = manager.get("alice"), manager.get("bob")
+        alice.begin_transaction()
+        alice.create_category("A")
+
+        with pytest.raises(RuntimeError, match="waiting for another session's transaction"):
+            bob.create_category("B")
+        alice.commit_transaction()
+
+    def test_release_rolls_back_open_transaction(self, manager: ConnectionManager):
+        alice, bob = manager.get("alice"), manager.get("bob")
+        alice.begin_transaction()
+        alice.create_category("Abandoned")
+
+        manager.release_inactive(lambda session_id: session_id != "alice")
+
+        assert manager.session_ids() == ["bob"]
+        with pytest.raises(RuntimeError, match="Connection is closed"):
+            alice.conn.execute("RETURN 1")
+        bob.create_category("B")
+        assert [c["name"] for c in bob.list_categories()] == ["B"]
+
+    def test_committed_writes_invalidate_other_sessions_caches(self, manager: ConnectionManager):
+        alice, bob = manager.get("alice"), manager.get("bob")
+        cat_id = alice.create_category("C")
+        a, b = alice.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}])
+        (f,) = alice.create_morphisms_bulk(cat_id, [{"name": "f", "source_id": a, "target_id": b}])
+        assert [m["ID"] for m in bob.get_hom_set(cat_id, a, b)] == [f]
+        assert bob.compose(f, f) is None
+
+        alice.begin_transaction()
+        g = alice.create_morphism("g", a, b, cat_id)
+        # Uncommitted: bob's snapshot and cache are unchanged
+        assert [m["ID"] for m in bob.get_hom_set(cat_id, a, b)] == [f]
+        alice.commit_transaction()
+
+        assert {m["ID"] for m in bob.get_hom_set(cat_id, a, b)} == {f, g}
+        # Alice's own cache stays warm after her commit
+        assert alice._seen_clock == alice.write_clock.value
+
+    def test_each_write_ticks_the_clock_once(self, manager: ConnectionManager):
+        alice = manager.get("alice")
+        cat_id = alice.create_category("C")
+        a, b = alice.create_objects_bulk(cat_id, [{"name": "A"}, {"name": "B"}])
+        writes = [
+            lambda: alice.create_morphism("f", a, b, cat_id),
+            lambda: alice.create_morphisms_bulk(cat_id, [{"name": "g", "source_id": a, "target_id": b}]),
+            lambda: alice.update_object(a, name="A2"),
+            lambda: alice.delete_morphisms([m["ID"] for m in alice.get_hom_set(cat_id, a, b)]),
+            lambda: alice.delete_objects([b]),
+            lambda: alice.delete_category(cat_id),
+        ]
+        for write in writes:
+            before = alice.write_clock.value
+            write()
+            assert alice.write_clock.value == before + 1
+
+    def test_listings_are_cached_across_sessions_until_a_write(self, manager: ConnectionManager):
+        alice, bob = manager.get("alice"), manager.get("bob")
+        c = alice.create_category("C")
+        d = alice.create_category("D")
+        alice.create_functor("F", c, d)
+        assert alice.read_cache is bob.read_cache
+
+        for dal in (alice, bob, alice):
+            assert [cat["name"] for cat in dal.list_categories()] == ["C", "D"]
+            assert [f["name"] for f in dal.list_functors()] == ["F"]
+            assert dal.list_natural_transformations() == []
+        assert manager.read_cache.stats() == {"hits": 6, "misses": 3, "size": 3}
+
+        # Served from memory: no queries run
+        bob._execute = None
+        assert [cat["name"] for cat in bob.list_categories()] == ["C", "D"]
+        del bob._execute
+
+        # Uncommitted writes are read directly by their session and leave the cache valid for others
+        alice.begin_transaction()
+        alice.update_category(c, name="C2")
+        assert [cat["name"] for cat in alice.list_categories()] == ["C2", "D"]
+        assert [cat["name"] for cat in bob.list_categories()] == ["C", "D"]
+        alice.commit_transaction()
+
+        assert [cat["name"] for cat in bob.list_categories()] == ["C2", "D"]
+        assert bob.list_functors()[0]["source_category"] == "C2"
+
+    def test_standalone_dals_keep_their_own_clock(self, temp_db_path):
+        dal = CategoryDAL(temp_db_path)
+        cat_id = dal.create_category("C")
+        a = dal.create_object("A", cat_id)
+        dal.get_hom_set(cat_id, a, a)
+        dal.create_morphism("id_A", a, a, cat_id)
+
+        assert len(dal.get_hom_set(cat_id, a, a)) == 1
+
+
+class TestFanOut:
+    """Test concurrent reads on the read-connection pool."""
+
+    @pytest.fixture
+    def categories(self, dal: CategoryDAL):
+        ids = []
+        for i in range(6):
+            cat_id = dal.create_category(f"C{i}")
+            objs = dal.create_objects_bulk(cat_id, [{"name": f"O{j}"} for j in range(i + 1)])
+            dal.create_morphisms_bulk(cat_id, [{"name": "f", "source_id": objs[0], "target_id": objs[-1]}])
+            ids.append(cat_id)
+        return ids
+
+    def test_results_match_sequential_calls_in_order(self, dal: CategoryDAL, categories):
+        calls = [(name, cat_id) for cat_id in categories
+                 for name in ("get_objects_in_category", "get_morphisms_in_category")]
+        calls.append(("list_categories",))
+
+        results = dal.fan_out(calls)
+
+        assert results == [getattr(dal, name)(*args) for name, *args in calls]
+        assert [len(objs) for objs in results[0:-1:2]] == [1, 2, 3, 4, 5, 6]
+
+    def test_only_read_methods_are_allowed(self, dal: CategoryDAL):
+        with pytest.raises(ValueError, match="only runs read methods"):
+            dal.fan_out([("list_categories",), ("create_category", "X")])
+        assert dal.list_categories() == []
+
+    def test_transaction_reads_see_uncommitted_writes(self, dal: CategoryDAL, categories):
+        dal.begin_transaction()
+        dal.create_object("Extra", categories[0])
+
+        (objs, cats) = dal.fan_out([("get_objects_in_category", categories[0]), ("list_categories",)])
+
+        assert {o["name"] for o in objs} == {"O0", "Extra"}
+        assert len(cats) == 6
+        dal.rollback_transaction()
+
+    def test_pooled_caches_follow_committed_writes(self, dal: CategoryDAL, categories):
+        cat_id = categories[1]
+        a, b = (o["ID"] for o in dal.get_objects_in_category(cat_id))
+        calls = [("get_hom_set", cat_id, a, b)] * 4
+        assert all(len(hom) == 1 for hom in dal.fan_out(calls))
+
+        dal.create_morphism("g", a, b, cat_id)
+
+        assert all(len(hom) == 2 for hom in dal.fan_out(calls))
+
+    def test_close_releases_reader_connections(self, temp_db_path, monkeypatch):
+        import kuzu_DAL
+        dal = CategoryDAL(temp_db_path, read_pool_size=4)
+        categories = [dal.create_category(f"C{i}") for i in range(4)]
+        migrations = []
+        monkeypatch.setattr(kuzu_DAL, "migrate_schema", lambda conn: migrations.append(conn))
+
+        dal.fan_out([("get_objects_in_category", cat_id) for cat_id in categories])
+        readers = list(dal.read_pool._readers)
+        assert readers and migrations == []  # readers reuse the owner's schema version
+        assert all(reader.schema_version == dal.schema_version for reader in readers)
+
+        dal.close()
+
+        assert dal.read_pool._readers == [] and dal.read_pool._executor is None
+        for conn in [dal.conn] + [reader.conn for reader in readers]:
+            with pytest.raises(RuntimeError, match="Connection is closed"):
+                conn.execute("RETURN 1")
+
+    def test_sessions_share_the_managers_read_pool(self, temp_db_path):
+        manager = ConnectionManager(temp_db_path, read_pool_size=2)
+        sessions = [manager.get(f"s{i}") for i in range(5)]
+        cat_id = sessions[0].create_category("C")
+        calls = [("get_objects_in_category", cat_id)] * 4
+
+        for dal in sessions:
+            assert dal.read_pool is manager.read_pool
+            assert dal.fan_out(calls) == [[]] * 4
+        assert len(manager.read_pool._readers) <= 2  # not one pool per session
+
+        manager.release("s0")
+        assert sessions[1].fan_out(calls) == [[]] * 4  # a session's close leaves the shared pool running
+        manager.close()
+        assert manager.read_pool._readers == []
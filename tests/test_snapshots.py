@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+import codices_cli
+from kuzu_DAL import CategoryDAL, ConnectionManager, restore_snapshot
+
+
+def category_names(dal: CategoryDAL):
+    return sorted(c["name"] for c in dal.list_categories())
+
+
+class TestSnapshots:
+    """Test binary snapshots and restores of the database files."""
+
+    def test_snapshot_and_restore(self, dal: CategoryDAL, tmp_path):
+        cat_id = dal.create_category("Kept")
+        dal.create_object("X", cat_id)
+        dal.snapshot(str(tmp_path / "snap"))
+
+        dal.create_category("Later")
+        assert dal.search("later")
+        dal.restore(str(tmp_path / "snap"))
+
+        assert category_names(dal) == ["Kept"]
+        assert [o["name"] for o in dal.get_objects_in_category(cat_id)] == ["X"]
+        assert dal.search("later") == []
+        dal.create_category("After")
+        assert category_names(dal) == ["After", "Kept"]
+
+    def test_snapshot_is_consistent_with_concurrent_writes(self, temp_db_path, tmp_path):
+        manager = ConnectionManager(temp_db_path)
+        writer, operator = manager.get("writer"), manager.get("operator")
+        writer.create_category("Before")
+        writer.begin_transaction()
+        writer.create_category("Uncommitted")
+
+        def commit_later():
+            time.sleep(0.2)
+            writer.commit_transaction()
+        committer = threading.Thread(target=commit_later)
+        committer.start()
+        # Waits for the open transaction like any write
+        operator.snapshot(str(tmp_path / "snap"))
+        committer.join()
+        writer.create_category("After")
+
+        snapshot = CategoryDAL(str(tmp_path / "snap"))
+        assert category_names(snapshot) == ["Before", "Uncommitted"]
+
+    def test_manager_restore_reopens_sessions(self, temp_db_path, tmp_path):
+        manager = ConnectionManager(temp_db_path)
+        alice = manager.get("alice")
+        alice.create_category("Kept")
+        alice.snapshot(str(tmp_path / "snap"))
+        alice.create_category("Dropped")
+        manager.get("bob").begin_transaction()
+
+        with pytest.raises(ValueError, match="shares its database"):
+            alice.restore(str(tmp_path / "snap"))
+        manager.restore(str(tmp_path / "snap"))
+
+        assert manager.session_ids() == []
+        assert category_names(manager.get("alice")) == ["Kept"]
+        manager.get("bob").create_category("New")
+
+    def test_manager_snapshot_runs_in_process(self, temp_db_path, tmp_path):
+        manager = ConnectionManager(temp_db_path)
+        alice = manager.get("alice")
+        alice.create_category("Live")
+
+        # The running process holds the database lock, so it snapshots through the manager
+        manager.snapshot(str(tmp_path / "snap"))
+        alice.create_category("After")
+
+        assert category_names(CategoryDAL(str(tmp_path / "snap"))) == ["Live"]
+        assert manager.session_ids() == ["alice"]
+
+    def test_invalid_targets(self, dal: CategoryDAL, tmp_path):
+        dal.snapshot(str(tmp_path / "snap"))
+        with pytest.raises(ValueError, match="already exists"):
+            dal.snapshot(str(tmp_path / "snap"))
+        with pytest.raises(ValueError, match="not a database snapshot"):
+            restore_snapshot(str(tmp_path), str(tmp_path / "db"))
+        dal.begin_transaction()
+        with pytest.raises(ValueError, match="inside a transaction"):
+            dal.snapshot(str(tmp_path / "other"))
+        dal.rollback_transaction()
+
+    def test_cli(self, dal: CategoryDAL, temp_db_path, tmp_path):
+        dal.create_category("Kept")
+        del dal
+        snap = str(tmp_path / "snap")
+
+        assert codices_cli.main(["snapshot", snap, "--db", temp_db_path]) == 0
+        assert codices_cli.main(["restore", snap, "--db", str(tmp_path / "copy")]) == 0
+        assert category_names(CategoryDAL(str(tmp_path / "copy"))) == ["Kept"]
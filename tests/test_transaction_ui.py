@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 import streamlit as st
 
 # Mock streamlit functions for testing
@@ -200,3 +200,21 @@ class TestTransactionUIIntegration:
         assert "Created category 'Test'" in changes
         assert "Updated object 'TestObj'" in changes
         assert "Deleted morphism 'f'" in changes
+    
+    def test_statistics_say_buffered_changes_are_not_counted(self, dal):
+        """Test that the statistics panel flags counts that leave out buffered changes."""
+        from visualization import render_visualization_statistics
+        
+        dal.create_category("Committed")
+        with patch('visualization.st') as mock_st:
+            mock_st.columns.return_value = [MagicMock() for _ in range(4)]
+            render_visualization_statistics(dal)
+            mock_st.caption.assert_not_called()
+            
+            dal.begin_transaction(buffered=True)
+            dal.create_category("Queued")
+            render_visualization_statistics(dal)
+        
+        mock_st.metric.assert_any_call("Categories", 1)
+        assert "committed data only" in mock_st.caption.call_args[0][0]
+        dal.rollback_transaction()
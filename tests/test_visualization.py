@@ -51,6 +51,21 @@ class TestVisualization:
         assert metadata['morphism_count'] == 3
         assert metadata['mode'] == 'standard'
     
+    def test_category_edges_use_object_ids(self, dal, setup_test_data):
+        """Test that morphism edges are wired by object ID even when names collide."""
+        test_data = setup_test_data
+        obj1, obj2, obj3 = test_data['objects']
+        # Give B the same name as A; edges must still follow the stored endpoints.
+        # The DAL rejects duplicate names, so write it directly, as legacy data might have it.
+        dal.conn.execute("MATCH (o:Object) WHERE o.ID = $id SET o.name = 'A'", {"id": obj2})
+        
+        viz_data = get_visualization_data(dal, "Category", test_data['category_id'], "standard")
+        endpoints = {e['label']: (e['from'], e['to']) for e in viz_data['edges']}
+        
+        assert endpoints['f'] == (f"obj_{obj1}", f"obj_{obj2}")
+        assert endpoints['g'] == (f"obj_{obj2}", f"obj_{obj3}")
+        assert endpoints['h'] == (f"obj_{obj1}", f"obj_{obj3}")
+    
     def test_category_meta_mode_visualization(self, dal, setup_test_data):
         """Test meta mode visualization showing all entities as nodes."""
         test_data = setup_test_data
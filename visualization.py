@@ -117,48 +117,44 @@ def get_category_visualization_data(dal: CategoryDAL, category_id: int, mode: st
                 })
                 
                 # Add edges from morphism to source/target objects
-                if morph['source_object']:
-                    source_obj_id = next((obj['ID'] for obj in objects if obj['name'] == morph['source_object']), None)
-                    if source_obj_id is not None:
-                        edges.append({
-                            'from': f"morph_{morph['ID']}",
-                            'to': f"obj_{source_obj_id}",
-                            'color': EDGE_STYLES['structural']['color'],
-                            'width': EDGE_STYLES['structural']['width'],
-                            'title': 'source'
-                        })
+                source_obj_id = morph['source_object_id']
+                if source_obj_id is not None:
+                    edges.append({
+                        'from': f"morph_{morph['ID']}",
+                        'to': f"obj_{source_obj_id}",
+                        'color': EDGE_STYLES['structural']['color'],
+                        'width': EDGE_STYLES['structural']['width'],
+                        'title': 'source'
+                    })
                 
-                if morph['target_object']:
-                    target_obj_id = next((obj['ID'] for obj in objects if obj['name'] == morph['target_object']), None)
-                    if target_obj_id is not None:
-                        edges.append({
-                            'from': f"morph_{morph['ID']}",
-                            'to': f"obj_{target_obj_id}",
-                            'color': EDGE_STYLES['structural']['color'],
-                            'width': EDGE_STYLES['structural']['width'],
-                            'title': 'target'
-                        })
+                target_obj_id = morph['target_object_id']
+                if target_obj_id is not None:
+                    edges.append({
+                        'from': f"morph_{morph['ID']}",
+                        'to': f"obj_{target_obj_id}",
+                        'color': EDGE_STYLES['structural']['color'],
+                        'width': EDGE_STYLES['structural']['width'],
+                        'title': 'target'
+                    })
             else:
                 # Add morphism as edge between objects (standard mode)
-                if morph['source_object'] and morph['target_object']:
-                    source_obj_id = next((obj['ID'] for obj in objects if obj['name'] == morph['source_object']), None)
-                    target_obj_id = next((obj['ID'] for obj in objects if obj['name'] == morph['target_object']), None)
-                    
-                    if source_obj_id is not None and target_obj_id is not None:
-                        edge_style = EDGE_STYLES['morphism'].copy()
-                        if morph['is_identity']:
-                            edge_style['color'] = '#2c3e50'
-                            edge_style['width'] = 1
+                source_obj_id = morph['source_object_id']
+                target_obj_id = morph['target_object_id']
+                if source_obj_id is not None and target_obj_id is not None:
+                    edge_style = EDGE_STYLES['morphism'].copy()
+                    if morph['is_identity']:
+                        edge_style['color'] = '#2c3e50'
+                        edge_style['width'] = 1
                         
-                        edges.append({
-                            'from': f"obj_{source_obj_id}",
-                            'to': f"obj_{target_obj_id}",
-                            'label': morph['name'],
-                            'title': f"Morphism: {morph['name']}\n{morph['description']}",
-                            'color': edge_style['color'],
-                            'width': edge_style['width'],
-                            'arrows': edge_style['arrows']
-                        })
+                    edges.append({
+                        'from': f"obj_{source_obj_id}",
+                        'to': f"obj_{target_obj_id}",
+                        'label': morph['name'],
+                        'title': f"Morphism: {morph['name']}\n{morph['description']}",
+                        'color': edge_style['color'],
+                        'width': edge_style['width'],
+                        'arrows': edge_style['arrows']
+                    })
         
         metadata = {
             'category_name': category['name'],
@@ -177,8 +173,17 @@ def get_category_visualization_data(dal: CategoryDAL, category_id: int, mode: st
 def get_functor_visualization_data(dal: CategoryDAL, mode: str) -> Dict[str, Any]:
     """Get visualization data for functors."""
     try:
-        categories = dal.list_categories()
-        functors = dal.list_functors()
+        categories, functors = dal.fan_out([("list_categories",), ("list_functors",)])
+        linked = [f for f in functors if f['source_category_id'] is not None and f['target_category_id'] is not None]
+        
+        # Mapping lists for every functor, fetched concurrently
+        try:
+            maps = dal.fan_out([(name, f['ID']) for f in linked
+                                for name in ("get_functor_object_mappings", "get_functor_morphism_mappings")])
+            object_maps = dict(zip((f['ID'] for f in linked), maps[0::2]))
+            morphism_maps = dict(zip((f['ID'] for f in linked), maps[1::2]))
+        except Exception:
+            object_maps, morphism_maps = {}, {}
         
         nodes: List[Dict[str, Any]] = []
         edges: List[Dict[str, Any]] = []
@@ -195,39 +200,32 @@ def get_functor_visualization_data(dal: CategoryDAL, mode: str) -> Dict[str, Any
             })
         
         # Add functors as edges between categories, with tooltip counts
-        for functor in functors:
-            if functor['source_category'] and functor['target_category']:
-                source_cat_id = next((cat['ID'] for cat in categories if cat['name'] == functor['source_category']), None)
-                target_cat_id = next((cat['ID'] for cat in categories if cat['name'] == functor['target_category']), None)
-                
-                if source_cat_id is not None and target_cat_id is not None:
-                    try:
-                        obj_map_count = len(dal.get_functor_object_mappings(functor['ID']))
-                        morph_map_count = len(dal.get_functor_morphism_mappings(functor['ID']))
-                    except Exception:
-                        obj_map_count = 0
-                        morph_map_count = 0
-                    edges.append({
-                        'from': f"cat_{source_cat_id}",
-                        'to': f"cat_{target_cat_id}",
-                        'label': functor['name'],
-                        'title': f"Functor: {functor['name']}\n{functor['description']}\nObjects mapped: {obj_map_count}\nMorphisms mapped: {morph_map_count}",
-                        'color': EDGE_STYLES['functor']['color'],
-                        'width': EDGE_STYLES['functor']['width'],
-                        'arrows': EDGE_STYLES['functor']['arrows']
-                    })
+        for functor in linked:
+            obj_map_count = len(object_maps.get(functor['ID'], []))
+            morph_map_count = len(morphism_maps.get(functor['ID'], []))
+            edges.append({
+                'from': f"cat_{functor['source_category_id']}",
+                'to': f"cat_{functor['target_category_id']}",
+                'label': functor['name'],
+                'title': f"Functor: {functor['name']}\n{functor['description']}\nObjects mapped: {obj_map_count}\nMorphisms mapped: {morph_map_count}",
+                'color': EDGE_STYLES['functor']['color'],
+                'width': EDGE_STYLES['functor']['width'],
+                'arrows': EDGE_STYLES['functor']['arrows']
+            })
         
         # Functor-detail mode: show object nodes per category and mapping edges
         if mode == 'functor-detail':
-            for functor in functors:
-                src_id = functor.get('source_category_id')
-                tgt_id = functor.get('target_category_id')
-                if src_id is None or tgt_id is None:
-                    continue
-                src_objs = dal.get_objects_in_category(src_id)
-                tgt_objs = dal.get_objects_in_category(tgt_id)
+            category_ids = list(dict.fromkeys(
+                cat_id for f in linked for cat_id in (f['source_category_id'], f['target_category_id'])
+            ))
+            category_objects = dict(zip(category_ids, dal.fan_out(
+                [("get_objects_in_category", cat_id) for cat_id in category_ids]
+            )))
+            for functor in linked:
+                src_id = functor['source_category_id']
+                tgt_id = functor['target_category_id']
                 # Add object nodes with category-specific IDs to avoid collisions
-                for o in src_objs:
+                for o in category_objects[src_id]:
                     nodes.append({
                         'id': f"obj_{src_id}_{o['ID']}",
                         'label': o['name'],
@@ -236,7 +234,7 @@ def get_functor_visualization_data(dal: CategoryDAL, mode: str) -> Dict[str, Any
                         'shape': NODE_STYLES['Object']['shape'],
                         'size': NODE_STYLES['Object']['size']
                     })
-                for o in tgt_objs:
+                for o in category_objects[tgt_id]:
                     nodes.append({
                         'id': f"obj_{tgt_id}_{o['ID']}",
                         'label': o['name'],
@@ -246,20 +244,16 @@ def get_functor_visualization_data(dal: CategoryDAL, mode: str) -> Dict[str, Any
                         'size': NODE_STYLES['Object']['size']
                     })
                 # Mapping edges
-                try:
-                    obj_maps = dal.get_functor_object_mappings(functor['ID'])
-                    for m in obj_maps:
-                        edges.append({
-                            'from': f"obj_{src_id}_{m['source_object_id']}",
-                            'to': f"obj_{tgt_id}_{m['target_object_id']}",
-                            'label': functor['name'],
-                            'title': f"{functor['name']}: {m['source_object']} → {m['target_object']}",
-                            'color': '#95a5a6',
-                            'width': 1,
-                            'arrows': 'to'
-                        })
-                except Exception:
-                    pass
+                for m in object_maps.get(functor['ID'], []):
+                    edges.append({
+                        'from': f"obj_{src_id}_{m['source_object_id']}",
+                        'to': f"obj_{tgt_id}_{m['target_object_id']}",
+                        'label': functor['name'],
+                        'title': f"{functor['name']}: {m['source_object']} → {m['target_object']}",
+                        'color': '#95a5a6',
+                        'width': 1,
+                        'arrows': 'to'
+                    })
         
         metadata = {
             'category_count': len(categories),
@@ -358,16 +352,8 @@ def get_natural_transformation_visualization_data(dal: CategoryDAL, mode: str, o
                             fm = next((m for m in fmaps if m['source_morphism_id'] == int(overlay['morphism_id'])), None)
                             gm = next((m for m in gmaps if m['source_morphism_id'] == int(overlay['morphism_id'])), None)
                             if fm and gm:
-                                # Resolve object IDs in target category by names
-                                tgt_cat = F.get('target_category_id')
-                                objs = dal.get_objects_in_category(tgt_cat)
-                                def find_obj_id(name: str):
-                                    o = next((o for o in objs if o['name'] == name), None)
-                                    return o['ID'] if o else None
-                                F_src_id = find_obj_id(fm['target_from'])
-                                F_tgt_id = find_obj_id(fm['target_to'])
-                                G_src_id = find_obj_id(gm['target_from'])
-                                G_tgt_id = find_obj_id(gm['target_to'])
+                                F_src_id, F_tgt_id = fm['target_from_id'], fm['target_to_id']
+                                G_src_id, G_tgt_id = gm['target_from_id'], gm['target_to_id']
                                 F_src_name, F_tgt_name = fm['target_from'], fm['target_to']
                                 G_src_name, G_tgt_name = gm['target_from'], gm['target_to']
                                 # Ensure nodes exist
@@ -825,25 +811,25 @@ def render_visualization(dal: CategoryDAL, entity_type: str, entity_id: Optional
 def render_visualization_statistics(dal: CategoryDAL) -> None:
     """Render visualization statistics and entity counts."""
     try:
-        categories = dal.list_categories()
-        functors = dal.list_functors()
-        nat_trans = dal.list_natural_transformations()
+        stats = dal.get_statistics()
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Categories", len(categories))
+            st.metric("Categories", stats['categories'])
         
         with col2:
-            total_objects = sum(len(dal.get_objects_in_category(cat['ID'])) for cat in categories)
-            st.metric("Objects", total_objects)
+            st.metric("Objects", stats['objects'])
         
         with col3:
-            total_morphisms = sum(len(dal.get_morphisms_in_category(cat['ID'])) for cat in categories)
-            st.metric("Morphisms", total_morphisms)
+            st.metric("Morphisms", stats['morphisms'])
         
         with col4:
-            st.metric("Functors", len(functors))
+            st.metric("Functors", stats['functors'])
+        
+        if dal.buffer:
+            st.caption(f"Counts show committed data only; {len(dal.buffer)} buffered change(s) "
+                       "are counted once the transaction is committed.")
         
     except Exception as e:
         st.error(f"Failed to load statistics: {e}")